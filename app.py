@@ -9,6 +9,7 @@ import json
 import threading
 import queue
 import os
+import shutil
 from datetime import datetime
 from PIL import Image, ImageTk
 import concurrent.futures
@@ -30,16 +31,31 @@ logging.info("Application starting")
 SETTINGS_FILE = "settings.json"
 
 def save_settings(settings):
-    with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-        json.dump(settings, f, indent=2, ensure_ascii=False)
+    # 임시 파일에 쓴 뒤 교체 (쓰는 도중 종료되어도 기존 파일 유지), 직전 정상본은 .bak으로 보관
+    tmp_path = SETTINGS_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(settings, f, ensure_ascii=False, separators=(",", ":"))
+        f.flush()
+        os.fsync(f.fileno())
+    if os.path.exists(SETTINGS_FILE):
+        shutil.copy2(SETTINGS_FILE, SETTINGS_FILE + ".bak")
+    os.replace(tmp_path, SETTINGS_FILE)
 
 def load_settings():
-    if os.path.exists(SETTINGS_FILE):
-        with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-            try:
+    for path in (SETTINGS_FILE, SETTINGS_FILE + ".bak"):
+        if not os.path.exists(path):
+            continue
+        try:
+            with open(path, "r", encoding="utf-8") as f:
                 return json.load(f)
-            except json.JSONDecodeError:
-                return {}
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            logging.error(f"설정 파일 손상: {path}")
+            if path == SETTINGS_FILE:
+                # 손상된 파일이 다음 저장 때 정상 백업을 덮어쓰지 않도록 옆으로 치워 둔다
+                try:
+                    os.replace(path, path + ".corrupt")
+                except OSError:
+                    pass
     return {}
 
 class LineMonitor:
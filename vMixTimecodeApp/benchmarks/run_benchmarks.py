@@ -0,0 +1,441 @@
+# 사용법 (vMixTimecodeApp 폴더에서):
+#   python -m benchmarks.run_benchmarks                       # 전체 실행, benchmarks/results/에 JSON 저장
+#   python -m benchmarks.run_benchmarks --only gto model      # 일부만 실행
+#   python -m benchmarks.run_benchmarks --compare 이전결과.json  # p50 변화율 함께 출력
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+# python benchmarks/run_benchmarks.py 로 실행해도 src 패키지를 찾을 수 있도록 함
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.controller.gto_logic import GtoValidator, check_single_gto_plan, find_gto_blocks
+from src.model.line_data import LineDataModel
+from src.model.vmix_state import EVENT_ACTIVE_CHANGED, VmixState
+from src.model.vmix_snapshot import parse_vmix_state
+from src.utils.async_bridge import AsyncLoopThread
+from src.utils.logger import app_logger
+from src.utils.metrics import registry
+from benchmarks.stub_vmix_server import StubVmixServer, build_state_xml
+from benchmarks.stub_vmix_tcp_server import StubVmixTcpServer
+
+DEFAULT_RAIL_COUNTS = (30, 300, 1000, 10000)
+DEFAULT_XML_SIZES = ((20, 0), (200, 0), (200, 256))   # (인풋 수, 추가 데이터 KB)
+
+# 합성 런다운에 섞어 넣는 GTO 계획 (정상/오류 모두 포함)
+SAMPLE_PLANS = (
+    (2, 4, 5, 8, 1),
+    (2, 4, 5, 6, 17, 1),
+    (2, 4, 5, 7, 6, 17, 1),
+    (2, 4, 17, 1),
+    (2, 5, 4, 8, 1),        # 시작 오류
+    (2, 4, 5, 5, 8, 1),     # 연속 숫자 오류
+)
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return None
+    k = min(len(sorted_values) - 1, max(0, int(round(q / 100 * (len(sorted_values) - 1)))))
+    return sorted_values[k]
+
+def summarize(name, samples, params=None, ops_per_sample=1):
+    """샘플(초) 목록을 처리량과 p50/p99 지연(ms)으로 요약합니다."""
+    values = sorted(samples)
+    total = sum(values)
+    result = {
+        "name": name,
+        "params": params or {},
+        "samples": len(values),
+        "throughput_per_s": (len(values) * ops_per_sample / total) if total > 0 else None,
+        "mean_ms": total / len(values) * 1000 if values else None,
+        "p50_ms": percentile(values, 50) * 1000 if values else None,
+        "p99_ms": percentile(values, 99) * 1000 if values else None,
+        "max_ms": values[-1] * 1000 if values else None,
+    }
+    return result
+
+def time_calls(func, repeat, args_for=None):
+    samples = []
+    perf = time.perf_counter
+    for n in range(repeat):
+        args = args_for(n) if args_for is not None else ()
+        started = perf()
+        func(*args)
+        samples.append(perf() - started)
+    return samples
+
+def synthetic_rundown(rail_count, seed=0):
+    """계획 블록과 빈 레일(0)이 섞인 B열 값 목록을 만듭니다."""
+    rng = random.Random(seed)
+    values = []
+    while len(values) < rail_count:
+        values.extend([0] * rng.randint(0, 3))
+        values.extend(rng.choice(SAMPLE_PLANS))
+    return values[:rail_count]
+
+def synthetic_lines(rail_count, seed=0):
+    rng = random.Random(seed)
+    lines = []
+    for i, b in enumerate(synthetic_rundown(rail_count, seed)):
+        seconds = i * 5
+        lines.append({
+            "time": f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}",
+            "preview": f"PGM {i + 1}",
+            "button": str(b) if b else "",
+            "comment": "" if rng.random() < 0.7 else f"cue {i + 1}",
+            "input": str(rng.randint(1, 20)),
+        })
+    return lines
+
+def bench_gto(rail_counts, repeat):
+    results = []
+    for rail_count in rail_counts:
+        params = {"rails": rail_count}
+        b_values = synthetic_rundown(rail_count)
+        results.append(summarize("gto.find_gto_blocks", time_calls(lambda: find_gto_blocks(b_values), repeat), params))
+
+        plans = [b_values[b["start"]:b["end"] + 1] for b in find_gto_blocks(b_values)]
+        samples = time_calls(lambda: [check_single_gto_plan(p) for p in plans], repeat)
+        results.append(summarize("gto.check_single_gto_plan", samples, dict(params, plans=len(plans)), len(plans)))
+
+        validator = GtoValidator()
+        results.append(summarize("gto.validator_rebuild", time_calls(lambda: validator.rebuild(b_values), repeat), params))
+
+        # 운용 중 한 칸 수정 (B열 값 하나를 바꿨다가 되돌림)
+        rng = random.Random(1)
+        edits = [(rng.randrange(rail_count), rng.choice((0, 1, 2, 4, 5, 6, 7, 8, 17))) for _ in range(repeat)]
+        def edit(index, value):
+            old = validator.b_values[index]
+            validator.update(index, value)
+            validator.update(index, old)
+        samples = time_calls(edit, repeat, lambda n: edits[n])
+        results.append(summarize("gto.validator_update", samples, params, 2))
+    return results
+
+def bench_model(rail_counts, repeat):
+    results = []
+    for rail_count in rail_counts:
+        params = {"rails": rail_count}
+        lines = synthetic_lines(rail_count)
+        model = LineDataModel(rail_count)
+        results.append(summarize("model.load_lines", time_calls(lambda: model.load_lines(lines), max(1, repeat // 10)), params))
+
+        rng = random.Random(2)
+        count = repeat * 10
+        indices = [rng.randrange(rail_count) for _ in range(count)]
+        results.append(summarize(
+            "model.update_time", time_calls(model.update_line_data, count,
+                                            lambda n: (indices[n], "time", f"00:{n // 60 % 60:02d}:{n % 60:02d}")), params))
+        results.append(summarize(
+            "model.update_button", time_calls(model.update_line_data, count,
+                                              lambda n: (indices[n], "button", str(n % 18))), params))
+        results.append(summarize(
+            "model.get_value", time_calls(model.get_value, count, lambda n: (indices[n], "time")), params))
+        results.append(summarize("model.get_all_b_values", time_calls(model.get_all_b_values, repeat), params))
+        results.append(summarize("model.to_dicts", time_calls(model.to_dicts, max(1, repeat // 10)), params))
+    return results
+
+def bench_parse(xml_sizes, repeat):
+    results = []
+    for input_count, padding_kb in xml_sizes:
+        data = build_state_xml(input_count, padding_kb, position_ms=123456)
+        params = {"inputs": input_count, "xml_kb": round(len(data) / 1024, 1)}
+        results.append(summarize("parse.vmix_state", time_calls(lambda: parse_vmix_state(data), repeat), params))
+    return results
+
+class _HeadlessMaster:
+    """TkBridge가 요구하는 after/after_cancel만 가진 대역 (벤치마크에서는 UI 프레임을 돌리지 않음)."""
+
+    def after(self, ms, callback=None, *args):
+        return None
+
+    def after_cancel(self, after_id):
+        pass
+
+class _HeadlessStatusBar:
+    def refresh(self):
+        pass
+
+class _HeadlessView:
+    """AppController가 사용하는 View 속성만 갖춘 대역입니다."""
+
+    def __init__(self, server, rail_count, profiles_dir):
+        self.master = _HeadlessMaster()
+        self.status_bar = _HeadlessStatusBar()
+        self.main_vmix_name = "Main"
+        self.main_ip = server.host
+        self.settings = {"vmix_http_port": server.port, "vmix_timeout": 2, "profiles_dir": profiles_dir}
+        self.line_data_model = LineDataModel(rail_count)
+        for i in range(rail_count):
+            # 레일마다 다른 인풋을 지정해 디스패처의 중복 제거에 걸리지 않게 함
+            self.line_data_model.update_line_data(i, "input", str(i + 1))
+
+    def get_vmix_servers(self):
+        return [(self.main_vmix_name, self.main_ip)]
+
+    def update_timecode_label(self, text):
+        pass
+
+    def on_hotkey_done(self, binding, ok, elapsed):
+        pass
+
+    def on_vmix_inputs_changed(self, numbers):
+        pass
+
+async def _timed_polls(coro_factory, count):
+    samples = []
+    for _ in range(count):
+        started = time.perf_counter()
+        await coro_factory()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+def bench_network(args, repeat):
+    from src.controller.app_controller import AppController
+
+    results = []
+    server = StubVmixServer(
+        input_count=args.stub_inputs, padding_kb=args.stub_padding_kb,
+        latency_ms=args.stub_latency_ms, jitter_ms=args.stub_jitter_ms, seed=0,
+    ).start()
+    profiles_dir = tempfile.mkdtemp(prefix="vmix_bench_")
+    burst = args.command_burst
+    view = _HeadlessView(server, burst, profiles_dir)
+    controller = AppController(view)
+    params = {
+        "stub_inputs": args.stub_inputs, "stub_padding_kb": args.stub_padding_kb,
+        "stub_latency_ms": args.stub_latency_ms, "stub_jitter_ms": args.stub_jitter_ms,
+    }
+    try:
+        # 폴링 루프 대신 폴링/상태 확인 경로를 직접 호출해 한 번씩의 왕복 시간을 잰다
+        controller.init_network()
+        controller.loop_thread.start()
+        submit = controller.loop_thread.submit
+        submit(controller.timecode_poller.poll_once()).result(10)   # 연결 풀 예열
+
+        samples = submit(_timed_polls(controller.timecode_poller.poll_once, repeat)).result(600)
+        results.append(summarize("network.timecode_poll", samples, params))
+        samples = submit(_timed_polls(controller.get_connection_status, repeat)).result(600)
+        results.append(summarize("network.status_check", samples, params))
+
+        # 블록 하나 분량의 레일을 같은 Tk 콜백에서 실행했을 때 마지막 레일의 인풋이 vMix에 도착할 때까지
+        # (연달아 있는 CutDirect는 마지막 것만 전송됨)
+        dispatcher = controller.command_dispatcher
+        last = ("CutDirect", {"Input": str(burst)})
+        latencies = []
+        burst_times = []
+        for _ in range(max(1, repeat // 10)):
+            before = len(server.functions)
+            started = time.perf_counter()
+            for i in range(burst):
+                controller.fire_line(i)
+            deadline = time.monotonic() + 10
+            while not (len(server.functions) > before and server.functions[-1] == last) and time.monotonic() < deadline:
+                time.sleep(0.0005)
+            burst_times.append(time.perf_counter() - started)
+            time.sleep(0.002)   # 마지막 on_done 기록 대기
+            latencies.append(dispatcher.latencies[-1])
+            time.sleep(dispatcher.frame_interval)   # 다음 버스트가 중복 제거에 걸리지 않도록
+        results.append(summarize("network.command_latency", latencies, dict(params, burst=burst)))
+        results.append(summarize("network.command_burst", burst_times, dict(params, burst=burst), burst))
+
+        # 덮어쓸 수 없는 명령 burst개를 한 번에 넣었을 때: 하나씩 순서대로 전송되는지와 걸리는 시간
+        sequence = [("PreviewInput", {"Input": str(i + 1)}) for i in range(burst)]
+        sequence_times = []
+        for _ in range(max(1, repeat // 10)):
+            before = len(server.functions)
+            started = time.perf_counter()
+            controller.loop_thread.call(
+                lambda: [dispatcher.submit(view.main_ip, function, **args) for function, args in sequence]
+            )
+            deadline = time.monotonic() + 10
+            while len(server.functions) < before + burst and time.monotonic() < deadline:
+                time.sleep(0.0005)
+            sequence_times.append(time.perf_counter() - started)
+            if server.functions[before:] != sequence:
+                app_logger.warning(f"명령 도착 순서가 다릅니다: {server.functions[before:]}")
+            time.sleep(dispatcher.frame_interval)
+        results.append(summarize("network.command_sequence", sequence_times, dict(params, burst=burst), burst))
+    finally:
+        controller.stop_async_tasks()
+        controller.settings_persister.close()
+        server.stop()
+    return results
+
+def _measure_detection(loop_thread, vmix_state, stub, count, timeout=5.0):
+    # stub.cut() 호출 ~ VmixState의 액티브 변경 이벤트까지의 시간
+    seen = threading.Event()
+    target = {}
+    def on_active(server, old, new):
+        if new == target.get("number"):
+            target["at"] = time.perf_counter()
+            seen.set()
+    loop_thread.call(vmix_state.subscribe, EVENT_ACTIVE_CHANGED, on_active)
+    samples = []
+    rng = random.Random(3)
+    for _ in range(count):
+        number = stub.active % stub.input_count + 1
+        seen.clear()
+        target["number"] = number
+        time.sleep(rng.uniform(0, 0.05))   # 폴링 주기와 무관한 시점에 전환
+        started = time.perf_counter()
+        stub.cut(number)
+        if seen.wait(timeout):
+            samples.append(target["at"] - started)
+    loop_thread.call(vmix_state.unsubscribe, EVENT_ACTIVE_CHANGED, on_active)
+    return samples
+
+def bench_active_detection(args, repeat):
+    """액티브 인풋 전환 감지 지연: HTTP 폴링(--poll-hz)과 TCP 이벤트 구독 비교."""
+    from src.controller.timecode_poller import TimecodePoller
+    from src.controller.vmix_client import VmixClient
+    from src.controller.vmix_tcp import VmixTcpSubscriber
+
+    results = []
+    count = max(10, repeat // 5)
+    loop_thread = AsyncLoopThread(name="bench-asyncio")
+    loop_thread.start()
+    try:
+        http_stub = StubVmixServer(input_count=args.stub_inputs, latency_ms=args.stub_latency_ms,
+                                   jitter_ms=args.stub_jitter_ms, seed=0).start()
+        client = VmixClient(port=http_stub.port)
+        state = VmixState()
+        poller = TimecodePoller(client, lambda: ("Main", http_stub.host), state, rate_hz=args.poll_hz)
+        task = loop_thread.submit(poller.run())
+        try:
+            samples = _measure_detection(loop_thread, state, http_stub, count)
+            results.append(summarize("detect.active_http_poll", samples, {"poll_hz": poller.rate_hz}))
+        finally:
+            task.cancel()
+            loop_thread.submit(client.close()).result(5)
+            http_stub.stop()
+
+        tcp_stub = StubVmixTcpServer(input_count=args.stub_inputs).start()
+        state = VmixState()
+        subscriber = VmixTcpSubscriber(lambda: ("Main", tcp_stub.host), state, port=tcp_stub.port)
+        task = loop_thread.submit(subscriber.run())
+        try:
+            deadline = time.monotonic() + 5
+            while state.get("Main") is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            samples = _measure_detection(loop_thread, state, tcp_stub, count)
+            results.append(summarize("detect.active_tcp_event", samples, {"inputs": args.stub_inputs}))
+        finally:
+            task.cancel()
+            tcp_stub.stop()
+    finally:
+        loop_thread.stop()
+    return results
+
+def bench_hotkeys(args, repeat):
+    """전역 단축키 지연: keyboard 스레드 역할의 별도 스레드에서 누름 -> 디스패처 큐 입력 / vMix 응답 수신까지."""
+    from src.controller.app_controller import AppController
+    from src.controller.hotkeys import compile_hotkeys
+
+    results = []
+    server = StubVmixServer(input_count=args.stub_inputs, latency_ms=args.stub_latency_ms,
+                            jitter_ms=args.stub_jitter_ms, seed=0).start()
+    view = _HeadlessView(server, 10, tempfile.mkdtemp(prefix="vmix_bench_"))
+    controller = AppController(view)
+    manager = controller.hotkeys
+    bindings = list(compile_hotkeys({f"ctrl+{i}": {"rail": i} for i in range(1, 10)}).values())
+    params = {"stub_latency_ms": args.stub_latency_ms, "stub_jitter_ms": args.stub_jitter_ms}
+    try:
+        controller.init_network()
+        controller.loop_thread.start()
+        for n in range(max(10, repeat // 2)):
+            expected = len(manager.latencies) + 1
+            presser = threading.Thread(target=manager._on_hotkey, args=(bindings[n % len(bindings)],))
+            presser.start()
+            presser.join()
+            deadline = time.monotonic() + 5
+            while len(manager.latencies) < expected and time.monotonic() < deadline:
+                time.sleep(0.0005)
+            time.sleep(controller.command_dispatcher.frame_interval)   # 같은 레일 반복이 중복 제거에 걸리지 않도록
+        # 누름 -> 큐 입력 구간은 결과 JSON의 metrics(hotkey.press_to_dispatch_ms)에 함께 기록됨
+        results.append(summarize("hotkey.press_to_ack", list(manager.latencies), params))
+    finally:
+        controller.stop_async_tasks()
+        controller.settings_persister.close()
+        server.stop()
+    return results
+
+def print_table(results, previous=None):
+    before = {(r["name"], json.dumps(r["params"], sort_keys=True)): r for r in (previous or [])}
+    for r in results:
+        line = (f"{r['name']:<28} {json.dumps(r['params'], ensure_ascii=False):<70} "
+                f"p50 {r['p50_ms']:9.4f}ms  p99 {r['p99_ms']:9.4f}ms  {r['throughput_per_s'] or 0:12.1f}/s")
+        old = before.get((r["name"], json.dumps(r["params"], sort_keys=True)))
+        if old and old.get("p50_ms"):
+            line += f"  (p50 {(r['p50_ms'] / old['p50_ms'] - 1) * 100:+.1f}%)"
+        print(line)
+
+def main():
+    parser = argparse.ArgumentParser(description="vMix Timecode 앱 핫 패스 벤치마크 (GUI 없이 실행)")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본: benchmarks/results/bench_날짜_시각.json)")
+    parser.add_argument("--compare", default=None, help="이전 결과 JSON과 p50 비교")
+    parser.add_argument("--repeat", type=int, default=200, help="측정 반복 횟수")
+    parser.add_argument("--rails", type=int, nargs="+", default=list(DEFAULT_RAIL_COUNTS), help="합성 런다운 레일 수")
+    parser.add_argument("--only", nargs="+", choices=("gto", "model", "parse", "network", "detect", "hotkey"), default=None)
+    parser.add_argument("--stub-inputs", type=int, default=50, help="스텁 서버 XML의 인풋 수")
+    parser.add_argument("--stub-padding-kb", type=int, default=32, help="스텁 서버 XML의 추가 데이터 크기(KB)")
+    parser.add_argument("--stub-latency-ms", type=float, default=2.0, help="스텁 서버 응답 지연(ms)")
+    parser.add_argument("--stub-jitter-ms", type=float, default=1.0, help="스텁 서버 응답 지연 편차(±ms)")
+    parser.add_argument("--poll-hz", type=float, default=20, help="감지 지연 비교용 HTTP 폴링 속도")
+    parser.add_argument("--command-burst", type=int, default=10, help="한 번에 실행할 레일 수")
+    args = parser.parse_args()
+
+    # 로그 출력이 측정값에 섞이지 않도록 경고 이상만 남김
+    app_logger.setLevel(logging.WARNING)
+    suites = args.only or ["gto", "model", "parse", "network", "detect", "hotkey"]
+    results = []
+    started = time.perf_counter()
+    if "gto" in suites:
+        results += bench_gto(args.rails, args.repeat)
+    if "model" in suites:
+        results += bench_model(args.rails, args.repeat)
+    if "parse" in suites:
+        results += bench_parse(DEFAULT_XML_SIZES, args.repeat)
+    if "network" in suites:
+        results += bench_network(args, args.repeat)
+    if "detect" in suites:
+        results += bench_active_detection(args, args.repeat)
+    if "hotkey" in suites:
+        results += bench_hotkeys(args, args.repeat)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "args": vars(args),
+            "elapsed_s": round(time.perf_counter() - started, 2),
+        },
+        "results": results,
+        # 앱 내부 계측 지표 (폴링 왕복/파싱/명령 지연 등, 진단 창과 같은 값)
+        "metrics": registry.snapshot(),
+    }
+    output = args.output or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "results", f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    previous = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            previous = json.load(f)["results"]
+    print_table(results, previous)
+    print(f"결과 저장: {output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import argparse
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# 실제 vMix 없이 벤치마크를 돌리기 위한 vMix HTTP API 대역 서버
+# - GET /api/            : 상태 XML (인풋 수/추가 데이터 크기로 XML 크기 조절)
+# - GET /api/?Function=… : 명령 수신 기록 후 성공 응답
+# 모든 응답에 latency_ms ± jitter_ms 만큼의 지연을 넣는다
+
+def build_state_xml(input_count=20, padding_kb=0, active=1, preview=2, position_ms=0):
+    """vMix 상태 XML과 같은 순서(inputs -> overlays -> preview -> active -> 나머지)로 만듭니다."""
+    parts = ['<vmix><version>27.0.0.49</version><edition>4K</edition><preset>C:\\bench.vmix</preset><inputs>']
+    for number in range(1, input_count + 1):
+        state = "Running" if number == active else "Paused"
+        position = position_ms if number == active else 0
+        parts.append(
+            f'<input key="00000000-0000-0000-0000-{number:012d}" number="{number}" type="Video" '
+            f'title="Clip {number}.mp4" shortTitle="Clip {number}.mp4" state="{state}" '
+            f'position="{position}" duration="3600000" loop="False">Clip {number}.mp4</input>'
+        )
+    parts.append('</inputs><overlays>')
+    parts.extend(f'<overlay number="{n}" />' for n in range(1, 9))
+    parts.append(f'</overlays><preview>{preview}</preview><active>{active}</active>')
+    parts.append('<fadeToBlack>False</fadeToBlack><transitions>')
+    parts.extend(f'<transition number="{n}" effect="Fade" duration="500" />' for n in range(1, 5))
+    parts.append('</transitions><recording>False</recording><external>False</external>')
+    parts.append('<streaming>False</streaming><playList>False</playList><multiCorder>False</multiCorder>')
+    # 파서가 읽지 않는 뒷부분(오디오 등)으로 XML 크기를 키운다
+    parts.append('<audio>')
+    filler = '<bus name="A" volume="100" muted="False" meterF1="0.1" meterF2="0.1" />'
+    parts.append(filler * (padding_kb * 1024 // len(filler)))
+    parts.append('</audio></vmix>')
+    return "".join(parts).encode("utf-8")
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128   # 명령 버스트로 연결이 몰려도 SYN 재전송(1초)이 생기지 않도록
+
+class StubVmixServer:
+    """별도 스레드에서 동작하는 vMix HTTP API 스텁입니다. port=0이면 빈 포트를 자동으로 고릅니다."""
+
+    def __init__(self, host="127.0.0.1", port=0, input_count=20, padding_kb=0, latency_ms=0.0, jitter_ms=0.0, seed=None):
+        self.input_count = input_count
+        self.padding_kb = padding_kb
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.active = 1
+        self.preview = 2
+        self.functions = []    # 받은 명령 (함수 이름, 인자 dict)
+        self.state_requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._started_at = time.monotonic()
+        self._httpd = _Server((host, port), self._make_handler())
+        self._thread = None
+
+    @property
+    def host(self):
+        return self._httpd.server_address[0]
+
+    @property
+    def port(self):
+        return self._httpd.server_address[1]
+
+    def state_xml(self):
+        position_ms = int((time.monotonic() - self._started_at) * 1000)
+        return build_state_xml(self.input_count, self.padding_kb, self.active, self.preview, position_ms)
+
+    def cut(self, number):
+        self.preview, self.active = self.active, number
+
+    def _delay(self):
+        if self.latency_ms <= 0 and self.jitter_ms <= 0:
+            return
+        with self._lock:
+            jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms)
+        time.sleep(max(0.0, self.latency_ms + jitter) / 1000)
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"   # keep-alive (앱의 연결 풀과 같은 조건)
+            disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 지연 ACK로 40ms씩 늦어지는 것 방지
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path.rstrip("/") != "/api":
+                    self._reply(404, b"Not found")
+                    return
+                query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                server._delay()
+                function = query.pop("Function", None)
+                if function is None:
+                    with server._lock:
+                        server.state_requests += 1
+                    self._reply(200, server.state_xml(), "text/xml")
+                else:
+                    with server._lock:
+                        server.functions.append((function, query))
+                    self._reply(200, b"Function completed successfully.")
+
+            def _reply(self, status, body, content_type="text/plain"):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="stub-vmix-http", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 vMix HTTP API 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8088)
+    parser.add_argument("--inputs", type=int, default=20, help="상태 XML의 인풋 수")
+    parser.add_argument("--padding-kb", type=int, default=0, help="XML 뒷부분에 덧붙일 데이터 크기(KB)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="응답 지연(ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="응답 지연 편차(±ms)")
+    args = parser.parse_args()
+    server = StubVmixServer(args.host, args.port, args.inputs, args.padding_kb, args.latency_ms, args.jitter_ms)
+    print(f"스텁 vMix 서버: http://{server.host}:{server.port}/api/ (XML {len(server.state_xml()) / 1024:.1f}KB)")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+import argparse
+import socketserver
+import threading
+import time
+
+from benchmarks.stub_vmix_server import build_state_xml
+
+# vMix TCP API(8099) 대역 서버
+# - SUBSCRIBE TALLY / SUBSCRIBE ACTS : 구독 후 cut() 때마다 이벤트 전송
+# - XML / TALLY / FUNCTION          : 요청-응답 (FUNCTION CutDirect Input=N 은 실제로 전환)
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+class StubVmixTcpServer:
+    """별도 스레드에서 동작하는 vMix TCP API 스텁입니다. port=0이면 빈 포트를 자동으로 고릅니다."""
+
+    def __init__(self, host="127.0.0.1", port=0, input_count=20, padding_kb=0):
+        self.input_count = input_count
+        self.padding_kb = padding_kb
+        self.active = 1
+        self.preview = 2
+        self.commands = []    # 받은 요청 줄
+        self._clients = {}    # 연결 핸들러 -> 구독 종류 집합
+        self._lock = threading.Lock()
+        self._started_at = time.monotonic()
+        self._server = _Server((host, port), self._make_handler())
+        self._thread = None
+
+    @property
+    def host(self):
+        return self._server.server_address[0]
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    def tally(self):
+        return "".join(
+            "1" if n == self.active else "2" if n == self.preview else "0" for n in range(1, self.input_count + 1)
+        )
+
+    def state_xml(self):
+        position_ms = int((time.monotonic() - self._started_at) * 1000)
+        return build_state_xml(self.input_count, self.padding_kb, self.active, self.preview, position_ms)
+
+    def cut(self, number):
+        """number번 인풋을 프로그램으로 전환하고 구독자에게 TALLY/ACTS 이벤트를 보냅니다."""
+        with self._lock:
+            old = self.active
+            self.preview, self.active = old, number
+            clients = list(self._clients.items())
+        tally = f"TALLY OK {self.tally()}"
+        for handler, topics in clients:
+            lines = []
+            if "TALLY" in topics:
+                lines.append(tally)
+            if "ACTS" in topics:
+                lines += [f"ACTS OK Input {old} 0", f"ACTS OK Input {number} 1", f"ACTS OK InputPreview {old} 1"]
+            if lines:
+                handler.send_lines(lines)
+
+    def disconnect_all(self):
+        """연결 끊김 재현용: 모든 클라이언트 연결을 닫습니다."""
+        with self._lock:
+            handlers = list(self._clients)
+        for handler in handlers:
+            handler.close()
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                self._write_lock = threading.Lock()
+                with server._lock:
+                    server._clients[self] = set()
+
+            def finish(self):
+                with server._lock:
+                    server._clients.pop(self, None)
+                try:
+                    super().finish()
+                except OSError:
+                    pass
+
+            def send_raw(self, data):
+                with self._write_lock:
+                    try:
+                        self.wfile.write(data)
+                    except OSError:
+                        pass
+
+            def send_lines(self, lines):
+                self.send_raw("".join(line + "\r\n" for line in lines).encode("utf-8"))
+
+            def close(self):
+                try:
+                    self.request.shutdown(2)
+                except OSError:
+                    pass
+
+            def handle(self):
+                for raw in self.rfile:
+                    line = raw.decode("utf-8", "replace").strip()
+                    if not line:
+                        continue
+                    with server._lock:
+                        server.commands.append(line)
+                    command, _, rest = line.partition(" ")
+                    command = command.upper()
+                    if command == "SUBSCRIBE":
+                        topic = rest.strip().upper()
+                        with server._lock:
+                            server._clients[self].add(topic)
+                        self.send_lines([f"SUBSCRIBE OK {topic}"])
+                    elif command == "XML":
+                        body = server.state_xml()
+                        self.send_raw(f"XML {len(body)}\r\n".encode("utf-8") + body)
+                    elif command == "TALLY":
+                        self.send_lines([f"TALLY OK {server.tally()}"])
+                    elif command == "FUNCTION":
+                        name, _, query = rest.partition(" ")
+                        params = dict(p.split("=", 1) for p in query.split("&") if "=" in p)
+                        if name == "CutDirect" and params.get("Input", "").isdecimal():
+                            server.cut(int(params["Input"]))
+                        self.send_lines(["FUNCTION OK Completed"])
+                    else:
+                        self.send_lines([f"{command} ER Unknown command"])
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stub-vmix-tcp", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.disconnect_all()
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 vMix TCP API 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--inputs", type=int, default=20, help="인풋 수")
+    parser.add_argument("--cut-every", type=float, default=0.0, help="이 간격(초)마다 다음 인풋으로 자동 전환 (0이면 끔)")
+    args = parser.parse_args()
+    server = StubVmixTcpServer(args.host, args.port, args.inputs).start()
+    print(f"스텁 vMix TCP 서버: {server.host}:{server.port}")
+    try:
+        while True:
+            if args.cut_every > 0:
+                time.sleep(args.cut_every)
+                server.cut(server.active % server.input_count + 1)
+            else:
+                time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+if __name__ == "__main__":
+    main()
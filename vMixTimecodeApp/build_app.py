@@ -1,7 +1,15 @@
 import PyInstaller.__main__
+import argparse
 import os
 import shutil
 
+# 빌드 방식 선택
+# onefile: 단일 exe (배포는 간편하지만 실행할 때마다 임시 폴더에 압축을 풀어 시작이 느림)
+# onedir:  exe + 라이브러리 폴더 (압축 해제 없이 바로 실행되므로 방송 중 재시작이 빠름)
+parser = argparse.ArgumentParser(description="vMixTimecodeApp 실행 파일 빌드")
+parser.add_argument("--onedir", action="store_true", help="빠른 실행용 폴더 형태로 빌드 (UPX 압축 사용 안 함)")
+args = parser.parse_args()
+
 # 프로젝트 루트 디렉토리 (main.py가 있는 곳)
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__)))
 
@@ -29,7 +37,8 @@ print(f"Ensured logs directory exists at: {logs_dir_path}")
 
 # PyInstaller 명령어 인자
 # --noconsole: 콘솔 창을 띄우지 않음 (GUI 앱용)
-# --onefile: 단일 실행 파일 생성
+# --onefile / --onedir: 단일 실행 파일 / 폴더 형태 (--onedir 인자로 선택)
+# --noupx: UPX 압축 해제 시간을 없앰 (onedir 빌드에서 사용)
 # --name: 실행 파일 이름
 # --add-data: 추가 파일/폴더 포함 (source;destination)
 # --clean: 빌드 전 임시 파일 삭제
@@ -38,7 +47,7 @@ print(f"Ensured logs directory exists at: {logs_dir_path}")
 # --specpath: .spec 파일 저장 경로
 pyinstaller_args = [
     '--noconsole',
-    '--onefile',
+    '--onedir' if args.onedir else '--onefile',
     '--name=vMixTimecodeApp',
     f'--add-data={settings_file_path}{os.pathsep}.', # settings.json 포함
     f'--add-data={logs_dir_path}{os.pathsep}logs', # logs 폴더 포함
@@ -50,6 +59,9 @@ pyinstaller_args = [
     os.path.join(project_root, 'main.py') # 메인 스크립트
 ]
 
+if args.onedir:
+    pyinstaller_args.insert(0, '--noupx')
+
 # 아이콘 파일이 있다면 추가 (예: icon.ico)
 # if os.path.exists(os.path.join(project_root, 'assets', 'icon.ico')):
 #     pyinstaller_args.insert(0, f'--icon={os.path.join(project_root, "assets", "icon.ico")}')
@@ -60,7 +72,11 @@ print(f"PyInstaller arguments: {pyinstaller_args}")
 PyInstaller.__main__.run(pyinstaller_args)
 
 print("\n--- PyInstaller 빌드 완료 ---")
-print(f"실행 파일: {os.path.join(dist_path, 'vMixTimecodeApp.exe')}")
+if args.onedir:
+    print(f"실행 파일: {os.path.join(dist_path, 'vMixTimecodeApp', 'vMixTimecodeApp.exe')}")
+    print("dist/vMixTimecodeApp 폴더 전체를 복사해서 사용하세요.")
+else:
+    print(f"실행 파일: {os.path.join(dist_path, 'vMixTimecodeApp.exe')}")
 print("이제 이 실행 파일을 다른 컴퓨터에서 실행할 수 있습니다.")
 
 # 빌드 후 불필요한 파일 정리 (선택 사항)
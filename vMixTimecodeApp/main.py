@@ -1,32 +1,28 @@
-import tkinter as tk
+import time
+_STARTED_AT = time.perf_counter() # 첫 창 표시까지의 시간 측정 기준
+
 import sys
 import os
-import asyncio
 
 # 프로젝트 루트를 sys.path에 추가하여 src 모듈을 찾을 수 있도록 함
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.view.app_view import ActiveTimecodeApp
+from src.utils.startup_profile import StartupProfile
+
+# 임포트 시간 측정은 StartupProfile 생성 이후의 임포트만 기록됨
+startup_profile = StartupProfile(_STARTED_AT)
 
-def run_tk_loop(root, interval=100):
-    """Tkinter 이벤트 루프를 asyncio 이벤트 루프와 통합"""
-    loop = asyncio.get_event_loop()
-    
-    def _run_loop():
-        loop.call_soon(_run_loop)
-        loop.run_until_complete(asyncio.sleep(0)) # 비동기 작업 실행
-        root.after(interval, _run_loop) # Tkinter 이벤트 루프에 다시 등록
+import tkinter as tk
 
-    root.after(interval, _run_loop) # 초기 실행
+from src.view.app_view import ActiveTimecodeApp
 
 if __name__ == "__main__":
+    startup_profile.mark("imports")
     root = tk.Tk()
+    startup_profile.watch_first_window(root)
     app = ActiveTimecodeApp(root)
+    startup_profile.mark("app_init")
 
-    # Tkinter 이벤트 루프를 asyncio 이벤트 루프와 통합
-    run_tk_loop(root)
-
-    # 비동기 작업을 시작 (예: 주기적인 vMix 상태 확인)
-    app.controller.start_async_tasks() # 컨트롤러에 비동기 작업 시작 메서드 추가 예정
-
+    # 비동기 작업(vMix 상태 확인, 타임코드 폴링 등)은 창이 처음 나타난 뒤
+    # 컨트롤러의 전용 루프 스레드에서 시작됨 (ActiveTimecodeApp 참고)
     root.mainloop()
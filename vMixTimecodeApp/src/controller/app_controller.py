@@ -1,105 +1,447 @@
-import tkinter as tk
-from tkinter import filedialog, simpledialog, messagebox
-import requests
-import keyboard
+from tkinter import messagebox
 import asyncio
-import aiohttp # For async HTTP requests
-import xml.etree.ElementTree as ET
+import os
+import time
 
-from src.controller.gto_logic import validate_gto_logic
-from src.model.settings import save_settings
+from src.controller.hotkeys import HotkeyManager
+from src.controller.gto_logic import GtoValidator, validate_gto_logic, validate_gto_edit
+from src.controller.rail_scheduler import RailScheduler, TimecodeClock
+from src.model.line_data import NO_TIME
+from src.model.profile_store import INDEX_SETTING_KEYS, PROFILES_DIR, ProfileStore
+from src.model.settings import SettingsPersister, load_settings
+from src.model.vmix_snapshot import NO_TIMECODE
+from src.model.vmix_state import (
+    VmixState, EVENT_SNAPSHOT, EVENT_TIMECODE_SECOND, EVENT_CONNECTION_LOST, EVENT_CONNECTION_RESTORED,
+    EVENT_INPUTS_CHANGED,
+)
+from src.utils.async_bridge import AsyncLoopThread, TkBridge
+from src.utils.timecode import frames_to_seconds
 from src.utils.logger import app_logger
+from src.utils.metrics import MetricsHttpServer
 
 class AppController:
     def __init__(self, app_view):
         self.app_view = app_view
         self.vmix_status = [0, 0, 0] # vMix 연결 상태 (0: 초기, 1: 오류, 2: 정상)
         self.status_check_task = None # 비동기 작업 참조
+        self._last_status_summary = None
+        self.gto_validator = GtoValidator() # GTO 블록 인덱스와 검사 결과 (수정된 블록만 재검사)
+        self.loop_thread = AsyncLoopThread() # asyncio 전용 스레드
+        self.ui = TkBridge(app_view.master) # 루프 스레드 -> Tk 스레드 UI 작업 전달
+        # 네트워크 모듈(aiohttp)은 첫 화면이 뜬 뒤 start_async_tasks에서 불러옴 (init_network 참고)
+        self.vmix_client = None
+        self.command_dispatcher = None
+        self.timecode_poller = None
+        self.tcp_subscriber = None # vmix_transport가 "tcp"일 때만 사용
+        self.tcp_task = None
+
+        # vMix 서버별 마지막 스냅샷과 변경 이벤트 (View/레일 실행기는 여기에 구독)
+        self.vmix_state = VmixState()
+        self.vmix_state.subscribe(EVENT_TIMECODE_SECOND, self.on_timecode_changed)
+        self.vmix_state.subscribe(EVENT_CONNECTION_LOST, self.on_connection_changed)
+        self.vmix_state.subscribe(EVENT_CONNECTION_RESTORED, self.on_connection_changed)
+        self.vmix_state.subscribe(EVENT_INPUTS_CHANGED, self.on_inputs_changed)
+
+        # 레일 시간을 monotonic 마감 시각으로 바꿔 실행하는 스케줄러 (메인 vMix 타임코드에 동기화)
+        self.timecode_clock = TimecodeClock()
+        self.rail_scheduler = RailScheduler(self.timecode_clock, self.on_rail_due)
+        self.scheduler_task = None
+        self.vmix_state.subscribe(EVENT_SNAPSHOT, self.on_vmix_snapshot)
+
+        # 설정 저장은 작업 스레드에서 모아서 원자적으로 기록 (UI 스레드에서 파일 쓰기 없음)
+        self.settings_persister = SettingsPersister(delay=app_view.settings.get("settings_save_delay", 0.5))
+        # 프로필은 목록(index.json)만 읽어 두고 본문은 활성화할 때 읽음
+        self.profile_store = ProfileStore(app_view.settings.get("profiles_dir", PROFILES_DIR))
+
+        self.timecode_task = None
+        # 전역 단축키: keyboard 스레드에서 바로 디스패처로 전송 (Tk 이벤트 루프를 거치지 않음)
+        self.hotkeys = HotkeyManager(self.on_hotkey)
+        self.metrics_server = None # 선택 사항: 로컬 HTTP로 지표(JSON) 제공 (metrics_http_port 설정)
+
+    def init_network(self):
+        # aiohttp 임포트만 수백 ms가 걸리므로 창을 먼저 띄운 뒤 한 번만 초기화
+        if self.vmix_client is not None:
+            return
+        from src.controller.vmix_client import VMIX_HTTP_PORT, VmixClient
+        from src.controller.timecode_poller import TimecodePoller
+        from src.controller.command_dispatcher import CommandDispatcher
+        # 호스트별 keep-alive 연결 풀 (폴링/명령/상태 확인 공용). 포트는 벤치마크용 스텁 서버 등에서만 바꿈
+        self.vmix_client = VmixClient(port=self.app_view.settings.get("vmix_http_port", VMIX_HTTP_PORT))
+        self.command_dispatcher = CommandDispatcher(self.vmix_client) # 서버별 순서 유지 + 배치 전송
+        self.timecode_poller = TimecodePoller(
+            self.vmix_client,
+            self.get_main_server,
+            self.vmix_state,
+            rate_hz=self.app_view.settings.get("timecode_poll_hz", 20),
+        )
+        if self.app_view.settings.get("vmix_transport", "http") == "tcp":
+            # TCP API 이벤트로 액티브/프리뷰 변경을 즉시 받고, HTTP 폴링은 재생 위치 보정용으로만 사용
+            from src.controller.vmix_tcp import VMIX_TCP_PORT, VmixTcpSubscriber
+            self.tcp_subscriber = VmixTcpSubscriber(
+                self.get_main_server,
+                self.vmix_state,
+                port=self.app_view.settings.get("vmix_tcp_port", VMIX_TCP_PORT),
+                on_connection_changed=self.on_tcp_connection_changed,
+            )
+
+    def on_tcp_connection_changed(self, connected):
+        # 루프 스레드에서 호출됨
+        poll_hz = self.app_view.settings.get("timecode_poll_hz", 20)
+        refresh_hz = self.app_view.settings.get("vmix_tcp_refresh_hz", 2)
+        self.timecode_poller.set_rate(refresh_hz if connected else poll_hz)
+        app_logger.info(f"타임코드 폴링 {self.timecode_poller.rate_hz}Hz ({'TCP 이벤트 사용 중' if connected else 'HTTP 폴링만 사용'}).")
+
+    def get_main_server(self):
+        return self.app_view.main_vmix_name, self.app_view.main_ip
 
     def on_app_mode_change(self, *args):
         mode = self.app_view.app_mode.get()
         app_logger.info(f"동작 모드가 '{mode}'(으)로 변경되었습니다.")
+        self.app_view.apply_mode_to_grid()
         if mode == "GTO-W 감시용":
             self.validate_gto_logic_from_view(self.app_view)
         else:
-            for line in self.app_view.line_entries:
-                line["button"].config(bg="#333333")
+            for i, color in self.gto_validator.clear_colors():
+                self.app_view.set_button_color(i, color)
 
-    def save_all_settings(self):
-        settings = {
+    def collect_profile_settings(self):
+        return {
             "app_mode": self.app_view.app_mode.get(),
             "main_vmix_name": self.app_view.main_vmix_name,
             "main_ip": self.app_view.main_ip,
+            "sub_vmix_name": self.app_view.sub_vmix_name,
+            "sub_ip": self.app_view.sub_ip,
         }
-        save_settings(settings)
+
+    def save_all_settings(self, notify=True):
+        # 화면에서 바꿀 수 없는 항목(폴링 주기 등)은 불러온 값을 그대로 유지
+        settings = dict(self.app_view.settings)
+        settings.update(self.collect_profile_settings())
+        self.app_view.settings = settings
+        self.settings_persister.schedule(settings)
         app_logger.info("설정이 저장되었습니다.")
-        messagebox.showinfo("설정", "설정이 저장되었습니다.")
+        if notify:
+            messagebox.showinfo("설정", "설정이 저장되었습니다.")
+
+    def save_profile(self, name):
+        # 현재 설정과 레일 구성을 프로필로 저장
+        try:
+            self.profile_store.save(name, self.collect_profile_settings(), self.app_view.line_data_model.to_dicts())
+        except (OSError, TypeError, ValueError) as e:
+            self.app_view.push_error(f"프로필 '{name}' 저장 실패: {e}")
+            return False
+        self.app_view.settings["active_profile"] = name
+        self.save_all_settings(notify=False)
+        app_logger.info(f"프로필 '{name}'을(를) 저장했습니다.")
+        return True
+
+    def activate_profile(self, name):
+        try:
+            body = self.profile_store.load(name)
+        except (OSError, ValueError, KeyError) as e:
+            self.app_view.push_error(f"프로필 '{name}'을(를) 불러올 수 없습니다: {e}")
+            return False
+        # 이전 프로필 기준으로 예약된 레일은 모두 취소
+        self.loop_thread.call(self.rail_scheduler.disarm_all)
+        settings = {key: value for key, value in body.get("settings", {}).items() if key in INDEX_SETTING_KEYS}
+        self.app_view.apply_profile(settings, body.get("lines", []))
+        self.app_view.settings["active_profile"] = name
+        self.save_all_settings(notify=False)
+        app_logger.info(f"프로필 '{name}'(으)로 전환했습니다.")
+        return True
 
     def validate_gto_logic_from_view(self, app_instance):
-        validate_gto_logic(app_instance, app_instance.line_data_model, app_instance.app_mode.get())
+        validate_gto_logic(app_instance, app_instance.line_data_model, app_instance.app_mode.get(), self.gto_validator)
+
+    def on_button_edited(self, index, value):
+        # B열 한 칸이 수정되면 모델에 반영하고, 값이 바뀐 경우에만 해당 블록을 다시 검사
+        model = self.app_view.line_data_model
+        if not model.update_line_data(index, "button", value):
+            return
+        if len(self.gto_validator.b_values) != model.rail_count:
+            self.validate_gto_logic_from_view(self.app_view)
+            return
+        # 문자열을 다시 해석하지 않고 모델이 저장한 값(숫자 검사, MAX_BUTTON 제한 적용)을 그대로 사용
+        b_value = model.buttons[index]
+        validate_gto_edit(self.app_view, self.gto_validator, index, b_value, self.app_view.app_mode.get())
 
     def open_settings_window(self):
         app_logger.info("설정 창을 엽니다.")
         messagebox.showinfo("설정", "설정 창을 엽니다. (구현 예정)")
 
-    def reload_all_hotkeys(self):
-        app_logger.info("단축키를 다시 등록합니다.")
-        messagebox.showinfo("단축키", "단축키를 다시 등록합니다. (구현 예정)")
+    def reload_all_hotkeys(self, notify=True):
+        # settings.json을 직접 고친 경우도 반영되도록 파일의 단축키 표를 다시 읽음
+        hotkeys = load_settings().get("hotkeys", self.app_view.settings.get("hotkeys", {}))
+        self.app_view.settings["hotkeys"] = hotkeys
+        count = self.hotkeys.reload(hotkeys)
+        if notify:
+            messagebox.showinfo("단축키", f"단축키 {count}개를 등록했습니다.")
 
-    async def get_connection_status(self):
-        # vMix 연결 상태를 비동기적으로 확인
-        vmix_ip = self.app_view.main_ip
+    def on_hotkey(self, binding, pressed_at):
+        # keyboard 스레드에서 호출됨. 레일 단축키는 누른 시점의 레일 인풋으로 명령을 만든다
+        if binding.rail is not None:
+            model = self.app_view.line_data_model
+            line = model.get_line_data(binding.rail) if binding.rail < model.rail_count else None
+            command = self.build_rail_command(line) if line is not None else None
+            if command is None:
+                app_logger.warning(f"단축키 '{binding.hotkey}': {binding.rail+1}번 레일에 보낼 명령이 없습니다.")
+                return
+            function, params = command
+        else:
+            function, params = binding.function, binding.params
+        if self.command_dispatcher is None:
+            app_logger.warning(f"단축키 '{binding.hotkey}': vMix 연결 준비 전이라 실행하지 않습니다.")
+            return
+        self.loop_thread.call(self._submit_hotkey, binding, self.app_view.main_ip, function, params, pressed_at)
+
+    def _submit_hotkey(self, binding, target, function, params, pressed_at):
+        # 루프 스레드: 디스패처 큐에 바로 넣고, 응답을 받으면 UI 반영만 Tk 스레드로 넘긴다
+        self.hotkeys.dispatch_ms.observe((time.perf_counter() - pressed_at) * 1000)
+
+        def on_done(command, ok, latency):
+            elapsed = time.perf_counter() - pressed_at
+            self.hotkeys.latencies.append(elapsed)
+            self.hotkeys.ack_ms.observe(elapsed * 1000)
+            self.ui.post(self.app_view.on_hotkey_done, binding, ok, elapsed)
+
+        if not self.command_dispatcher.submit(target, function, on_done=on_done, **params):
+            self.ui.post(self.app_view.on_hotkey_done, binding, False, time.perf_counter() - pressed_at)
+
+    async def check_server(self, vmix_name, vmix_ip, timeout):
+        # 서버 하나의 연결 상태 확인 (서버별 타임아웃 적용)
+        import aiohttp # init_network 이후에만 호출되므로 이미 로드되어 있음
+        from src.controller.vmix_client import VmixApiError
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"http://{vmix_ip}:8088/api/?Function=GetActiveInput", timeout=2) as response:
-                    if response.status == 200:
-                        xml_content = await response.text()
-                        root = ET.fromstring(xml_content)
-                        # 실제 vMix 응답에 따라 파싱 로직 변경 필요
-                        # 여기서는 단순히 연결 성공 여부만 확인
-                        return True
-                    else:
-                        app_logger.warning(f"vMix API 응답 오류: {response.status}")
-                        return False
+            # 필요한 필드만 스트리밍 파싱 (전체 Element 트리를 만들지 않음)
+            snapshot = await asyncio.wait_for(self.vmix_client.fetch_snapshot(vmix_ip, timeout=timeout), timeout)
+            self.vmix_state.update(vmix_name, snapshot)
+            return True
+        except VmixApiError as e:
+            app_logger.warning(f"[{vmix_name}] {e}")
+            error = e
         except aiohttp.ClientError as e:
-            app_logger.error(f"vMix 연결 오류: {e}")
+            app_logger.error(f"[{vmix_name}] vMix 연결 오류: {e}")
+            error = e
+        except asyncio.TimeoutError as e:
+            app_logger.warning(f"[{vmix_name}] vMix 연결 시간 초과.")
+            error = e
+        except Exception as e:
+            app_logger.error(f"[{vmix_name}] 알 수 없는 vMix 연결 오류: {e}")
+            error = e
+        self.vmix_state.mark_disconnected(vmix_name, str(error))
+        return False
+
+    async def get_connection_status(self):
+        # 설정된 모든 vMix 서버를 동시에 확인. 느린 서버가 다른 서버의 결과를 늦추지 않도록
+        # 각 서버의 결과는 끝나는 즉시 VmixState에 반영된다
+        servers = self.app_view.get_vmix_servers()
+        timeout = self.app_view.settings.get("vmix_timeout", 2)
+        results = await asyncio.gather(*(self.check_server(name, ip, timeout) for name, ip in servers))
+        return {name: ok for (name, _), ok in zip(servers, results)}
+
+    async def send_vmix_function(self, function, ip=None, **params):
+        # vMix로 Function 명령 전송 (연결 풀 재사용)
+        import aiohttp
+        vmix_ip = ip or self.app_view.main_ip
+        try:
+            return await self.vmix_client.send_function(vmix_ip, function, **params)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            app_logger.error(f"vMix Function '{function}' 전송 오류: {e}")
+            return False
+
+    def build_rail_command(self, line):
+        # 레일의 인풋 번호로 보낼 vMix Function을 만든다 (인풋이 비어 있으면 보낼 명령 없음)
+        vmix_input = str(line.get("input", "")).strip()
+        if not vmix_input:
+            return None
+        return "CutDirect", {"Input": vmix_input}
+
+    def fire_line(self, index):
+        # 레일 명령을 디스패처 큐에 넣는다. 같은 Tk 콜백에서 넣은 명령들은 한 배치로 전송됨
+        line = self.app_view.line_data_model.get_line_data(index)
+        command = self.build_rail_command(line) if line is not None else None
+        if command is None:
+            app_logger.debug(f"{index+1}번 레일: 전송할 vMix 명령이 없습니다.")
             return False
-        except asyncio.TimeoutError:
-            app_logger.warning("vMix 연결 시간 초과.")
+        function, params = command
+        if self.command_dispatcher is None:
+            app_logger.warning(f"{index+1}번 레일: vMix 연결 준비 전이라 실행하지 않습니다.")
             return False
-        except Exception as e:
-            app_logger.error(f"알 수 없는 vMix 연결 오류: {e}")
+        # 디스패처 큐는 루프 스레드 전용. Tk 스레드에서 같은 콜백 안에 넣은 명령들도 한 배치로 묶인다
+        self.loop_thread.call(
+            lambda: self.command_dispatcher.submit(self.app_view.main_ip, function, **params)
+        )
+        return True
+
+    def schedule_line(self, index):
+        # 레일 시간이 지정되어 있으면 스케줄러에 등록, 00:00:00(미지정)이면 즉시 실행
+        model = self.app_view.line_data_model
+        if not 0 <= index < model.rail_count:
+            return False
+        frames = model.get_time_frames(index)
+        if frames == NO_TIME:
+            # 시간 형식이 아니거나 비어 있는 레일은 즉시 실행하지 않는다 (방송 중 의도치 않은 전환 방지)
+            self.app_view.push_error(f"{index+1}번 레일: 시간 값이 올바르지 않아 실행하지 않습니다 ({model.get_value(index, 'time')!r}).")
             return False
+        if frames == 0:
+            return self.fire_line(index)
+        rail_seconds = frames_to_seconds(frames, model.fps, model.drop_frame)
+        self.loop_thread.call(self.rail_scheduler.arm, index, rail_seconds)
+        return False
+
+    def unschedule_line(self, index):
+        self.loop_thread.call(self.rail_scheduler.disarm, index)
+
+    def on_rail_due(self, index):
+        self.app_view.line_monitors[index].executed = self.fire_line(index)
+
+    def on_vmix_snapshot(self, server, old, new):
+        if server != self.app_view.main_vmix_name:
+            return
+        self.timecode_clock.sync(new)
+        self.rail_scheduler.on_clock_changed()
+
+    def on_timecode_changed(self, server, old, new):
+        # 표시 값이 바뀐 경우에만 호출되므로 Tk 이벤트 큐에 쌓이는 작업은 초당 1회 수준
+        if server != self.app_view.main_vmix_name:
+            return
+        self.ui.post(self.app_view.update_timecode_label, new, key="timecode_label")
+
+    def on_inputs_changed(self, server, old, new):
+        if server != self.app_view.main_vmix_name:
+            return
+        self.ui.post(self.app_view.on_vmix_inputs_changed, new)
+
+    def can_snapshot_inputs(self):
+        # vMix가 스냅샷을 저장할 폴더(공유 폴더)가 설정된 경우에만 인풋 스냅샷 사용
+        return bool(self.app_view.settings.get("preview_snapshot_dir"))
+
+    def load_preview(self, source, timeout=3.0):
+        """프리뷰 작업 스레드에서 호출됩니다. ("vmix", ip, 인풋)은 vMix SnapshotInput으로 저장한 파일을 읽습니다."""
+        from src.view.preview_cache import load_preview_source
+        if not isinstance(source, tuple):
+            return load_preview_source(source)
+        _, ip, number = source
+        if self.vmix_client is None or not self.loop_thread.running:
+            raise RuntimeError("vMix 연결 준비 전입니다.")
+        # preview_snapshot_dir: vMix PC 기준 경로, preview_snapshot_local_dir: 같은 폴더의 이 PC 기준 경로
+        remote_dir = self.app_view.settings["preview_snapshot_dir"]
+        local_dir = self.app_view.settings.get("preview_snapshot_local_dir", remote_dir)
+        filename = f"rail_preview_{number}.jpg"
+        local_path = os.path.join(local_dir, filename)
+        before = os.path.getmtime(local_path) if os.path.exists(local_path) else None
+        remote_path = remote_dir.rstrip("\\/") + "\\" + filename
+        future = self.loop_thread.submit(self.vmix_client.send_function(ip, "SnapshotInput", Input=number, Value=remote_path))
+        if not future.result(timeout):
+            raise RuntimeError(f"{number}번 인풋 스냅샷 요청 실패")
+        # vMix는 응답 후 파일을 쓰므로 수정 시각이 바뀔 때까지 기다림
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if os.path.exists(local_path) and os.path.getmtime(local_path) != before:
+                break
+            time.sleep(0.02)
+        else:
+            raise TimeoutError(f"{number}번 인풋 스냅샷 파일이 만들어지지 않았습니다: {local_path}")
+        with open(local_path, "rb") as f:
+            return f.read()
+
+    def on_connection_changed(self, server, old, new):
+        connected = self.vmix_state.is_connected(server)
+        names = [name for name, _ in self.app_view.get_vmix_servers()]
+        if server in names:
+            idx = names.index(server)
+            if idx >= len(self.vmix_status):
+                self.vmix_status.extend([0] * (idx + 1 - len(self.vmix_status)))
+            self.vmix_status[idx] = 2 if connected else 1
+        if not connected:
+            # 연결이 끊기면 마지막 타임코드를 지우고, 메인이면 레일 시계 동기화를 멈춤
+            self.on_timecode_changed(server, None, NO_TIMECODE)
+            if server == self.app_view.main_vmix_name:
+                self.timecode_clock.reset()
+        # UI 업데이트 (Tk 스레드에서 다음 프레임에 한 번만 실행)
+        self.ui.post(self.app_view.status_bar.refresh, key="status_bar")
 
     async def status_check_worker(self):
         while True:
             # vMix 연결 상태 확인
-            vmix_connected = await self.get_connection_status()
-            if vmix_connected:
-                self.vmix_status[0] = 2 # vMix 연결 정상
-                app_logger.info("vMix 연결 상태: 정상")
+            # vmix_status와 상태 표시는 VmixState의 연결 이벤트에서 갱신됨
+            results = await self.get_connection_status()
+            summary = ", ".join(f"{name}={'정상' if ok else '오류'}" for name, ok in results.items())
+            # 상태가 바뀔 때만 INFO로 남기고, 그대로면 DEBUG (연결 변화 자체는 VmixState 이벤트에서도 처리)
+            if summary != self._last_status_summary:
+                self._last_status_summary = summary
+                if all(results.values()):
+                    app_logger.info(f"vMix 연결 상태: {summary}")
+                else:
+                    app_logger.warning(f"vMix 연결 상태: {summary}")
             else:
-                self.vmix_status[0] = 1 # vMix 연결 오류
-                app_logger.warning("vMix 연결 상태: 오류")
-
-            # UI 업데이트 (메인 스레드에서 실행되도록 Tkinter의 after 사용)
-            self.app_view.master.after(0, lambda: self.app_view.status_bar.update_status()) # status_bar는 app_view에 있다고 가정
+                app_logger.debug(f"vMix 연결 상태: {summary}")
 
             await asyncio.sleep(5) # 5초마다 상태 확인
 
     def start_async_tasks(self):
-        # 비동기 작업 시작
+        # 비동기 작업은 전용 루프 스레드에서 실행하고, UI 반영은 TkBridge가 프레임마다 모아서 처리
+        self.init_network()
+        if not self.hotkeys.table:
+            self.reload_all_hotkeys(notify=False) # 단축키는 디스패처가 준비된 뒤 등록
+        if not self.loop_thread.running:
+            self.loop_thread.start()
+            app_logger.info("비동기 루프 스레드 시작.")
+        self.ui.start()
+        self.start_metrics_server()
+        self.loop_thread.submit(self._start_tasks())
+
+    def start_metrics_server(self):
+        # metrics_http_port가 설정된 경우에만 127.0.0.1에서 /metrics 제공 (기본 꺼짐)
+        port = self.app_view.settings.get("metrics_http_port")
+        if not port or self.metrics_server is not None:
+            return
+        try:
+            self.metrics_server = MetricsHttpServer(port=int(port)).start()
+            app_logger.info(f"지표 HTTP 엔드포인트: http://127.0.0.1:{port}/metrics")
+        except (OSError, ValueError) as e:
+            app_logger.warning(f"지표 HTTP 엔드포인트를 열 수 없습니다: {e}")
+
+    async def _start_tasks(self):
+        loop = asyncio.get_running_loop()
         if self.status_check_task is None or self.status_check_task.done():
-            self.status_check_task = asyncio.create_task(self.status_check_worker())
+            self.status_check_task = loop.create_task(self.status_check_worker())
             app_logger.info("비동기 상태 확인 작업 시작.")
+        if self.timecode_task is None or self.timecode_task.done():
+            self.timecode_task = loop.create_task(self.timecode_poller.run())
+            app_logger.info(f"타임코드 폴링 시작 ({self.timecode_poller.rate_hz}Hz).")
+        if self.scheduler_task is None or self.scheduler_task.done():
+            self.scheduler_task = loop.create_task(self.rail_scheduler.run())
+        if self.tcp_subscriber is not None and (self.tcp_task is None or self.tcp_task.done()):
+            self.tcp_task = loop.create_task(self.tcp_subscriber.run())
+            app_logger.info(f"vMix TCP 이벤트 구독 시작 (포트 {self.tcp_subscriber.port}).")
+
+    def stop_async_tasks(self, timeout=3.0):
+        # 비동기 작업 중지: 루프 스레드에서 모든 작업을 취소하고 끝날 때까지 기다린 뒤 스레드 종료
+        self.ui.stop()
+        self.hotkeys.clear()
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+            self.metrics_server = None
+        if not self.loop_thread.running:
+            return
+        app_logger.info("비동기 상태 확인 작업 중지 요청.")
+        try:
+            self.loop_thread.submit(self._close_tasks()).result(timeout)
+        except Exception as e:
+            app_logger.warning(f"비동기 작업 정리 중 오류: {e}")
+        self.loop_thread.stop(timeout)
 
-    def stop_async_tasks(self):
-        # 비동기 작업 중지
-        if self.status_check_task and not self.status_check_task.done():
-            self.status_check_task.cancel()
-            app_logger.info("비동기 상태 확인 작업 중지 요청.")
-            # 작업이 실제로 취소될 때까지 기다릴 수 있음 (선택 사항)
-            # try:
-            #     await self.status_check_task
-            # except asyncio.CancelledError:
-            #     app_logger.info("비동기 상태 확인 작업이 취소되었습니다.")
+    async def _close_tasks(self):
+        tasks = [t for t in (self.status_check_task, self.timecode_task, self.scheduler_task, self.tcp_task) if t is not None]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        app_logger.info("비동기 작업이 모두 취소되었습니다.")
+        if self.command_dispatcher is not None:
+            await self.command_dispatcher.close()
+            await self.vmix_client.close()
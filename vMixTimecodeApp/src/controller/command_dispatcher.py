@@ -0,0 +1,148 @@
+import asyncio
+import time
+from collections import deque
+
+import aiohttp
+
+from src.utils.logger import app_logger
+from src.utils.metrics import registry
+
+# 앞선 명령의 결과를 완전히 덮어쓰는 Function (CutDirect는 지정한 인풋을 바로 프로그램으로 보냄).
+# Cut/Fade처럼 프리뷰와 프로그램을 맞바꾸는 명령은 순서와 횟수 모두 의미가 있으므로 넣지 않는다
+SUPERSEDING_FUNCTIONS = frozenset({"CutDirect"})
+
+class VmixCommand:
+    __slots__ = ("target", "function", "params", "enqueued_at", "on_done")
+
+    def __init__(self, target, function, params, on_done=None):
+        self.target = target
+        self.function = function
+        self.params = params
+        self.enqueued_at = time.perf_counter()
+        self.on_done = on_done
+
+    @property
+    def key(self):
+        return (self.function, tuple(sorted(self.params.items())))
+
+    def __repr__(self):
+        args = " ".join(f"{k}={v}" for k, v in self.params.items())
+        return f"{self.function} {args}".strip()
+
+class CommandDispatcher:
+    """vMix Function 명령을 서버별 큐에 모아 배치 단위로 전송합니다.
+
+    - 서버(IP)마다 큐와 워커가 하나씩 있고, 명령은 큐에 들어온 순서대로 하나씩 (keep-alive 연결 하나로)
+      보내므로 서버별 명령 순서가 vMix에 그대로 도착합니다.
+    - 한 프레임 안에 쌓인 명령은 하나의 배치로 묶고, 연달아 들어온 CutDirect는 마지막 것만 보냅니다.
+      (블록 하나의 레일 10개를 실행해도 한 번의 왕복으로 끝나고, 최종 인풋은 항상 마지막 레일)
+    - 같은 프레임 안에 들어온 동일 명령(함수와 인자가 같음)은 한 번만 보냅니다.
+    """
+
+    def __init__(self, vmix_client, maxsize=256, frame_interval=1 / 30):
+        self.vmix_client = vmix_client
+        self.maxsize = maxsize
+        self.frame_interval = frame_interval
+        self.latencies = deque(maxlen=512)   # 최근 명령별 지연 시간 (초)
+        self._queues = {}
+        self._workers = {}
+        self._recent = {}   # 서버 -> {명령 키: 마지막으로 받아들인 시각}
+
+    def submit(self, target, function, on_done=None, **params):
+        """명령을 큐에 넣습니다. 큐가 가득 차면 False를 반환합니다."""
+        queue = self._queues.get(target)
+        if queue is None:
+            queue = self._queues[target] = asyncio.Queue(maxsize=self.maxsize)
+            self._workers[target] = asyncio.get_event_loop().create_task(self._worker(target, queue))
+        params = {k: str(v) for k, v in params.items() if v is not None}
+        try:
+            queue.put_nowait(VmixCommand(target, function, params, on_done))
+            return True
+        except asyncio.QueueFull:
+            registry.counter("vmix.commands_dropped", {"server": target}).inc()
+            app_logger.warning(f"[{target}] vMix 명령 큐가 가득 차 '{function}' 명령을 버립니다.")
+            return False
+
+    def _dedupe(self, target, batch):
+        # 같은 프레임(frame_interval) 안에 먼저 들어온 동일 명령이 있으면 뒤의 것은 버린다
+        recent = self._recent.setdefault(target, {})
+        if len(recent) > 1024:
+            newest = batch[0].enqueued_at
+            for key in [k for k, t in recent.items() if newest - t >= self.frame_interval]:
+                del recent[key]
+        result = []
+        for command in batch:
+            key = command.key
+            accepted_at = recent.get(key)
+            if accepted_at is not None and command.enqueued_at - accepted_at < self.frame_interval:
+                app_logger.debug(f"[{command.target}] 중복 명령 생략: {command}")
+                continue
+            recent[key] = command.enqueued_at
+            result.append(command)
+        return result
+
+    def _collapse(self, batch):
+        # 연달아 있는 SUPERSEDING_FUNCTIONS 명령은 마지막 것만 남기고, 앞의 것은 그 결과를 함께 받는다
+        result = []
+        superseded = []
+        for command in batch:
+            if result and command.function in SUPERSEDING_FUNCTIONS and result[-1][0].function == command.function:
+                previous, covered = result.pop()
+                superseded.append(previous)
+                result.append((command, covered + [previous]))
+            else:
+                result.append((command, []))
+        if superseded:
+            registry.counter("vmix.commands_superseded", {"server": batch[0].target}).inc(len(superseded))
+            app_logger.debug(f"[{batch[0].target}] 뒤의 명령에 덮이는 명령 {len(superseded)}개 생략")
+        return result
+
+    async def _send(self, command, covered=()):
+        try:
+            ok = await self.vmix_client.send_function(command.target, command.function, **command.params)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            app_logger.error(f"[{command.target}] vMix 명령 '{command}' 전송 오류: {e}")
+            ok = False
+        latency = time.perf_counter() - command.enqueued_at
+        self.latencies.append(latency)
+        # 큐 입력 ~ vMix 응답 수신까지 (큐 대기 + 네트워크 왕복)
+        registry.histogram("vmix.command_latency_ms", {"server": command.target}).observe(latency * 1000)
+        if not ok:
+            registry.counter("vmix.commands_failed", {"server": command.target}).inc()
+        app_logger.debug(f"[{command.target}] '{command}' {'완료' if ok else '실패'} ({latency * 1000:.1f}ms)")
+        for done in (*covered, command):
+            if done.on_done is not None:
+                done.on_done(done, ok, time.perf_counter() - done.enqueued_at)
+        return ok
+
+    async def _worker(self, target, queue):
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            batch = self._dedupe(target, batch)
+            if not batch:
+                continue
+            # 동시에 보내면 vMix에 도착하는 순서가 뒤섞이므로 (전환 순서가 바뀜) 앞의 응답을 받은 뒤 다음을 보낸다
+            started = time.perf_counter()
+            results = []
+            for command, covered in self._collapse(batch):
+                results.append(await self._send(command, covered))
+            if len(batch) > 1:
+                app_logger.info(
+                    f"[{target}] vMix 명령 {len(batch)}개 중 {len(results)}개 전송 ({sum(results)}개 성공, "
+                    f"{(time.perf_counter() - started) * 1000:.1f}ms)"
+                )
+
+    async def close(self):
+        workers = list(self._workers.values())
+        for task in workers:
+            task.cancel()
+        for task in workers:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._workers.clear()
+        self._queues.clear()
+        self._recent.clear()
@@ -1,3 +1,13 @@
+import time
+from bisect import bisect_left, bisect_right, insort
+
+from src.utils.metrics import registry
+
+GTO_MODE = "GTO-W 감시용"
+COLOR_DEFAULT = "#333333"
+COLOR_VALID = "#2E7D32"   # 성공: 녹색
+COLOR_ERROR = "#D32F2F"   # 실패: 붉은색
+
 def find_gto_blocks(b_values):
     """B열 값 리스트에서 '2'로 시작하고 '1'로 끝나는 모든 GTO 계획 블록의 인덱스를 찾습니다."""
     blocks = []
@@ -17,76 +27,316 @@ def find_gto_blocks(b_values):
             i += 1
     return blocks
 
+# --- GTO 계획 규칙 정의 ---
+# 규칙이 늘어나면 이 표만 수정합니다. compile_gto_rules()가 한 번만 검사 테이블로 변환합니다.
+# 요소 규칙: (코드, 검사 종류, 인자, 메시지, 오류 인덱스 오프셋)
+#   "at"            : 계획의 arg번째(0부터)에만 올 수 있음
+#   "at_from_end"   : 계획의 끝에서 arg번째에만 올 수 있음
+#   "after"         : 첫 요소가 아니라면 직전 값이 arg 중 하나여야 함
+#   "after_required": 반드시 직전 값이 arg 중 하나여야 함 (첫 요소여도 실패)
+#   "before"        : 반드시 다음 값이 arg 중 하나여야 함
+GTO_RULES = {
+    "exception": (2, 4, 17, 1),                 # 규칙 4 (예외 케이스)
+    "start": (2, 4, 5),                         # 규칙 2 (시작)
+    "ends": ((5, 8, 1), (6, 17, 1)),            # 규칙 3 (끝)
+    "start_message": "시작은 반드시 '2-4-5'여야 합니다.",
+    "end_message": "마지막은 '5-8-1' 또는 '6-17-1'이어야 합니다.",
+    "repeat_message": "숫자 '{val}'가 연속으로 나올 수 없습니다.",   # 규칙 1 (연속 숫자)
+    "elements": [
+        (2, "at", 0, "'2'는 계획의 시작에만 올 수 있습니다.", (0,)),                      # 규칙 5
+        (4, "at", 1, "'4'는 계획의 두 번째에만 올 수 있습니다.", (0,)),                    # 규칙 6
+        (8, "at_from_end", 2, "'{val}'는 계획의 끝에서 두 번째에만 올 수 있습니다.", (0,)),  # 규칙 10
+        (17, "at_from_end", 2, "'{val}'는 계획의 끝에서 두 번째에만 올 수 있습니다.", (0,)), # 규칙 10
+        (5, "after", (4, 6), "'5'는 '4' 또는 '6' 다음에만 올 수 있습니다.", (-1, 0)),       # 규칙 7
+        (6, "after", (5, 7), "'6'는 '5' 또는 '7' 다음에만 올 수 있습니다.", (-1, 0)),       # 규칙 8
+        (7, "after_required", (5,), "'7'은 반드시 '5' 다음에 와야 합니다.", (-1, 0)),      # 규칙 9
+        (7, "before", (6,), "'7' 다음에는 반드시 '6'이 와야 합니다.", (0, 1)),             # 규칙 9
+    ],
+}
+
+_KINDS = ("at", "at_from_end", "after", "after_required", "before")
+
+class CompiledGtoRules:
+    """GTO_RULES를 코드별 검사 테이블로 변환한 결과입니다. 계획을 슬라이스 없이 한 번에 훑어 검사합니다.
+
+    코드별 검사는 위치(at) -> 끝 기준 위치(at_from_end) -> 직전 값(after) -> 다음 값(before) 순서로 평가됩니다.
+    """
+
+    def __init__(self, rules):
+        self.exception = tuple(rules["exception"])
+        self.start = tuple(rules["start"])
+        self.ends = frozenset(tuple(end) for end in rules["ends"])
+        self.end_len = len(next(iter(self.ends)))
+        self.start_message = rules["start_message"]
+        self.end_message = rules["end_message"]
+        self.repeat_message = rules["repeat_message"]
+
+        # 코드 -> (at, at_from_end, 허용 직전 값, 첫 요소도 실패 여부, 허용 다음 값, 메시지/오프셋)
+        specs = {}
+        for code, kind, arg, message, offsets in rules["elements"]:
+            if kind not in _KINDS:
+                raise ValueError(f"알 수 없는 GTO 규칙 종류: {kind}")
+            specs.setdefault(code, {})[kind] = (arg, message.format(val=code), tuple(offsets))
+        self.table = {}
+        for code, spec in specs.items():
+            after = spec.get("after_required") or spec.get("after")
+            self.table[code] = (
+                spec["at"][0] if "at" in spec else None,
+                spec["at_from_end"][0] if "at_from_end" in spec else None,
+                frozenset(after[0]) if after else None,
+                "after_required" in spec,
+                frozenset(spec["before"][0]) if "before" in spec else None,
+                {kind: (message, offsets) for kind, (_, message, offsets) in spec.items()},
+            )
+
+    def _error(self, entry, kind, i):
+        message, offsets = entry[5]["after_required" if kind == "after" and entry[3] else kind]
+        return False, message, [i + offset for offset in offsets]
+
+    def check(self, seq, lo=0, hi=None):
+        """seq[lo:hi] 구간을 하나의 계획으로 검사합니다. 오류 인덱스는 lo 기준 상대 위치입니다."""
+        if hi is None:
+            hi = len(seq)
+        n = hi - lo
+
+        # 규칙 4 (예외 케이스) 먼저 확인
+        exception = self.exception
+        if n == len(exception):
+            for k in range(n):
+                if seq[lo + k] != exception[k]:
+                    break
+            else:
+                return True, "성공", []
+
+        # 규칙 2, 3 (시작과 끝)
+        start = self.start
+        if n < len(start):
+            return False, self.start_message, list(range(len(start)))
+        k = lo
+        for code in start:
+            if seq[k] != code:
+                return False, self.start_message, list(range(len(start)))
+            k += 1
+        end_len = self.end_len
+        if end_len == 3:
+            tail = (seq[hi - 3], seq[hi - 2], seq[hi - 1])
+        else:
+            tail = tuple([seq[k] for k in range(hi - end_len, hi)]) if n >= end_len else None
+        if tail not in self.ends:
+            return False, self.end_message, [n - end_len + k for k in range(end_len)]
+
+        get_rule = self.table.get
+        last = n - 1
+        prev = None
+        i = -1
+        for k in range(lo, hi):
+            val = seq[k]
+            i += 1
+            # 규칙 1 (연속 숫자)
+            if val == prev:
+                return False, self.repeat_message.format(val=val), [i - 1, i]
+            entry = get_rule(val)
+            if entry is not None:
+                at, at_from_end, after, after_required, before, _ = entry
+                if at is not None and i != at:
+                    return self._error(entry, "at", i)
+                if at_from_end is not None and i != n - at_from_end:
+                    return self._error(entry, "at_from_end", i)
+                if after is not None and ((i == 0 and after_required) or (i > 0 and prev not in after)):
+                    return self._error(entry, "after", i)
+                if before is not None and (i == last or seq[k + 1] not in before):
+                    return self._error(entry, "before", i)
+            prev = val
+
+        return True, "성공", []
+
+    def check_many(self, plans):
+        """여러 계획을 한 번에 검사합니다."""
+        check = self.check
+        return [check(plan) for plan in plans]
+
+    def check_blocks(self, b_values, blocks):
+        """b_values 안의 여러 블록({"start", "end"} 또는 (start, end))을 복사 없이 검사합니다."""
+        check = self.check
+        results = []
+        for block in blocks:
+            if isinstance(block, dict):
+                start, end = block["start"], block["end"]
+            else:
+                start, end = block
+            results.append(check(b_values, start, end + 1))
+        return results
+
+def compile_gto_rules(rules=GTO_RULES):
+    return CompiledGtoRules(rules)
+
+_compiled_rules = compile_gto_rules()
+
 def check_single_gto_plan(plan):
     """하나의 GTO 계획 시퀀스를 10가지 규칙에 따라 검사합니다."""
-    # 규칙 4 (예외 케이스) 먼저 확인
-    if plan == [2, 4, 17, 1]:
-        return True, "성공", []
+    return _compiled_rules.check(plan)
 
-    # 규칙 2, 3 (시작과 끝)
-    if plan[:3] != [2, 4, 5]:
-        return False, "시작은 반드시 '2-4-5'여야 합니다.", [0, 1, 2]
-    if plan[-3:] not in ([5, 8, 1], [6, 17, 1]):
-        return False, "마지막은 '5-8-1' 또는 '6-17-1'이어야 합니다.", [len(plan)-3, len(plan)-2, len(plan)-1]
-
-    for i, val in enumerate(plan):
-        # 규칙 1 (연속 숫자)
-        if i > 0 and val == plan[i-1]:
-            return False, f"숫자 '{val}'가 연속으로 나올 수 없습니다.", [i-1, i]
-        # 규칙 5 (2의 위치)
-        if val == 2 and i != 0:
-            return False, "'2'는 계획의 시작에만 올 수 있습니다.", [i]
-        # 규칙 6 (4의 위치)
-        if val == 4 and i != 1:
-            return False, "'4'는 계획의 두 번째에만 올 수 있습니다.", [i]
-        # 규칙 10 (8, 17의 위치)
-        if val in (8, 17) and i != len(plan) - 2:
-            return False, f"'{val}'는 계획의 끝에서 두 번째에만 올 수 있습니다.", [i]
-        # 규칙 7 (5의 선행)
-        if val == 5 and i > 0 and plan[i-1] not in (4, 6):
-            return False, "'5'는 '4' 또는 '6' 다음에만 올 수 있습니다.", [i-1, i]
-        # 규칙 8 (6의 선행)
-        if val == 6 and i > 0 and plan[i-1] not in (5, 7):
-            return False, "'6'는 '5' 또는 '7' 다음에만 올 수 있습니다.", [i-1, i]
-        # 규칙 9 (7의 규칙)
-        if val == 7:
-            if i == 0 or plan[i-1] != 5:
-                return False, "'7'은 반드시 '5' 다음에 와야 합니다.", [i-1, i]
-            if i == len(plan) - 1 or plan[i+1] != 6:
-                return False, "'7' 다음에는 반드시 '6'이 와야 합니다.", [i, i+1]
-
-    return True, "성공", []
-
-def validate_gto_logic(app_instance, line_data_model, app_mode_value):
-    """GTO-W 모드일 때 모든 GTO 계획의 유효성을 검사하고 UI에 피드백합니다."""
-    if app_mode_value != "GTO-W 감시용":
-        return
+def check_gto_plans(plans):
+    """여러 GTO 계획을 한 번에 검사합니다. (과거 로그, 가져온 런다운 일괄 검사용)"""
+    return _compiled_rules.check_many(plans)
+
+class GtoValidator:
+    """GTO 블록 목록과 검사 결과, 레일별 배경색을 유지하면서 수정된 부분만 다시 검사합니다.
+
+    find_gto_blocks는 왼쪽부터 '2'를 만나면 다음 '1'까지를 블록으로 잡고 그 뒤부터 다시 찾으므로,
+    i번 값이 바뀌면 i보다 앞에서 끝난 블록은 그대로이고, i 뒤에서 스캔 위치가 기존 스캔과
+    다시 만나는 지점부터도 결과가 같습니다. 그 사이 구간만 다시 스캔합니다.
+    """
+
+    def __init__(self):
+        self.b_values = []
+        self.blocks = []      # [(start, end)] 시작 위치 순
+        self.results = {}     # (start, end) -> check_single_gto_plan 결과
+        self.colors = []      # 레일별로 현재 적용된 배경색
+        self._ones = []       # 값이 1인 위치 (정렬)
+
+    def _next_one(self, pos):
+        k = bisect_right(self._ones, pos)
+        return self._ones[k] if k < len(self._ones) else None
+
+    def _check(self, block):
+        start, end = block
+        self.results[block] = _compiled_rules.check(self.b_values, start, end + 1)
+
+    def _desired_colors(self, block):
+        start, end = block
+        is_valid, _, error_indices = self.results[block]
+        if is_valid:
+            return {i: COLOR_VALID for i in range(start, end + 1)}
+        colors = {i: COLOR_DEFAULT for i in range(start, end + 1)}
+        for error_idx in error_indices:
+            if 0 <= error_idx <= end - start:
+                colors[start + error_idx] = COLOR_ERROR
+        return colors
+
+    def _color_changes(self, removed, revalidated):
+        desired = {}
+        for start, end in removed:
+            for i in range(start, end + 1):
+                desired[i] = COLOR_DEFAULT
+        for block in revalidated:
+            desired.update(self._desired_colors(block))
+        changes = []
+        for i in sorted(desired):
+            if self.colors[i] != desired[i]:
+                self.colors[i] = desired[i]
+                changes.append((i, desired[i]))
+        return changes
+
+    def rebuild(self, b_values):
+        """전체를 다시 검사합니다. (검사한 블록 목록, 바뀐 배경색 [(인덱스, 색)])을 반환합니다."""
+        old_blocks = self.blocks
+        self.b_values = list(b_values)
+        self._ones = [i for i, v in enumerate(self.b_values) if v == 1]
+        if len(self.colors) != len(self.b_values):
+            self.colors = [COLOR_DEFAULT] * len(self.b_values)
+            old_blocks = []
+        self.blocks = find_gto_blocks(self.b_values)
+        self.blocks = [(b["start"], b["end"]) for b in self.blocks]
+        self.results = {}
+        for block in self.blocks:
+            self._check(block)
+        removed = [b for b in old_blocks if b not in self.results]
+        return list(self.blocks), self._color_changes(removed, self.blocks)
+
+    def update(self, index, value):
+        """index번 값만 바뀌었을 때 영향을 받는 블록만 다시 검사합니다."""
+        old_value = self.b_values[index]
+        if old_value == value:
+            return [], []
+        self.b_values[index] = value
+        if old_value == 1:
+            self._ones.remove(index)
+        if value == 1:
+            insort(self._ones, index)
+
+        # index 앞에서 끝난 블록은 그대로 둔다
+        k = bisect_left(self.blocks, index, key=lambda block: block[1])
+        pos = self.blocks[k - 1][1] + 1 if k > 0 else 0
+        old_tail = self.blocks[k:]
+
+        new_blocks = []
+        j = 0
+        n = len(self.b_values)
+        while pos < n:
+            if pos > index:
+                # 기존 스캔도 pos를 지났다면(블록 내부가 아니라면) 이후 결과는 동일
+                while j < len(old_tail) and old_tail[j][1] < pos:
+                    j += 1
+                if j == len(old_tail) or pos <= old_tail[j][0]:
+                    break
+            if self.b_values[pos] == 2:
+                end = self._next_one(pos)
+                if end is None:
+                    j = len(old_tail)
+                    break
+                new_blocks.append((pos, end))
+                pos = end + 1
+            else:
+                pos += 1
+        else:
+            j = len(old_tail)
 
-    # 1. 모든 B열 배경색을 기본으로 초기화
-    for line_entry in app_instance.line_entries:
-        line_entry["button"].config(bg="#333333")
+        replaced = old_tail[:j]
+        self.blocks = self.blocks[:k] + new_blocks + old_tail[j:]
 
-    # 2. B열 값들을 숫자 리스트로 변환
-    b_values = line_data_model.get_all_b_values()
+        replaced_set = set(replaced)
+        revalidated = [b for b in new_blocks if b not in replaced_set or b[0] <= index <= b[1]]
+        new_set = set(new_blocks)
+        removed = [b for b in replaced if b not in new_set]
+        for block in removed:
+            self.results.pop(block, None)
+        for block in revalidated:
+            self._check(block)
+        return revalidated, self._color_changes(removed, revalidated)
 
-    # 3. GTO 계획 블록 찾기
-    gto_blocks = find_gto_blocks(b_values)
+    def clear_colors(self):
+        """모든 배경색을 기본값으로 되돌릴 때 바뀌어야 하는 [(인덱스, 색)]을 반환합니다."""
+        changes = [(i, COLOR_DEFAULT) for i, color in enumerate(self.colors) if color != COLOR_DEFAULT]
+        self.colors = [COLOR_DEFAULT] * len(self.colors)
+        self.blocks = []
+        self.results = {}
+        return changes
 
-    # 4. 각 블록을 검사하고 결과 처리
-    for block in gto_blocks:
-        start, end = block["start"], block["end"]
-        plan_sequence = b_values[start : end + 1]
-        
-        is_valid, message, error_indices = check_single_gto_plan(plan_sequence)
+_validate_full_ms = registry.histogram("gto.validate_ms", {"scope": "full"})
+_validate_edit_ms = registry.histogram("gto.validate_ms", {"scope": "edit"})
 
+def apply_gto_results(app_instance, validator, checked_blocks, color_changes):
+    """검사 결과를 UI에 반영합니다. 색이 실제로 바뀌는 레일만 다시 설정합니다."""
+    for i, color in color_changes:
+        app_instance.set_button_color(i, color)
+    for block in checked_blocks:
+        start, end = block
+        is_valid, message, _ = validator.results[block]
         if is_valid:
             for i in range(start, end + 1):
-                app_instance.line_entries[i]["button"].config(bg="#2E7D32") # 성공: 녹색
                 app_instance.run_line(i)
         else:
             app_instance.push_error(f"{start+1}번 레일 계획 오류: {message}")
             for i in range(start, end + 1):
                 app_instance.stop_line(i) # 실패 시 실행 중지
-            for error_idx in error_indices:
-                # 절대 인덱스로 변환하여 UI에 반영
-                app_instance.line_entries[start + error_idx]["button"].config(bg="#D32F2F") # 실패: 붉은색
\ No newline at end of file
+
+def validate_gto_logic(app_instance, line_data_model, app_mode_value, validator=None):
+    """GTO-W 모드일 때 모든 GTO 계획의 유효성을 검사하고 UI에 피드백합니다."""
+    if app_mode_value != GTO_MODE:
+        return
+    if validator is None:
+        validator = GtoValidator()
+    started = time.perf_counter()
+    checked_blocks, color_changes = validator.rebuild(line_data_model.get_all_b_values())
+    _validate_full_ms.observe((time.perf_counter() - started) * 1000)
+    apply_gto_results(app_instance, validator, checked_blocks, color_changes)
+
+def validate_gto_edit(app_instance, validator, index, value, app_mode_value):
+    """B열 한 칸이 수정되었을 때 영향을 받는 GTO 계획만 다시 검사합니다."""
+    if app_mode_value != GTO_MODE:
+        return
+    started = time.perf_counter()
+    checked_blocks, color_changes = validator.update(index, value)
+    _validate_edit_ms.observe((time.perf_counter() - started) * 1000)
+    apply_gto_results(app_instance, validator, checked_blocks, color_changes)
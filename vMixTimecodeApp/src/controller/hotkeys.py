@@ -0,0 +1,107 @@
+import time
+from collections import deque
+
+from src.utils.logger import app_logger
+from src.utils.metrics import registry
+
+# settings.json의 "hotkeys" 형식 (키 조합 -> 동작)
+#   "ctrl+1": {"rail": 1}                                          1번 레일의 인풋으로 CutDirect
+#   "f9":     {"function": "Cut"}                                  vMix Function 직접 전송
+#   "f10":    {"function": "CutDirect", "params": {"Input": 3}}
+
+class HotkeyBinding:
+    __slots__ = ("hotkey", "rail", "function", "params")
+
+    def __init__(self, hotkey, rail=None, function=None, params=None):
+        self.hotkey = hotkey
+        self.rail = rail              # 0부터 시작하는 레일 인덱스 (레일 실행일 때)
+        self.function = function      # vMix Function 이름 (직접 전송일 때)
+        self.params = params or {}
+
+    def __repr__(self):
+        target = f"{self.rail+1}번 레일" if self.rail is not None else self.function
+        return f"{self.hotkey} -> {target}"
+
+def compile_hotkeys(config):
+    """설정의 단축키 표를 {정규화한 키 조합: HotkeyBinding}으로 한 번만 변환합니다. 잘못된 항목은 건너뜁니다."""
+    table = {}
+    for hotkey, action in (config or {}).items():
+        hotkey = "+".join(part.strip() for part in str(hotkey).lower().split("+") if part.strip())
+        if not hotkey or not isinstance(action, dict):
+            app_logger.warning(f"단축키 설정을 건너뜁니다: {hotkey!r} -> {action!r}")
+            continue
+        rail = action.get("rail")
+        if rail is not None:
+            try:
+                rail = int(rail) - 1
+            except (TypeError, ValueError):
+                rail = -1
+            if rail < 0:
+                app_logger.warning(f"단축키 '{hotkey}': 레일 번호가 올바르지 않습니다 ({action.get('rail')!r}).")
+                continue
+            table[hotkey] = HotkeyBinding(hotkey, rail=rail)
+        elif action.get("function"):
+            params = {k: str(v) for k, v in (action.get("params") or {}).items()}
+            table[hotkey] = HotkeyBinding(hotkey, function=str(action["function"]), params=params)
+        else:
+            app_logger.warning(f"단축키 '{hotkey}': 'rail' 또는 'function'이 필요합니다.")
+    return table
+
+class HotkeyManager:
+    """전역 단축키를 keyboard 라이브러리에 등록합니다.
+
+    keyboard의 콜백은 keyboard 자체 스레드에서 실행되며, 여기서는 누른 시각만 기록해 on_trigger로 넘깁니다.
+    (Tk 이벤트 루프를 거치지 않으므로 화면이 바빠도 명령 전송이 늦어지지 않음)
+    """
+
+    def __init__(self, on_trigger):
+        self.on_trigger = on_trigger    # on_trigger(binding, pressed_at): keyboard 스레드에서 호출
+        self.table = {}
+        self.latencies = deque(maxlen=512)   # 최근 (누름 -> vMix 응답) 시간 (초)
+        self._handles = []
+        self._keyboard = None
+        self.dispatch_ms = registry.histogram("hotkey.press_to_dispatch_ms")   # 누름 -> 디스패처 큐 입력
+        self.ack_ms = registry.histogram("hotkey.press_to_ack_ms")             # 누름 -> vMix 응답 수신
+
+    def _import_keyboard(self):
+        # keyboard는 후킹 스레드를 띄우므로 실제로 단축키를 등록할 때만 불러옴
+        if self._keyboard is None:
+            import keyboard
+            self._keyboard = keyboard
+        return self._keyboard
+
+    def reload(self, config):
+        """기존 단축키를 모두 해제하고 설정을 다시 컴파일해 등록합니다. 등록한 개수를 반환합니다."""
+        self.clear()
+        self.table = compile_hotkeys(config)
+        if not self.table:
+            return 0
+        try:
+            keyboard = self._import_keyboard()
+        except Exception as e:   # 설치되지 않았거나 권한이 없는 환경 (리눅스는 root 필요)
+            app_logger.warning(f"전역 단축키를 사용할 수 없습니다: {e}")
+            return 0
+        for hotkey, binding in list(self.table.items()):
+            try:
+                self._handles.append(keyboard.add_hotkey(hotkey, self._on_hotkey, args=(binding,)))
+            except (ValueError, OSError) as e:
+                del self.table[hotkey]
+                app_logger.warning(f"단축키 '{hotkey}'를 등록할 수 없습니다: {e}")
+        app_logger.info(f"전역 단축키 {len(self._handles)}개 등록: {', '.join(map(repr, self.table.values()))}")
+        return len(self._handles)
+
+    def _on_hotkey(self, binding):
+        pressed_at = time.perf_counter()
+        try:
+            self.on_trigger(binding, pressed_at)
+        except Exception as e:
+            app_logger.error(f"단축키 '{binding.hotkey}' 처리 오류: {e}")
+
+    def clear(self):
+        if self._keyboard is not None:
+            for handle in self._handles:
+                try:
+                    self._keyboard.remove_hotkey(handle)
+                except (KeyError, ValueError):
+                    pass
+        self._handles = []
@@ -0,0 +1,152 @@
+import asyncio
+import heapq
+import sys
+import time
+from collections import deque
+
+from src.utils.logger import app_logger
+from src.utils.metrics import registry
+
+# 윈도우의 기본 타이머 해상도(약 15.6ms)를 고려해 마지막 구간은 양보(sleep(0))하며 기다린다
+DEFAULT_SPIN_WINDOW = 0.02 if sys.platform == "win32" else 0.004
+
+class TimecodeClock:
+    """vMix 액티브 인풋 타임코드와 time.monotonic() 사이의 오프셋을 추정합니다.
+
+    offset = (vMix 타임코드 초) - monotonic 이므로, vMix 시각 t는 monotonic 기준 t - offset에 도달합니다.
+    """
+
+    def __init__(self, smoothing=0.2, jump_threshold=0.25):
+        self.smoothing = smoothing
+        self.jump_threshold = jump_threshold
+        self.offset = None
+        self.active = None
+        self.running = False
+
+    @property
+    def synced(self):
+        return self.offset is not None and self.running
+
+    def reset(self):
+        self.offset = None
+        self.running = False
+
+    def sync(self, snapshot):
+        inp = snapshot.active_input
+        if inp is None:
+            self.reset()
+            return
+        # 인풋이 바뀌거나 일시정지/탐색(seek)으로 위치가 튀면 추정값을 새로 시작
+        sample = inp.position / 1000.0 - snapshot.captured_at
+        self.running = inp.state == "Running"
+        if self.offset is None or snapshot.active != self.active or abs(sample - self.offset) > self.jump_threshold:
+            self.offset = sample
+        else:
+            # 폴링 지터를 줄이기 위해 지수 이동 평균으로 보정
+            self.offset += self.smoothing * (sample - self.offset)
+        self.active = snapshot.active
+
+    def to_monotonic(self, vmix_seconds):
+        return vmix_seconds - self.offset
+
+    def now(self):
+        return time.monotonic() + self.offset
+
+class RailScheduler:
+    """레일 시간을 monotonic 마감 시각으로 바꿔 힙에 두고, 마감 시각에 맞춰 레일을 실행합니다."""
+
+    def __init__(self, clock, fire_callback, spin_window=DEFAULT_SPIN_WINDOW, late_tolerance=0.5):
+        self.clock = clock
+        self.fire_callback = fire_callback
+        self.spin_window = spin_window
+        self.late_tolerance = late_tolerance
+        self.jitter = deque(maxlen=512)   # 최근 실행 오차 (초, 양수 = 늦음)
+        self._heap = []                   # (vMix 타임코드 초, 순번, 레일 인덱스)
+        self._armed = {}                  # 레일 인덱스 -> 순번 (재등록/취소 시 이전 항목 무효화)
+        self._seq = 0
+        self._wakeup = asyncio.Event()
+        self._late_ms = registry.histogram("rail.fire_late_ms")   # 마감 시각 대비 늦은 정도 (이르면 0)
+        self._skipped = registry.counter("rail.skipped")
+
+    def arm(self, index, rail_seconds):
+        self._seq += 1
+        self._armed[index] = self._seq
+        heapq.heappush(self._heap, (rail_seconds, self._seq, index))
+        self._wakeup.set()
+
+    def disarm(self, index):
+        # 힙에서 바로 빼지 않고 실행 시점에 무시 (lazy deletion)
+        self._armed.pop(index, None)
+
+    def disarm_all(self):
+        self._armed.clear()
+
+    def is_armed(self, index):
+        return index in self._armed
+
+    def on_clock_changed(self):
+        self._wakeup.set()
+
+    def _peek(self):
+        while self._heap:
+            rail_seconds, seq, index = self._heap[0]
+            if self._armed.get(index) == seq:
+                return rail_seconds, seq, index
+            heapq.heappop(self._heap)
+        return None
+
+    async def _wait(self, timeout):
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def run(self):
+        while True:
+            try:
+                await self._step()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 한 번의 오류로 스케줄러 작업 전체가 멈추지 않도록 기록만 하고 계속 진행
+                app_logger.error(f"레일 스케줄러 오류: {e!r}")
+                await self._wait(0.1)
+
+    async def _step(self):
+        head = self._peek()
+        if head is None or not self.clock.synced:
+            await self._wait(None if head is None else 0.1)
+            return
+
+        rail_seconds, seq, index = head
+        deadline = self.clock.to_monotonic(rail_seconds)
+        remaining = deadline - time.monotonic()
+        if remaining < -self.late_tolerance:
+            # 이미 지나간 시간(탐색/인풋 전환 등)은 실행하지 않는다
+            heapq.heappop(self._heap)
+            del self._armed[index]
+            self._skipped.inc()
+            app_logger.warning(f"{index+1}번 레일: 실행 시각이 {-remaining:.2f}초 지나 건너뜁니다.")
+            return
+        if remaining > self.spin_window:
+            # 오프셋이 보정될 수 있으므로 깨어난 뒤 마감 시각을 다시 계산한다
+            await self._wait(remaining - self.spin_window)
+            return
+
+        # 양보하는 동안 취소/재등록(stop_line, arm)이나 연결 끊김(clock.reset)이 끼어들 수 있으므로
+        # 매번 힙 맨 앞이 그대로인지, 시계가 아직 동기화되어 있는지 확인한다
+        while self._peek() == head and self.clock.synced and time.monotonic() < self.clock.to_monotonic(rail_seconds):
+            await asyncio.sleep(0)
+        if self._peek() != head or not self.clock.synced:
+            return
+        heapq.heappop(self._heap)
+        del self._armed[index]
+        jitter = time.monotonic() - self.clock.to_monotonic(rail_seconds)
+        self.jitter.append(jitter)
+        self._late_ms.observe(max(0.0, jitter * 1000))
+        app_logger.info(f"{index+1}번 레일 실행 (오차 {jitter * 1000:+.1f}ms)")
+        try:
+            self.fire_callback(index)
+        except Exception as e:
+            app_logger.error(f"{index+1}번 레일 실행 오류: {e}")
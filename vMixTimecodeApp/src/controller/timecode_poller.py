@@ -0,0 +1,57 @@
+import asyncio
+import aiohttp
+import xml.etree.ElementTree as ET
+
+from src.controller.vmix_client import VmixApiError
+from src.utils.logger import app_logger
+
+class TimecodePoller:
+    """메인 vMix 상태를 고빈도로 샘플링해 VmixState에 반영합니다.
+
+    UI 갱신 여부는 VmixState의 변경 이벤트(타임코드 초 변경 등)가 결정합니다.
+    """
+
+    def __init__(self, vmix_client, get_server, vmix_state, rate_hz=20, max_backoff=2.0):
+        self.vmix_client = vmix_client
+        self.get_server = get_server    # () -> (서버 이름, IP)
+        self.vmix_state = vmix_state
+        self.rate_hz = max(1, min(30, rate_hz))
+        self.max_backoff = max_backoff
+        self.failures = 0
+
+    def set_rate(self, rate_hz):
+        # TCP 이벤트를 받는 동안에는 전체 상태 보정용으로 낮은 속도만 사용
+        self.rate_hz = max(0.2, min(30, rate_hz))
+
+    @property
+    def interval(self):
+        return 1.0 / self.rate_hz
+
+    def next_delay(self):
+        # 연결 실패가 이어지면 폴링 간격을 지수적으로 늘린다 (최대 max_backoff 초)
+        if self.failures == 0:
+            return self.interval
+        return min(self.max_backoff, self.interval * (2 ** min(self.failures, 8)))
+
+    async def poll_once(self):
+        name, ip = self.get_server()
+        snapshot = await self.vmix_client.fetch_snapshot(ip)
+        self.vmix_state.update(name, snapshot)
+        return snapshot
+
+    async def run(self):
+        loop = asyncio.get_event_loop()
+        while True:
+            started = loop.time()
+            try:
+                await self.poll_once()
+                if self.failures:
+                    app_logger.info("타임코드 폴링이 복구되었습니다.")
+                self.failures = 0
+            except (aiohttp.ClientError, asyncio.TimeoutError, ET.ParseError, VmixApiError) as e:
+                if self.failures == 0:
+                    app_logger.warning(f"타임코드 폴링 실패: {e}")
+                self.failures += 1
+                self.vmix_state.mark_disconnected(self.get_server()[0], str(e))
+            elapsed = loop.time() - started
+            await asyncio.sleep(max(0.0, self.next_delay() - elapsed))
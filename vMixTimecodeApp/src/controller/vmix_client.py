@@ -0,0 +1,96 @@
+import asyncio
+import time
+import aiohttp
+
+from src.model.vmix_snapshot import VmixStateParser
+from src.utils.logger import app_logger
+from src.utils.metrics import registry
+
+VMIX_HTTP_PORT = 8088
+STREAM_CHUNK_SIZE = 16384
+
+class VmixApiError(Exception):
+    pass
+
+class VmixClient:
+    """vMix HTTP API 호출에 사용하는 장기 유지(keep-alive) 연결 풀입니다."""
+
+    def __init__(self, limit_per_host=16, keepalive_timeout=30, timeout=2, port=VMIX_HTTP_PORT):
+        self.port = port
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self._session = None
+
+    def _get_session(self):
+        # 세션은 이벤트 루프 안에서 처음 사용될 때 한 번만 만든다
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    def _request_options(self, timeout):
+        # timeout=None을 그대로 넘기면 aiohttp는 세션 기본값이 아니라 '제한 없음'으로 처리하므로 지정했을 때만 넘긴다
+        return {"timeout": aiohttp.ClientTimeout(total=timeout)} if timeout else {}
+
+    def api_url(self, ip):
+        return f"http://{ip}:{self.port}/api/"
+
+    async def get_api(self, ip, params=None, timeout=None):
+        """vMix API를 호출하고 (상태 코드, 응답 본문)을 반환합니다."""
+        session = self._get_session()
+        async with session.get(self.api_url(ip), params=params, **self._request_options(timeout)) as response:
+            body = await response.text()
+            return response.status, body
+
+    async def fetch_snapshot(self, ip, timeout=None):
+        """vMix 상태 XML을 스트리밍으로 파싱해 VmixSnapshot을 반환합니다."""
+        session = self._get_session()
+        parser = VmixStateParser()
+        perf = time.perf_counter
+        parse_seconds = 0.0
+        requested_at = time.monotonic()
+        started = perf()
+        async with session.get(self.api_url(ip), **self._request_options(timeout)) as response:
+            # vMix가 XML을 만든 시점은 요청과 응답 헤더 수신의 중간으로 추정
+            captured_at = (requested_at + time.monotonic()) / 2
+            if response.status != 200:
+                registry.counter("vmix.poll_errors", {"server": ip}).inc()
+                raise VmixApiError(f"vMix API 응답 오류: {response.status}")
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                parse_started = perf()
+                done = parser.feed(chunk)
+                parse_seconds += perf() - parse_started
+                if done:
+                    break
+            # 남은 본문은 파싱 없이 읽어 버려야 keep-alive 연결을 재사용할 수 있다
+            await response.read()
+        # 왕복 시간(요청 ~ 본문 수신 완료)과 그중 XML 파싱에 쓴 시간
+        registry.histogram("vmix.poll_rtt_ms", {"server": ip}).observe((perf() - started) * 1000)
+        registry.histogram("vmix.xml_parse_ms").observe(parse_seconds * 1000)
+        snapshot = parser.snapshot()
+        snapshot.captured_at = captured_at
+        return snapshot
+
+    async def send_function(self, ip, function, **params):
+        """vMix Function 명령을 전송하고 성공 여부를 반환합니다."""
+        query = {"Function": function}
+        query.update({k: str(v) for k, v in params.items() if v is not None})
+        status, _ = await self.get_api(ip, params=query)
+        if status != 200:
+            app_logger.warning(f"vMix Function '{function}' 응답 오류: {status}")
+            return False
+        return True
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            # 커넥터가 소켓을 정리할 시간을 준다
+            await asyncio.sleep(0)
+        self._session = None
@@ -0,0 +1,214 @@
+import asyncio
+import time
+from xml.etree.ElementTree import ParseError
+
+from src.model.vmix_snapshot import VmixInput, VmixSnapshot, parse_vmix_state
+from src.utils.logger import app_logger
+from src.utils.metrics import registry
+
+VMIX_TCP_PORT = 8099
+READ_CHUNK_SIZE = 65536
+MAX_LINE_LENGTH = 65536    # 줄바꿈 없이 이보다 길면 프로토콜 오류로 보고 다시 연결
+
+class VmixTcpParser:
+    """vMix TCP API 응답을 받은 조각 단위로 해석합니다.
+
+    - 일반 응답은 "명령 상태 나머지\\r\\n" 한 줄 (예: "TALLY OK 0120", "ACTS OK Input 3 1")
+    - 상태 자리에 숫자가 오면 그 바이트 수만큼 데이터가 뒤따름 (예: "XML 5231\\r\\n<vmix>...")
+    feed()는 완성된 메시지를 (명령, 상태, 데이터) 튜플 목록으로 반환합니다. 길이 지정 응답의 데이터는 bytes입니다.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._pending = None    # 길이 지정 응답을 읽는 중이면 (명령, 남은 바이트 수)
+
+    def feed(self, data):
+        buffer = self._buffer
+        buffer += data
+        messages = []
+        while buffer:
+            if self._pending is not None:
+                command, length = self._pending
+                if len(buffer) < length:
+                    break
+                messages.append((command, "OK", bytes(buffer[:length])))
+                del buffer[:length]
+                self._pending = None
+                continue
+            end = buffer.find(b"\r\n")
+            if end < 0:
+                if len(buffer) > MAX_LINE_LENGTH:
+                    raise ValueError("vMix TCP 응답에 줄바꿈이 없습니다.")
+                break
+            line = buffer[:end].decode("utf-8", "replace")
+            del buffer[:end + 2]
+            if not line:
+                continue
+            parts = line.split(" ", 2)
+            status = parts[1] if len(parts) > 1 else ""
+            if status.isdecimal():
+                self._pending = (parts[0], int(status))
+                continue
+            messages.append((parts[0], status, parts[2] if len(parts) > 2 else ""))
+        return messages
+
+def parse_tally(text):
+    """TALLY 문자열(인풋 순서대로 0: 꺼짐, 1: 프로그램, 2: 프리뷰)에서 (액티브, 프리뷰) 번호를 찾습니다."""
+    active = text.find("1")
+    preview = text.find("2")
+    return (active + 1 if active >= 0 else None), (preview + 1 if preview >= 0 else None)
+
+class VmixTcpSubscriber:
+    """vMix TCP API(8099)에 연결을 유지하며 TALLY/ACTS 이벤트로 VmixState를 즉시 갱신합니다.
+
+    - 이벤트에는 재생 위치가 없으므로 이전 스냅샷의 위치를 경과 시간만큼 앞당겨 쓰고,
+      액티브/프리뷰가 바뀌면 같은 연결로 XML 전체 상태를 바로 요청해 보정합니다.
+    - 연결이 끊기면 지수 백오프로 다시 연결하며, 연결 상태는 on_connection_changed(bool)로 알립니다.
+      (컨트롤러는 연결 중에는 HTTP 폴링을 전체 상태 보정용 저속으로, 끊기면 원래 속도로 되돌림)
+    """
+
+    def __init__(self, get_server, vmix_state, port=VMIX_TCP_PORT, on_connection_changed=None,
+                 keepalive=2.0, connect_timeout=2.0, max_backoff=5.0):
+        self.get_server = get_server    # () -> (서버 이름, IP)
+        self.vmix_state = vmix_state
+        self.port = port
+        self.on_connection_changed = on_connection_changed
+        self.keepalive = keepalive
+        self.connect_timeout = connect_timeout
+        self.max_backoff = max_backoff
+        self.connected = False
+        self._writer = None
+        self._events = registry.counter("vmix.tcp_events")
+        self._reconnects = registry.counter("vmix.tcp_reconnects")
+
+    def _set_connected(self, connected):
+        if self.connected == connected:
+            return
+        self.connected = connected
+        if self.on_connection_changed is not None:
+            self.on_connection_changed(connected)
+
+    def send(self, line):
+        if self._writer is not None:
+            self._writer.write(line.encode("utf-8") + b"\r\n")
+
+    async def run(self):
+        backoff = 0.5
+        while True:
+            name, ip = self.get_server()
+            error = None
+            try:
+                await self._session(name, ip)
+            except (OSError, asyncio.TimeoutError, ConnectionError, ValueError) as e:
+                error = e
+            except Exception as e:
+                # 예상하지 못한 오류로 구독 작업이 끝나면 HTTP 폴링이 저속으로 남으므로, 기록하고 다시 연결한다
+                app_logger.error(f"[{name}] vMix TCP 처리 오류: {e!r}")
+                error = e
+            was_connected = self.connected
+            self._set_connected(False)
+            if was_connected:
+                app_logger.warning(f"[{name}] vMix TCP 연결이 끊겨 HTTP 폴링으로 전환합니다: {error}")
+                backoff = 0.5
+            else:
+                app_logger.debug(f"[{name}] vMix TCP 연결 실패: {error}")
+            self._reconnects.inc()
+            await asyncio.sleep(backoff)
+            backoff = min(self.max_backoff, backoff * 2)
+
+    async def _session(self, name, ip):
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(ip, self.port), self.connect_timeout)
+        self._writer = writer
+        try:
+            self.send("SUBSCRIBE TALLY")
+            self.send("SUBSCRIBE ACTS")
+            self.send("XML")    # 연결 직후 전체 상태
+            parser = VmixTcpParser()
+            idle = 0
+            while True:
+                try:
+                    data = await asyncio.wait_for(reader.read(READ_CHUNK_SIZE), self.keepalive)
+                except asyncio.TimeoutError:
+                    # 조용한 연결이 살아 있는지 TALLY 요청으로 확인, 두 번 연속 응답이 없으면 다시 연결
+                    idle += 1
+                    if idle > 1:
+                        raise ConnectionError("vMix TCP 응답이 없습니다.")
+                    self.send("TALLY")
+                    continue
+                if not data:
+                    raise ConnectionError("vMix가 TCP 연결을 닫았습니다.")
+                idle = 0
+                for command, status, payload in parser.feed(data):
+                    self.handle_message(name, command, status, payload)
+        finally:
+            self._writer = None
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (OSError, ConnectionError):
+                pass
+
+    def handle_message(self, name, command, status, payload):
+        if command == "XML":
+            try:
+                snapshot = parse_vmix_state(payload)
+            except ParseError as e:
+                # 잘못된 XML 하나는 버리고 연결은 유지 (다음 이벤트나 HTTP 보정 폴링으로 갱신됨)
+                app_logger.warning(f"[{name}] vMix TCP XML 응답을 해석할 수 없습니다: {e}")
+                return
+            snapshot.captured_at = time.monotonic()
+            self.vmix_state.update(name, snapshot)
+        elif status == "ER":
+            app_logger.warning(f"[{name}] vMix TCP {command} 오류: {payload}")
+        elif command == "SUBSCRIBE":
+            if not self.connected:
+                app_logger.info(f"[{name}] vMix TCP 이벤트 구독 시작 ({payload}).")
+            self._set_connected(True)
+        elif command == "TALLY":
+            self._events.inc()
+            active, preview = parse_tally(payload)
+            self.apply_event(name, active=active, preview=preview)
+        elif command == "ACTS":
+            self._events.inc()
+            self.handle_activator(name, payload.split())
+
+    def handle_activator(self, name, fields):
+        # 예: "Input 3 1" (3번 인풋이 프로그램), "InputPreview 2 1", "InputPlaying 3 0"
+        if len(fields) < 3 or not fields[1].isdecimal():
+            return
+        activator, number, on = fields[0], int(fields[1]), fields[2] == "1"
+        if activator == "Input" and on:
+            self.apply_event(name, active=number)
+        elif activator == "InputPreview" and on:
+            self.apply_event(name, preview=number)
+        elif activator == "InputPlaying":
+            self.apply_event(name, playing=(number, on))
+
+    def apply_event(self, name, active=None, preview=None, playing=None):
+        """이벤트로 바뀐 필드만 이전 스냅샷에 반영해 새 스냅샷을 만듭니다. 바뀐 것이 없으면 아무것도 하지 않습니다."""
+        old = self.vmix_state.get(name)
+        if old is None:
+            self.send("XML")    # 기준 스냅샷이 아직 없으면 전체 상태부터
+            return
+        new_active = old.active if active is None else active
+        new_preview = old.preview if preview is None else preview
+        state_change = None
+        if playing is not None:
+            number, on = playing
+            inp = old.inputs.get(number)
+            state = "Running" if on else "Paused"
+            if inp is not None and inp.state != state:
+                state_change = (number, state)
+        if new_active == old.active and new_preview == old.preview and state_change is None:
+            return
+
+        now = time.monotonic()
+        elapsed_ms = int((now - old.captured_at) * 1000)
+        inputs = {}
+        for number, inp in old.inputs.items():
+            position = inp.position + elapsed_ms if inp.state == "Running" else inp.position
+            state = state_change[1] if state_change is not None and state_change[0] == number else inp.state
+            inputs[number] = VmixInput(number, state, position, inp.duration)
+        self.vmix_state.update(name, VmixSnapshot(new_active, new_preview, inputs, captured_at=now))
+        if new_active != old.active or new_preview != old.preview:
+            self.send("XML")    # 추정한 재생 위치를 실제 값으로 보정
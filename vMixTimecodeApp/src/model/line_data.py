@@ -1,31 +1,230 @@
+import sys
+from array import array
+
+from src.utils.timecode import DEFAULT_FPS, NO_FRAMES, format_timecode, parse_column, parse_timecode
+
+LINE_KEYS = ("time", "preview", "button", "comment", "input")
+NO_TIME = NO_FRAMES     # 시간 형식이 아닌 값 (원본 문자열은 따로 보관)
+MAX_BUTTON = 0xFFFF
+
+class LineView:
+    """한 레일을 dict처럼 읽고 쓸 수 있게 해 주는 가벼운 뷰입니다. 값은 모델의 열(column)에 저장됩니다."""
+    __slots__ = ("_model", "_index")
+
+    def __init__(self, model, index):
+        self._model = model
+        self._index = index
+
+    def __getitem__(self, key):
+        return self._model.get_value(self._index, key)
+
+    def __setitem__(self, key, value):
+        self._model.update_line_data(self._index, key, value)
+
+    def get(self, key, default=None):
+        try:
+            return self._model.get_value(self._index, key)
+        except KeyError:
+            return default
+
+    def keys(self):
+        return list(LINE_KEYS) + list(self._model._extra.get(self._index, {}))
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def __repr__(self):
+        return f"LineView({self._index}, {self.to_dict()!r})"
+
+class _LinesView:
+    """기존 코드의 `lines[i]["button"]` 접근을 그대로 지원하기 위한 시퀀스 뷰입니다."""
+    __slots__ = ("_model",)
+
+    def __init__(self, model):
+        self._model = model
+
+    def __len__(self):
+        return self._model.rail_count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._model.rail_count
+        if not 0 <= index < self._model.rail_count:
+            raise IndexError(index)
+        return LineView(self._model, index)
+
+    def __iter__(self):
+        for i in range(self._model.rail_count):
+            yield LineView(self._model, i)
+
 class LineDataModel:
-    def __init__(self):
-        self.rail_count = 30  # 기본값
-        self.lines = []       # 라인 데이터 저장
-        self._initialize_lines()
+    """레일 데이터를 열(column) 단위로 저장합니다.
+
+    - time: 프레임 단위 int 배열 (fps/drop_frame 기준, 형식이 아닌 값은 NO_TIME + 원본 문자열)
+    - button: B열 코드 unsigned short 배열 (숫자가 아닌 값은 0 + 원본 문자열)
+    - preview, comment, input: intern된 문자열 리스트
+    """
 
-    def _initialize_lines(self):
+    def __init__(self, rail_count=30, fps=DEFAULT_FPS, drop_frame=False):
+        self.fps = fps
+        self.drop_frame = drop_frame
+        self.times = array("i")
+        self.buttons = array("H")
+        self.previews = []
+        self.comments = []
+        self.inputs = []
+        self._raw = {}      # (index, key) -> 정규 형식이 아닌 time/button 원본 문자열
+        self._extra = {}    # index -> 기본 열 이외의 키
+        self._listeners = []  # callback(index, key, value) - 변경 기록(저널) 등
+        self.lines = _LinesView(self)
+        self._initialize_lines(rail_count)
+
+    def _initialize_lines(self, rail_count):
         # 실제 애플리케이션에서는 설정 파일 등에서 로드할 수 있습니다.
         # 여기서는 임시로 빈 라인 데이터를 생성합니다.
-        for i in range(self.rail_count):
-            self.lines.append({
-                "time": "00:00:00",
-                "preview": "",
-                "button": "0",
-                "comment": "",
-                "input": ""
-            })
+        self._resize(rail_count)
+
+    def subscribe(self, callback):
+        """변경 알림을 등록합니다. callback(index, key, value)
+
+        - 레일 값 변경: (index, key, value)
+        - 레일 수 변경: (None, "rail_count", count)
+        - load_lines로 전체 교체: (None, "load", count)
+        """
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, index, key, value):
+        for callback in self._listeners:
+            callback(index, key, value)
+
+    @property
+    def rail_count(self):
+        return len(self.buttons)
+
+    @rail_count.setter
+    def rail_count(self, count):
+        self.set_rail_count(count)
+
+    def set_rail_count(self, count):
+        if count != self.rail_count:
+            self._resize(count)
+            self._notify(None, "rail_count", count)
+
+    def _resize(self, count):
+        current = len(self.buttons)
+        if count > current:
+            extra = count - current
+            self.times.extend([0] * extra)
+            self.buttons.extend([0] * extra)
+            self.previews.extend([""] * extra)
+            self.comments.extend([""] * extra)
+            self.inputs.extend([""] * extra)
+        elif count < current:
+            del self.times[count:]
+            del self.buttons[count:]
+            del self.previews[count:]
+            del self.comments[count:]
+            del self.inputs[count:]
+            self._raw = {k: v for k, v in self._raw.items() if k[0] < count}
+            self._extra = {k: v for k, v in self._extra.items() if k < count}
+
+    def get_value(self, index, key):
+        if key == "time":
+            raw = self._raw.get((index, key))
+            if raw is not None:
+                return raw
+            return format_timecode(self.times[index], self.fps, self.drop_frame)
+        if key == "button":
+            raw = self._raw.get((index, key))
+            return raw if raw is not None else str(self.buttons[index])
+        if key == "preview":
+            return self.previews[index]
+        if key == "comment":
+            return self.comments[index]
+        if key == "input":
+            return self.inputs[index]
+        return self._extra.get(index, {})[key]
 
     def get_line_data(self, index):
-        if 0 <= index < len(self.lines):
-            return self.lines[index]
+        if 0 <= index < self.rail_count:
+            return LineView(self, index)
         return None
 
     def update_line_data(self, index, key, value):
-        if 0 <= index < len(self.lines):
-            self.lines[index][key] = value
-            return True
-        return False
+        if not 0 <= index < self.rail_count:
+            return False
+        self._set_value(index, key, value)
+        self._notify(index, key, value)
+        return True
+
+    def _set_value(self, index, key, value):
+        if key == "time":
+            value = str(value)
+            frames = parse_timecode(value, self.fps, self.drop_frame)
+            if frames is None:
+                self.times[index] = NO_TIME
+                self._raw[(index, key)] = value
+            else:
+                self.times[index] = frames
+                if value == format_timecode(frames, self.fps, self.drop_frame):
+                    self._raw.pop((index, key), None)
+                else:
+                    self._raw[(index, key)] = value
+        elif key == "button":
+            value = str(value)
+            code = int(value) if value.isdecimal() else 0
+            if code > MAX_BUTTON:
+                code = 0
+            self.buttons[index] = code
+            if value == str(code):
+                self._raw.pop((index, key), None)
+            else:
+                self._raw[(index, key)] = value
+        elif key == "preview":
+            self.previews[index] = sys.intern(str(value))
+        elif key == "comment":
+            self.comments[index] = sys.intern(str(value))
+        elif key == "input":
+            self.inputs[index] = sys.intern(str(value))
+        else:
+            self._extra.setdefault(index, {})[key] = value
+
+    def get_time_frames(self, index):
+        # 레일 시간 (프레임). 형식이 아니면 NO_TIME
+        return self.times[index]
 
     def get_all_b_values(self):
-        return [int(line["button"]) if line["button"].isdigit() else 0 for line in self.lines]
+        # 복사 없이 B열 배열을 그대로 반환 (읽기 전용으로 사용)
+        return self.buttons
+
+    def load_lines(self, lines):
+        """[{"time": ..., "button": ...}, ...] 형식의 레일 목록으로 모델을 다시 채웁니다."""
+        self._raw.clear()
+        self._extra.clear()
+        self._resize(0)
+        self._resize(len(lines))
+        # 시간 열은 한 번에 변환 (같은 값은 캐시됨)
+        self.times = parse_column([str(line.get("time", "00:00:00")) for line in lines], self.fps, self.drop_frame)
+        for i, line in enumerate(lines):
+            for key, value in line.items():
+                if key != "time":
+                    self._set_value(i, key, value)
+                elif self.times[i] == NO_TIME or value != format_timecode(self.times[i], self.fps, self.drop_frame):
+                    self._set_value(i, key, value)
+        self._notify(None, "load", len(lines))
+
+    def to_dicts(self):
+        return [LineView(self, i).to_dict() for i in range(self.rail_count)]
@@ -0,0 +1,104 @@
+import hashlib
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+
+from src.model.settings import write_atomic
+from src.utils.logger import app_logger
+
+PROFILES_DIR = "profiles"
+INDEX_FILE = "index.json"
+
+# 프로필 본문 없이 목록/메뉴에 표시할 수 있도록 인덱스에 함께 저장하는 설정 항목
+INDEX_SETTING_KEYS = ("main_vmix_name", "main_ip", "sub_vmix_name", "sub_ip", "app_mode")
+
+def _encode(data):
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+class ProfileStore:
+    """방송 환경별 프로필(설정 + 레일 구성)을 profiles/ 폴더에 저장합니다.
+
+    - index.json에는 이름과 메타데이터(IP, 레일 수 등)만 있어 시작 시 프로필 본문을 읽지 않습니다.
+    - 본문은 프로필을 활성화할 때 읽고, 최근 사용한 cache_size개는 메모리에 보관(LRU)합니다.
+    """
+
+    def __init__(self, directory=PROFILES_DIR, cache_size=4):
+        self.directory = directory
+        self.cache_size = cache_size
+        self.index_path = os.path.join(directory, INDEX_FILE)
+        self.index = self._load_index()
+        self._cache = OrderedDict()   # 이름 -> 본문 {"settings": ..., "lines": ...}
+
+    def _load_index(self):
+        if not os.path.exists(self.index_path):
+            return {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            app_logger.error(f"프로필 목록을 읽을 수 없습니다: {e}")
+            return {}
+
+    def _save_index(self):
+        write_atomic(self.index_path, _encode(self.index))
+
+    def _file_for(self, name):
+        # 파일 이름에 쓸 수 없는 문자는 바꾸고, 이름 충돌을 막기 위해 짧은 해시를 붙인다
+        slug = re.sub(r"[^\w\-]+", "_", name).strip("_")[:40] or "profile"
+        digest = hashlib.sha1(name.encode("utf-8")).hexdigest()[:8]
+        return f"{slug}-{digest}.json"
+
+    def names(self):
+        return sorted(self.index)
+
+    def metadata(self, name):
+        return self.index.get(name)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def _remember(self, name, body):
+        self._cache[name] = body
+        self._cache.move_to_end(name)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def load(self, name):
+        """프로필 본문을 반환합니다. 캐시에 없을 때만 파일을 읽습니다. 반환된 dict는 수정하지 마세요."""
+        body = self._cache.get(name)
+        if body is not None:
+            self._cache.move_to_end(name)
+            return body
+        meta = self.index.get(name)
+        if meta is None:
+            raise KeyError(name)
+        with open(os.path.join(self.directory, meta["file"]), "r", encoding="utf-8") as f:
+            body = json.load(f)
+        self._remember(name, body)
+        return body
+
+    def save(self, name, settings, lines):
+        os.makedirs(self.directory, exist_ok=True)
+        meta = self.index.get(name) or {"file": self._file_for(name)}
+        body = {"settings": settings, "lines": lines}
+        write_atomic(os.path.join(self.directory, meta["file"]), _encode(body))
+        meta.update({key: settings[key] for key in INDEX_SETTING_KEYS if key in settings})
+        meta["rail_count"] = len(lines)
+        meta["updated_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        self.index[name] = meta
+        self._save_index()
+        self._remember(name, body)
+
+    def delete(self, name):
+        meta = self.index.pop(name, None)
+        if meta is None:
+            return False
+        self._cache.pop(name, None)
+        self._save_index()
+        try:
+            os.remove(os.path.join(self.directory, meta["file"]))
+        except OSError as e:
+            app_logger.warning(f"프로필 파일 삭제 실패 ({name}): {e}")
+        return True
@@ -0,0 +1,151 @@
+import json
+import os
+import threading
+
+from src.model.settings import write_atomic
+from src.utils.logger import app_logger
+
+SNAPSHOT_FILE = "rails.snapshot.json"
+JOURNAL_FILE = "rails.journal"
+ROTATED_SUFFIX = ".1"
+
+class RailJournal:
+    """LineDataModel의 변경을 한 줄짜리 레코드로 추가 기록(append)하고, 시작할 때 스냅샷 + 저널로 복구합니다.
+
+    - 레코드: JSON 배열 한 줄 [순번, 레일 인덱스, 키, 값] (레일 수 변경은 인덱스가 null)
+    - 레코드마다 flush하므로 프로그램이 비정상 종료되어도 OS에 넘어간 기록은 남습니다.
+    - compact_every개가 쌓이면 현재 저널을 .1로 돌려놓고, 작업 스레드에서 스냅샷을 원자적으로 쓴 뒤 .1을 지웁니다.
+      스냅샷에는 마지막 순번이 기록되므로 중간에 종료되어도 중복 적용되지 않습니다.
+    """
+
+    def __init__(self, model, directory=".", compact_every=1000):
+        self.model = model
+        self.directory = directory
+        self.compact_every = compact_every
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+        self.journal_path = os.path.join(directory, JOURNAL_FILE)
+        self.seq = 0
+        self._since_compact = 0
+        self._file = None
+        self._compactor = None
+
+    # ----- 복구 -----
+
+    def _read_records(self, path, after_seq):
+        if not os.path.exists(path):
+            return []
+        records = []
+        good_end = 0     # 마지막으로 온전히 읽은 레코드가 끝나는 바이트 위치
+        newline = True
+        with open(path, "rb") as f:
+            for line_no, line in enumerate(f, 1):
+                try:
+                    seq, index, key, value = json.loads(line.decode("utf-8"))
+                except (ValueError, TypeError):
+                    # 기록 도중 종료되어 잘린 마지막 줄은 버린다
+                    app_logger.warning(f"저널 {path} {line_no}번째 줄을 읽을 수 없어 이후 기록을 건너뜁니다.")
+                    break
+                good_end += len(line)
+                newline = line.endswith(b"\n")
+                if seq > after_seq:
+                    records.append((seq, index, key, value))
+        if good_end != os.path.getsize(path) or not newline:
+            # 잘린 꼬리를 남겨 두면 다음 세션의 첫 레코드가 그 뒤에 붙어 함께 읽을 수 없게 되므로 잘라낸다
+            with open(path, "r+b") as f:
+                f.truncate(good_end)
+                if not newline:
+                    f.seek(good_end)
+                    f.write(b"\n")
+        return records
+
+    def recover(self):
+        """스냅샷과 저널로 모델을 복구하고, 다시 적용한 레코드 수를 반환합니다."""
+        snapshot_seq = 0
+        if os.path.exists(self.snapshot_path):
+            try:
+                with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                    snapshot = json.load(f)
+                self.model.load_lines(snapshot["lines"])
+                snapshot_seq = snapshot["seq"]
+            except (OSError, ValueError, KeyError) as e:
+                app_logger.error(f"레일 스냅샷을 읽을 수 없습니다: {e}")
+        self.seq = snapshot_seq
+        records = self._read_records(self.journal_path + ROTATED_SUFFIX, snapshot_seq)
+        records += self._read_records(self.journal_path, snapshot_seq)
+        for seq, index, key, value in records:
+            if index is None:
+                self.model.set_rail_count(value)
+            else:
+                self.model.update_line_data(index, key, value)
+            self.seq = max(self.seq, seq)
+        self._since_compact = len(records)
+        if records:
+            app_logger.info(f"레일 저널에서 변경 {len(records)}건을 복구했습니다.")
+        return len(records)
+
+    # ----- 기록 -----
+
+    def attach(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self._file = open(self.journal_path, "a", encoding="utf-8")
+        self.model.subscribe(self.on_model_changed)
+
+    def on_model_changed(self, index, key, value):
+        if key == "load":
+            # 전체 교체는 레코드 대신 바로 스냅샷으로 남긴다. 이전 스냅샷을 쓰는 중이어도 건너뛰면
+            # 이후 레코드가 교체 전 스냅샷 위에 적용되므로, 이전 작업이 끝나기를 기다렸다가 반드시 새로 쓴다
+            self.compact(force=True)
+            return
+        if key == "rail_count":
+            value = int(value)
+        self.seq += 1
+        self._file.write(json.dumps([self.seq, index, key, value], ensure_ascii=False, separators=(",", ":")))
+        self._file.write("\n")
+        self._file.flush()
+        self._since_compact += 1
+        if self._since_compact >= self.compact_every:
+            self.compact()
+
+    def compact(self, wait=False, force=False):
+        """현재 모델 상태를 스냅샷으로 저장하고 저널을 비웁니다.
+
+        이전 스냅샷을 저장하는 중이면 건너뛰며, force/wait이면 그 작업이 끝난 뒤 저장합니다. wait이면 이번 저장까지 기다립니다.
+        """
+        if self._compactor is not None and self._compactor.is_alive():
+            if not (wait or force):
+                return    # 이전 스냅샷 저장 중. 다음 기회에 다시 시도
+            self._compactor.join()
+        rotated = self.journal_path + ROTATED_SUFFIX
+        if self._file is not None:
+            self._file.close()
+            if os.path.exists(rotated):
+                # 이전 스냅샷 저장이 실패해 남은 기록이 있으면 잃지 않도록 이어 붙인다
+                with open(self.journal_path, "r", encoding="utf-8") as src, open(rotated, "a", encoding="utf-8") as dst:
+                    dst.write(src.read())
+                os.remove(self.journal_path)
+            else:
+                os.replace(self.journal_path, rotated)
+            self._file = open(self.journal_path, "a", encoding="utf-8")
+        snapshot = {"seq": self.seq, "fps": self.model.fps, "lines": self.model.to_dicts()}
+        self._since_compact = 0
+        self._compactor = threading.Thread(target=self._write_snapshot, args=(snapshot, rotated), name="rail-journal", daemon=True)
+        self._compactor.start()
+        if wait:
+            self._compactor.join()
+
+    def _write_snapshot(self, snapshot, rotated):
+        try:
+            data = json.dumps(snapshot, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            write_atomic(self.snapshot_path, data)
+            if os.path.exists(rotated):
+                os.remove(rotated)
+            app_logger.debug(f"레일 스냅샷 저장 (순번 {snapshot['seq']}, 레일 {len(snapshot['lines'])}개)")
+        except (OSError, TypeError, ValueError) as e:
+            app_logger.error(f"레일 스냅샷 저장 오류: {e}")
+
+    def close(self):
+        self.model.unsubscribe(self.on_model_changed)
+        if self._file is not None:
+            self.compact(wait=True)
+            self._file.close()
+            self._file = None
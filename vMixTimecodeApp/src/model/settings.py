@@ -1,17 +1,121 @@
 import json
 import os
+import shutil
+import threading
+import time
+
+from src.utils.logger import app_logger
 
 SETTINGS_FILE = "settings.json"
+BACKUP_SUFFIX = ".bak"
 
-def save_settings(settings):
-    with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-        json.dump(settings, f, indent=2, ensure_ascii=False)
+def write_atomic(path, data):
+    # 임시 파일에 모두 쓴 뒤 이름을 바꾸므로, 쓰는 도중 종료되어도 기존 파일은 온전히 남는다
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    if os.path.exists(path):
+        # 직전 정상본을 백업으로 복사해 보관 (원자적으로 쓴 파일이므로 항상 완전한 JSON).
+        # 이름을 옮기면 교체 전까지 원본이 없는 순간이 생기므로 복사하고, 교체는 os.replace 한 번으로 끝낸다
+        shutil.copy2(path, path + BACKUP_SUFFIX)
+    os.replace(tmp_path, path)
 
-def load_settings():
-    if os.path.exists(SETTINGS_FILE):
-        with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-            try:
-                return json.load(f)
-            except json.JSONDecodeError:
-                return {}
+def save_settings(settings, path=SETTINGS_FILE):
+    data = json.dumps(settings, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    write_atomic(path, data)
+
+def _read_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def load_settings(path=SETTINGS_FILE):
+    for candidate in (path, path + BACKUP_SUFFIX):
+        if not os.path.exists(candidate):
+            continue
+        try:
+            settings = _read_json(candidate)
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError) as e:
+            app_logger.error(f"설정 파일을 읽을 수 없습니다 ({candidate}): {e}")
+            if candidate == path:
+                # 손상된 파일이 다음 저장 때 정상 백업을 덮어쓰지 않도록 옆으로 치워 둔다
+                try:
+                    os.replace(path, path + ".corrupt")
+                except OSError:
+                    pass
+            continue
+        if candidate != path:
+            app_logger.warning(f"설정 파일이 손상되어 백업({candidate})에서 불러왔습니다.")
+        return settings
     return {}
+
+class SettingsPersister:
+    """설정 저장 요청을 모아(debounce) 작업 스레드에서 원자적으로 저장합니다.
+
+    짧은 시간에 여러 번 요청하면 마지막 설정만 한 번 저장합니다. 계속 변경되더라도
+    max_delay 안에는 반드시 한 번 저장합니다. schedule()에 넘긴 dict는 이후 수정하지 않아야 합니다.
+    """
+
+    def __init__(self, path=SETTINGS_FILE, delay=0.5, max_delay=5.0):
+        self.path = path
+        self.delay = delay
+        self.max_delay = max_delay
+        self._cond = threading.Condition()
+        self._pending = None
+        self._first_at = None     # 아직 저장되지 않은 첫 요청 시각
+        self._last_at = None      # 마지막 요청 시각
+        self._writing = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="settings-writer", daemon=True)
+        self._thread.start()
+
+    def schedule(self, settings):
+        with self._cond:
+            now = time.monotonic()
+            if self._pending is None:
+                self._first_at = now
+            self._pending = settings
+            self._last_at = now
+            self._cond.notify()
+
+    def _due_at(self):
+        return min(self._last_at + self.delay, self._first_at + self.max_delay)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed and (self._pending is None or time.monotonic() < self._due_at()):
+                    self._cond.wait(None if self._pending is None else max(self._due_at() - time.monotonic(), 0))
+                if self._pending is None:
+                    return    # 종료 요청, 남은 작업 없음
+                settings, self._pending = self._pending, None
+                self._writing = True
+            try:
+                save_settings(settings, self.path)
+                app_logger.debug("설정 파일을 저장했습니다.")
+            except (OSError, TypeError, ValueError) as e:
+                app_logger.error(f"설정 저장 오류: {e}")
+            with self._cond:
+                self._writing = False
+                self._cond.notify_all()
+
+    def flush(self, timeout=None):
+        """대기 중인 저장을 바로 실행하고 끝날 때까지 기다립니다."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            if self._pending is not None:
+                self._first_at = self._last_at = time.monotonic() - self.max_delay
+                self._cond.notify_all()
+            while self._pending is not None or self._writing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout=5.0):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
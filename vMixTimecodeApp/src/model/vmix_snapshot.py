@@ -0,0 +1,140 @@
+import time
+import xml.etree.ElementTree as ET
+from xml.parsers import expat
+
+from src.utils.timecode import format_seconds
+
+NO_TIMECODE = "--:--:--"
+
+def format_position(position_ms):
+    """vMix 인풋 position(ms)을 'HH:MM:SS' 문자열로 변환합니다."""
+    return format_seconds(int(position_ms) // 1000)
+
+def _to_int(value, default=0):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+class VmixInput:
+    __slots__ = ("number", "state", "position", "duration")
+
+    def __init__(self, number, state="", position=0, duration=0):
+        self.number = number
+        self.state = state
+        self.position = position   # ms
+        self.duration = duration   # ms
+
+    def __eq__(self, other):
+        if not isinstance(other, VmixInput):
+            return NotImplemented
+        return (self.number, self.state, self.position, self.duration) == \
+            (other.number, other.state, other.position, other.duration)
+
+    def __repr__(self):
+        return f"VmixInput({self.number}, {self.state!r}, {self.position}, {self.duration})"
+
+class VmixSnapshot:
+    """한 번의 폴링에서 얻은 vMix 상태 중 앱이 사용하는 필드만 담은 객체입니다."""
+    __slots__ = ("active", "preview", "inputs", "captured_at")
+
+    def __init__(self, active=None, preview=None, inputs=None, captured_at=None):
+        self.active = active       # 액티브 인풋 번호
+        self.preview = preview     # 프리뷰 인풋 번호
+        self.inputs = inputs if inputs is not None else {}  # 번호 -> VmixInput
+        self.captured_at = captured_at if captured_at is not None else time.monotonic()
+
+    @property
+    def active_input(self):
+        return self.inputs.get(self.active)
+
+    @property
+    def position_ms(self):
+        inp = self.active_input
+        return inp.position if inp is not None else None
+
+    @property
+    def timecode(self):
+        position = self.position_ms
+        return format_position(position) if position is not None else NO_TIMECODE
+
+    def __repr__(self):
+        return f"VmixSnapshot(active={self.active}, preview={self.preview}, inputs={len(self.inputs)})"
+
+class _ParseDone(Exception):
+    pass
+
+class VmixStateParser:
+    """vMix 상태 XML을 조각 단위로 받아 필요한 필드만 뽑아내는 스트리밍 파서입니다.
+
+    Element 트리를 만들지 않고 expat 콜백에서 <input> 속성과 <preview>/<active> 값만 읽습니다.
+    vMix XML에서는 <inputs> 다음에 루트의 <preview>, <active>가 나오므로
+    <active>가 닫히면 나머지(오버레이 이후의 오디오, 트랜지션, mix 등)는 파싱하지 않습니다.
+    """
+
+    def __init__(self):
+        self._parser = expat.ParserCreate()
+        self._parser.buffer_text = True
+        self._parser.StartElementHandler = self._on_start
+        self._capture = None
+        self._text = []
+        self.inputs = {}
+        self.active = None
+        self.preview = None
+        self.done = False
+
+    def _on_start(self, name, attrs):
+        if name == "input":
+            number = _to_int(attrs.get("number"), None)
+            if number is not None:
+                self.inputs[number] = VmixInput(
+                    number,
+                    attrs.get("state", ""),
+                    _to_int(attrs.get("position")),
+                    _to_int(attrs.get("duration")),
+                )
+        elif self._capture is None and (
+            (name == "preview" and self.preview is None) or name == "active"
+        ):
+            # 값을 읽는 동안에만 텍스트/종료 콜백을 연결해 콜백 호출 수를 최소화
+            self._capture = name
+            self._text = []
+            self._parser.CharacterDataHandler = self._text.append
+            self._parser.EndElementHandler = self._on_end
+
+    def _on_end(self, name):
+        if name != self._capture:
+            return
+        value = _to_int("".join(self._text).strip(), None)
+        self._parser.CharacterDataHandler = None
+        self._parser.EndElementHandler = None
+        self._capture = None
+        if name == "preview":
+            self.preview = value
+        else:
+            self.active = value
+            self.done = True
+            raise _ParseDone()
+
+    def feed(self, data):
+        """데이터 조각을 넣고, 필요한 필드를 모두 찾았으면 True를 반환합니다."""
+        if self.done:
+            return True
+        try:
+            self._parser.Parse(data, False)
+        except _ParseDone:
+            pass
+        except expat.ExpatError as e:
+            raise ET.ParseError(str(e)) from e
+        return self.done
+
+    def snapshot(self):
+        return VmixSnapshot(self.active, self.preview, self.inputs)
+
+def parse_vmix_state(data, chunk_size=16384):
+    """bytes/str 형태의 vMix 상태 XML 전체에서 VmixSnapshot을 만듭니다."""
+    parser = VmixStateParser()
+    for offset in range(0, len(data), chunk_size):
+        if parser.feed(data[offset:offset + chunk_size]):
+            break
+    return parser.snapshot()
@@ -0,0 +1,96 @@
+from src.utils.logger import app_logger
+
+# 구독 가능한 변경 이벤트 (콜백 시그니처: callback(server, old, new))
+EVENT_SNAPSHOT = "snapshot"                      # 매 스냅샷 (old/new: VmixSnapshot, 시계 동기화용)
+EVENT_ACTIVE_CHANGED = "active_changed"          # 액티브 인풋 번호 변경
+EVENT_PREVIEW_CHANGED = "preview_changed"        # 프리뷰 인풋 번호 변경
+EVENT_TIMECODE_SECOND = "timecode_second"        # 표시 타임코드(HH:MM:SS)의 초 단위 변경
+EVENT_INPUTS_CHANGED = "inputs_changed"          # 인풋 추가/삭제 또는 상태/길이 변경 (new: 바뀐 번호 집합)
+EVENT_CONNECTION_LOST = "connection_lost"        # 연결 끊김 (new: 오류 메시지)
+EVENT_CONNECTION_RESTORED = "connection_restored"
+
+def diff_snapshots(old, new):
+    """두 VmixSnapshot의 필드별 차이를 {필드: (이전 값, 새 값)} 형태로 반환합니다."""
+    changes = {}
+    old_active = old.active if old is not None else None
+    old_preview = old.preview if old is not None else None
+    old_timecode = old.timecode if old is not None else None
+    if old_active != new.active:
+        changes["active"] = (old_active, new.active)
+    if old_preview != new.preview:
+        changes["preview"] = (old_preview, new.preview)
+    timecode = new.timecode
+    if old_timecode != timecode:
+        changes["timecode"] = (old_timecode, timecode)
+
+    # position은 재생 중 매번 바뀌므로 인풋 비교에서는 구성/상태/길이만 본다
+    old_inputs = old.inputs if old is not None else {}
+    changed_inputs = set(old_inputs.keys() ^ new.inputs.keys())
+    for number, inp in new.inputs.items():
+        prev = old_inputs.get(number)
+        if prev is not None and (prev.state != inp.state or prev.duration != inp.duration):
+            changed_inputs.add(number)
+    if changed_inputs:
+        changes["inputs"] = (None, changed_inputs)
+    return changes
+
+_FIELD_EVENTS = {
+    "active": EVENT_ACTIVE_CHANGED,
+    "preview": EVENT_PREVIEW_CHANGED,
+    "timecode": EVENT_TIMECODE_SECOND,
+    "inputs": EVENT_INPUTS_CHANGED,
+}
+
+class VmixState:
+    """vMix 서버별 마지막 스냅샷을 보관하고, 이전 값과 달라진 필드에 대해서만 이벤트를 발생시킵니다."""
+
+    def __init__(self):
+        self.snapshots = {}    # 서버 이름 -> VmixSnapshot
+        self.connected = {}    # 서버 이름 -> bool
+        self._subscribers = {}
+
+    def subscribe(self, event, callback):
+        self._subscribers.setdefault(event, []).append(callback)
+
+    def unsubscribe(self, event, callback):
+        callbacks = self._subscribers.get(event, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def _emit(self, event, server, old, new):
+        for callback in list(self._subscribers.get(event, ())):
+            try:
+                callback(server, old, new)
+            except Exception as e:
+                app_logger.error(f"vMix 상태 이벤트 '{event}' 처리 오류: {e}")
+
+    def get(self, server):
+        return self.snapshots.get(server)
+
+    def is_connected(self, server):
+        return self.connected.get(server, False)
+
+    def update(self, server, snapshot):
+        """새 스냅샷을 반영하고 변경된 필드의 diff를 반환합니다."""
+        old = self.snapshots.get(server)
+        if old is not None and snapshot.captured_at < old.captured_at:
+            # 이미 반영한 상태보다 이전 시점의 스냅샷 (늦게 끝난 폴링 응답이 TCP 이벤트를 되돌리지 않도록)
+            return {}
+        if not self.connected.get(server, False):
+            self.connected[server] = True
+            self._emit(EVENT_CONNECTION_RESTORED, server, False, True)
+
+        self.snapshots[server] = snapshot
+        self._emit(EVENT_SNAPSHOT, server, old, snapshot)
+        changes = diff_snapshots(old, snapshot)
+        for field, (old_value, new_value) in changes.items():
+            self._emit(_FIELD_EVENTS[field], server, old_value, new_value)
+        return changes
+
+    def mark_disconnected(self, server, error=None):
+        """연결 실패를 반영합니다. 연결 상태가 바뀐 경우에만 이벤트가 발생합니다."""
+        if self.connected.get(server, True):
+            self.connected[server] = False
+            self._emit(EVENT_CONNECTION_LOST, server, True, error)
+            # 재연결 후 첫 스냅샷이 전체 변경으로 전달되도록 이전 스냅샷을 비움
+            self.snapshots.pop(server, None)
@@ -0,0 +1,139 @@
+import asyncio
+import concurrent.futures
+import queue
+import threading
+import time
+
+from src.utils.logger import app_logger
+from src.utils.metrics import registry
+
+class AsyncLoopThread:
+    """asyncio 이벤트 루프를 전용 백그라운드 스레드에서 실행합니다.
+
+    네트워크 I/O가 Tk 타이머 주기에 묶이지 않도록, 모든 코루틴과 vMix 관련 상태 변경은
+    이 스레드에서만 실행합니다. 다른 스레드에서는 submit()/call()로 작업을 넘깁니다.
+    루프는 생성 시 미리 만들어 두므로 start() 전에 넘긴 작업은 쌓여 있다가 시작하면 실행되고,
+    stop() 뒤에 넘긴 작업은 기록만 하고 버립니다.
+    """
+
+    def __init__(self, name="vmix-asyncio"):
+        self.name = name
+        self.loop = asyncio.new_event_loop()
+        self._thread = None
+        self._started = threading.Event()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        if self.loop.is_closed():
+            self.loop = asyncio.new_event_loop()
+        self._started.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        self._started.wait()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._started.set)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    def in_loop_thread(self):
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro):
+        """코루틴을 루프 스레드에서 실행하고 concurrent.futures.Future를 반환합니다."""
+        try:
+            return asyncio.run_coroutine_threadsafe(coro, self.loop)
+        except RuntimeError as e:
+            # 이미 종료된 루프: 코루틴은 닫고 실패한 Future를 돌려준다
+            coro.close()
+            app_logger.warning(f"비동기 루프가 종료되어 작업을 실행하지 않습니다: {getattr(coro, '__qualname__', coro)}")
+            future = concurrent.futures.Future()
+            future.set_exception(e)
+            return future
+
+    def call(self, callback, *args):
+        """루프 스레드에서 callback을 실행합니다. 이미 루프 스레드라면 바로 호출합니다."""
+        if self.in_loop_thread():
+            return callback(*args)
+        try:
+            self.loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            app_logger.warning(f"비동기 루프가 종료되어 작업을 실행하지 않습니다: {getattr(callback, '__qualname__', callback)}")
+        return None
+
+    def stop(self, timeout=3.0):
+        if not self.running:
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            app_logger.warning("비동기 루프 스레드가 제시간에 종료되지 않았습니다.")
+        self._thread = None
+
+class TkBridge:
+    """다른 스레드에서 요청한 UI 작업을 모아 두었다가 Tk 스레드에서 프레임마다 한 번에 실행합니다.
+
+    key를 지정한 작업은 같은 프레임 안에서 마지막 요청만 실행됩니다 (예: 타임코드 라벨 갱신).
+    """
+
+    def __init__(self, master, frame_ms=16):
+        self.master = master
+        self.frame_ms = frame_ms
+        self._queue = queue.SimpleQueue()
+        self._after_id = None
+        self._last_drain = None
+        # Tk 스레드 상태: 한 프레임의 UI 작업 실행 시간, 프레임이 예정보다 늦게 시작된 정도(다른 Tk 작업에 막힌 시간)
+        self._drain_ms = registry.histogram("ui.drain_ms")
+        self._frame_lag_ms = registry.histogram("ui.frame_lag_ms")
+        self._jobs = registry.gauge("ui.jobs_per_frame")
+
+    def post(self, callback, *args, key=None):
+        # Tk 위젯은 이 스레드에서 건드리지 않고 큐에만 넣는다 (스레드 안전)
+        self._queue.put((key, callback, args))
+
+    def start(self):
+        if self._after_id is None:
+            self._after_id = self.master.after(self.frame_ms, self._drain)
+
+    def stop(self):
+        if self._after_id is not None:
+            self.master.after_cancel(self._after_id)
+            self._after_id = None
+        self._last_drain = None
+
+    def _drain(self):
+        started = time.perf_counter()
+        if self._last_drain is not None:
+            self._frame_lag_ms.observe(max(0.0, (started - self._last_drain) * 1000 - self.frame_ms))
+        jobs = []      # 요청 순서대로 (key, callback, args)
+        latest = {}    # key -> 같은 프레임 안의 마지막 (callback, args)
+        while True:
+            try:
+                key, callback, args = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if key is not None:
+                seen = key in latest
+                latest[key] = (callback, args)
+                if seen:
+                    continue
+            jobs.append((key, callback, args))
+        for key, callback, args in jobs:
+            if key is not None:
+                callback, args = latest[key]
+            try:
+                callback(*args)
+            except Exception as e:
+                app_logger.error(f"UI 업데이트 오류: {e}")
+        self._jobs.set(len(jobs))
+        self._last_drain = time.perf_counter()
+        self._drain_ms.observe((self._last_drain - started) * 1000)
+        self._after_id = self.master.after(self.frame_ms, self._drain)
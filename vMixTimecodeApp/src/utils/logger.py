@@ -1,20 +1,68 @@
+import atexit
 import logging
 import os
+import queue
+import threading
+import time
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 LOG_DIR = "logs"
 LOG_FILE = os.path.join(LOG_DIR, f"app_{datetime.now().strftime('%Y%m%d')}.log")
+LOG_MAX_BYTES = 5 * 1024 * 1024   # 파일 하나의 최대 크기
+LOG_BACKUP_COUNT = 5              # app_YYYYMMDD.log.1 ~ .5 까지 보관
 
 # Ensure log directory exists
 os.makedirs(LOG_DIR, exist_ok=True)
 
+class RateLimitFilter(logging.Filter):
+    """같은 메시지가 interval초 안에 burst번을 넘으면 생략하고, 다음에 기록될 때 생략한 횟수를 덧붙입니다."""
+
+    def __init__(self, interval=5.0, burst=3, max_keys=1024):
+        super().__init__()
+        self.interval = interval
+        self.burst = burst
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._seen = {}    # (레벨, 메시지) -> [구간 시작 시각, 구간 내 기록 수, 생략 수]
+
+    def filter(self, record):
+        key = (record.levelno, record.getMessage())
+        now = time.monotonic()
+        with self._lock:
+            state = self._seen.get(key)
+            if state is None or now - state[0] >= self.interval:
+                suppressed = state[2] if state is not None else 0
+                if len(self._seen) >= self.max_keys:
+                    self._seen = {k: v for k, v in self._seen.items() if now - v[0] < self.interval}
+                self._seen[key] = [now, 1, 0]
+                if suppressed:
+                    record.msg = f"{record.getMessage()} (직전 {self.interval:.0f}초 동안 {suppressed}회 생략)"
+                    record.args = None
+                return True
+            state[1] += 1
+            if state[1] <= self.burst:
+                return True
+            state[2] += 1
+            return False
+
+_listener_started = False   # setup_logging에서 리스너를 시작했는지 (stop은 한 번만 불러야 함)
+
+def shutdown_logging():
+    """리스너 스레드를 멈추고 큐에 남은 로그를 모두 기록합니다. 여러 번 불러도 안전합니다."""
+    global _listener_started
+    if _listener_started:
+        _listener_started = False
+        log_listener.stop()
+
 def setup_logging():
+    global _listener_started
     logger = logging.getLogger('vMixTimecodeApp')
     logger.setLevel(logging.INFO)
 
-    # Create handlers
+    # Create handlers (실제 출력은 리스너 스레드에서 처리)
     c_handler = logging.StreamHandler() # Console handler
-    f_handler = logging.FileHandler(LOG_FILE, encoding='utf-8') # File handler
+    f_handler = RotatingFileHandler(LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8') # File handler
 
     # Set levels
     c_handler.setLevel(logging.INFO)
@@ -26,10 +74,17 @@ def setup_logging():
     c_handler.setFormatter(c_format)
     f_handler.setFormatter(f_format)
 
-    # Add handlers to the logger
-    logger.addHandler(c_handler)
-    logger.addHandler(f_handler)
+    # 호출한 스레드(UI/asyncio)는 큐에 넣기만 하고, 디스크/콘솔 쓰기는 리스너 스레드가 담당
+    log_queue = queue.SimpleQueue()
+    q_handler = QueueHandler(log_queue)
+    q_handler.addFilter(RateLimitFilter())
+    logger.addHandler(q_handler)
+
+    listener = QueueListener(log_queue, c_handler, f_handler, respect_handler_level=True)
+    listener.start()
+    _listener_started = True
+    atexit.register(shutdown_logging) # 종료 시 큐에 남은 로그를 모두 기록
 
-    return logger
+    return logger, listener
 
-app_logger = setup_logging()
+app_logger, log_listener = setup_logging()
@@ -0,0 +1,214 @@
+import json
+import threading
+import time
+from bisect import bisect_left
+
+# 지연 시간(ms)용 기본 버킷 경계. 마지막 버킷(+Inf)은 자동으로 추가됨
+DEFAULT_LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 33, 50, 100, 250, 500, 1000, 2500)
+METRICS_HTTP_PORT = 8199
+
+# 매 틱마다 불리므로 갱신 경로에는 잠금을 두지 않는다 (GIL 아래에서 드물게 한 건이 누락될 수 있으나 진단용으로는 충분)
+
+class Counter:
+    __slots__ = ("name", "labels", "value")
+    kind = "counter"
+
+    def __init__(self, name, labels=()):
+        self.name = name
+        self.labels = labels
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+    def snapshot(self):
+        return {"value": self.value}
+
+class Gauge:
+    __slots__ = ("name", "labels", "value")
+    kind = "gauge"
+
+    def __init__(self, name, labels=()):
+        self.name = name
+        self.labels = labels
+        self.value = 0
+
+    def set(self, value):
+        self.value = value
+
+    def inc(self, amount=1):
+        self.value += amount
+
+    def dec(self, amount=1):
+        self.value -= amount
+
+    def snapshot(self):
+        return {"value": self.value}
+
+class Histogram:
+    """고정 버킷 히스토그램. 값 하나를 기록하는 비용은 bisect 한 번과 덧셈 몇 번입니다."""
+    __slots__ = ("name", "labels", "bounds", "counts", "count", "total", "max", "last")
+    kind = "histogram"
+
+    def __init__(self, name, labels=(), bounds=DEFAULT_LATENCY_BUCKETS_MS):
+        self.name = name
+        self.labels = labels
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = None
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.last = value
+        if value > self.max:
+            self.max = value
+
+    def time(self):
+        """with 블록의 실행 시간을 ms 단위로 기록합니다."""
+        return _Timer(self)
+
+    def percentile(self, q):
+        """버킷 경계로 추정한 q 백분위 값. 마지막 버킷에 걸리면 최댓값을 반환합니다."""
+        if self.count == 0:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return self.bounds[i] if i < len(self.bounds) else self.max
+        return self.max
+
+    def reset(self):
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = None
+
+    def snapshot(self):
+        counts = list(self.counts)
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "max": self.max,
+            "last": self.last,
+            "buckets": {("+Inf" if i == len(self.bounds) else str(self.bounds[i])): c for i, c in enumerate(counts)},
+        }
+
+class _Timer:
+    __slots__ = ("histogram", "started")
+
+    def __init__(self, histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe((time.perf_counter() - self.started) * 1000)
+        return False
+
+def _label_key(labels):
+    return tuple(sorted(labels.items())) if labels else ()
+
+class MetricsRegistry:
+    """이름(+레이블)별 지표를 한 곳에 모읍니다. 같은 이름으로 다시 요청하면 같은 객체를 돌려줍니다.
+
+    핫 패스에서는 지표 객체를 미리 받아 두고 observe/inc만 호출하는 것을 권장합니다.
+    """
+
+    def __init__(self):
+        self._metrics = {}   # (이름, 레이블) -> 지표
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def _get(self, cls, name, labels, **kwargs):
+        key = (name, _label_key(labels))
+        metric = self._metrics.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(key)
+                if metric is None:
+                    metric = self._metrics[key] = cls(name, key[1], **kwargs)
+        return metric
+
+    def counter(self, name, labels=None):
+        return self._get(Counter, name, labels)
+
+    def gauge(self, name, labels=None):
+        return self._get(Gauge, name, labels)
+
+    def histogram(self, name, labels=None, bounds=DEFAULT_LATENCY_BUCKETS_MS):
+        return self._get(Histogram, name, labels, bounds=bounds)
+
+    def metrics(self):
+        with self._lock:
+            return sorted(self._metrics.values(), key=lambda m: (m.name, m.labels))
+
+    def snapshot(self):
+        """JSON으로 내보낼 수 있는 전체 지표 목록을 반환합니다."""
+        return {
+            "uptime_s": round(time.time() - self.started_at, 1),
+            "metrics": [
+                dict(name=m.name, type=m.kind, labels=dict(m.labels), **m.snapshot())
+                for m in self.metrics()
+            ],
+        }
+
+    def reset(self):
+        for metric in self.metrics():
+            if isinstance(metric, Histogram):
+                metric.reset()
+
+registry = MetricsRegistry()
+
+class MetricsHttpServer:
+    """registry.snapshot()을 http://host:port/metrics 에 JSON으로 내보내는 로컬 전용 서버입니다."""
+
+    def __init__(self, metrics_registry=registry, host="127.0.0.1", port=METRICS_HTTP_PORT):
+        # http.server는 이 기능을 켰을 때만 불러온다 (시작 시간 절약)
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0].rstrip("/") not in ("", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = json.dumps(metrics_registry.snapshot(), ensure_ascii=False).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def address(self):
+        return self._httpd.server_address
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="metrics-http", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,103 @@
+import os
+import sys
+import time
+
+# 이 모듈은 main.py에서 가장 먼저 불러오므로 표준 라이브러리 외에는 임포트하지 않는다 (로거도 보고 시점에 불러옴)
+
+STARTUP_PROFILE_ENV = "VMIX_STARTUP_PROFILE"
+
+class _TimedLoader:
+    """모듈 실행(exec_module) 시간을 재는 로더 래퍼. 나머지 속성은 원래 로더로 넘긴다."""
+
+    def __init__(self, loader, name, times):
+        self._loader = loader
+        self._name = name
+        self._times = times
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        started = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._times[self._name] = time.perf_counter() - started
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+class ImportTimer:
+    """sys.meta_path에 끼워 넣어 모듈별 임포트 시간(하위 임포트 포함)을 기록합니다."""
+
+    def __init__(self):
+        self.times = {}    # 모듈 이름 -> 초 (하위 모듈 임포트 포함 누적 시간)
+
+    def install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, name, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, name, self.times)
+        return spec
+
+    def top(self, count=20):
+        return sorted(self.times.items(), key=lambda item: item[1], reverse=True)[:count]
+
+class StartupProfile:
+    """시작 단계별 경과 시간과 첫 창 표시까지의 시간(time-to-first-window)을 기록합니다.
+
+    VMIX_STARTUP_PROFILE=1 이거나 --profile-startup 인자가 있으면 모듈 임포트 시간도 함께 기록합니다.
+    """
+
+    def __init__(self, started_at=None, budget_ms=1500, import_timing=None):
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        self.budget_ms = budget_ms
+        self.marks = []    # (단계 이름, 시작 후 경과 ms)
+        if import_timing is None:
+            import_timing = os.environ.get(STARTUP_PROFILE_ENV) == "1" or "--profile-startup" in sys.argv
+        self.import_timer = ImportTimer() if import_timing else None
+        if self.import_timer is not None:
+            self.import_timer.install()
+        self.first_window_ms = None
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.started_at) * 1000
+
+    def mark(self, label):
+        self.marks.append((label, self.elapsed_ms()))
+
+    def watch_first_window(self, root):
+        """root 창이 처음 화면에 나타나면 시간을 기록하고 보고서를 남깁니다."""
+        def on_map(event):
+            if event.widget is not root or self.first_window_ms is not None:
+                return
+            self.first_window_ms = self.elapsed_ms()
+            self.mark("first_window")
+            root.after_idle(self.report)
+        root.bind("<Map>", on_map, add="+")
+
+    def report(self):
+        from src.utils.logger import app_logger
+        if self.import_timer is not None:
+            self.import_timer.uninstall()
+        steps = ", ".join(f"{label} {ms:.0f}ms" for label, ms in self.marks)
+        app_logger.info(f"시작 단계: {steps}")
+        if self.import_timer is not None:
+            for name, seconds in self.import_timer.top():
+                app_logger.info(f"  임포트 {seconds * 1000:7.1f}ms  {name}")
+        if self.first_window_ms is not None and self.first_window_ms > self.budget_ms:
+            app_logger.warning(f"첫 창 표시까지 {self.first_window_ms:.0f}ms 걸렸습니다 (목표 {self.budget_ms}ms).")
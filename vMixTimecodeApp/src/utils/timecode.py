@@ -0,0 +1,123 @@
+from array import array
+from functools import lru_cache
+
+# 타임코드는 00:00:00:00부터 센 프레임 수(int)로 다룹니다.
+# 문자열 변환은 자주 같은 값이 반복되므로(레일 시간, 초 단위 표시) 캐시합니다.
+
+DEFAULT_FPS = 30
+NO_FRAMES = -1          # 타임코드 형식이 아닌 값
+HOURS_PER_DAY = 24
+
+def _drop_count(fps, drop_frame):
+    # 드롭 프레임은 29.97(30)/59.94(60)만 정의됨: 10분 단위가 아닌 매 분 첫 2(4)개 프레임 번호를 건너뜀
+    if not drop_frame:
+        return 0
+    if fps % 30 != 0:
+        raise ValueError(f"드롭 프레임은 30/60fps에서만 사용할 수 있습니다: {fps}")
+    return fps // 15
+
+def frames_per_day(fps=DEFAULT_FPS, drop_frame=False):
+    return fields_to_frames(HOURS_PER_DAY, 0, 0, 0, fps, drop_frame)
+
+def fields_to_frames(h, m, s, f=0, fps=DEFAULT_FPS, drop_frame=False):
+    frames = (h * 3600 + m * 60 + s) * fps + f
+    drop = _drop_count(fps, drop_frame)
+    if drop:
+        total_minutes = h * 60 + m
+        frames -= drop * (total_minutes - total_minutes // 10)
+    return frames
+
+def frames_to_fields(frames, fps=DEFAULT_FPS, drop_frame=False):
+    """프레임 수를 (시, 분, 초, 프레임)으로 변환합니다."""
+    drop = _drop_count(fps, drop_frame)
+    if drop:
+        per_10min = fps * 600 - drop * 9
+        per_min = fps * 60 - drop
+        tens, rem = divmod(frames, per_10min)
+        frames += drop * 9 * tens
+        if rem > drop:
+            frames += drop * ((rem - drop) // per_min)
+    seconds, f = divmod(frames, fps)
+    h, rem = divmod(seconds, 3600)
+    m, s = divmod(rem, 60)
+    return h, m, s, f
+
+def real_fps(fps=DEFAULT_FPS, drop_frame=False):
+    # 드롭 프레임 타임코드는 실제로 fps * 1000/1001 속도로 진행
+    return fps * 1000 / 1001 if drop_frame else fps
+
+def frames_to_seconds(frames, fps=DEFAULT_FPS, drop_frame=False):
+    return frames / real_fps(fps, drop_frame)
+
+def seconds_to_frames(seconds, fps=DEFAULT_FPS, drop_frame=False):
+    return int(seconds * real_fps(fps, drop_frame))
+
+def milliseconds_to_frames(position_ms, fps=DEFAULT_FPS, drop_frame=False):
+    return int(int(position_ms) * real_fps(fps, drop_frame) // 1000)
+
+@lru_cache(maxsize=8192)
+def parse_timecode(text, fps=DEFAULT_FPS, drop_frame=False):
+    """'HH:MM:SS' 또는 'HH:MM:SS:FF'('HH:MM:SS;FF') 문자열을 프레임 수로 변환합니다. 형식이 아니면 None."""
+    if len(text) not in (8, 11) or text[2] != ":" or text[5] != ":":
+        return None
+    h, m, s = text[0:2], text[3:5], text[6:8]
+    f = "0"
+    if len(text) == 11:
+        if text[8] not in ":;":
+            return None
+        f = text[9:11]
+    if not (h.isdigit() and m.isdigit() and s.isdigit() and f.isdigit()):
+        return None
+    h, m, s, f = int(h), int(m), int(s), int(f)
+    if h >= HOURS_PER_DAY or m > 59 or s > 59 or f >= fps:
+        return None
+    drop = _drop_count(fps, drop_frame)
+    if drop and s == 0 and m % 10 != 0 and f < drop:
+        return None    # 드롭 프레임에서 존재하지 않는 번호
+    return fields_to_frames(h, m, s, f, fps, drop_frame)
+
+@lru_cache(maxsize=8192)
+def format_timecode(frames, fps=DEFAULT_FPS, drop_frame=False, with_frames=None):
+    """프레임 수를 타임코드 문자열로 변환합니다. with_frames=None이면 프레임 값이 있을 때만 프레임을 붙입니다."""
+    h, m, s, f = frames_to_fields(frames, fps, drop_frame)
+    text = f"{h % HOURS_PER_DAY:02d}:{m:02d}:{s:02d}"
+    if with_frames or (with_frames is None and f):
+        text += f"{';' if drop_frame else ':'}{f:02d}"
+    return text
+
+def format_seconds(seconds):
+    """초를 'HH:MM:SS'로 변환합니다 (표시용, 24시간 순환)."""
+    return format_timecode(int(seconds) * DEFAULT_FPS, DEFAULT_FPS, False, False)
+
+def parse_column(texts, fps=DEFAULT_FPS, drop_frame=False):
+    """레일 시간 열 전체를 프레임 배열로 변환합니다. 형식이 아닌 값은 NO_FRAMES."""
+    result = array("i")
+    for text in texts:
+        frames = parse_timecode(text, fps, drop_frame)
+        result.append(NO_FRAMES if frames is None else frames)
+    return result
+
+def format_column(frames_column, fps=DEFAULT_FPS, drop_frame=False):
+    return [format_timecode(frames, fps, drop_frame) if frames != NO_FRAMES else "" for frames in frames_column]
+
+def compare_timecodes(a, b):
+    """a < b이면 -1, 같으면 0, a > b이면 1 (프레임 수 기준)."""
+    return (a > b) - (a < b)
+
+def timecode_diff(a, b, fps=DEFAULT_FPS, drop_frame=False, wrap=False):
+    """b - a 차이를 프레임으로 반환합니다. wrap=True이면 자정을 넘는 경우를 고려해 0 이상으로 맞춥니다."""
+    diff = b - a
+    if wrap:
+        diff %= frames_per_day(fps, drop_frame)
+    return diff
+
+def shift_field(frames, field, delta, fps=DEFAULT_FPS, drop_frame=False):
+    """타임코드의 한 필드(0=시, 1=분, 2=초, 3=프레임)만 delta만큼 바꿉니다. 다른 필드로 올림하지 않고 순환합니다."""
+    fields = list(frames_to_fields(frames, fps, drop_frame))
+    limits = (HOURS_PER_DAY, 60, 60, fps)
+    fields[field] = (fields[field] + delta) % limits[field]
+    h, m, s, f = fields
+    drop = _drop_count(fps, drop_frame)
+    if drop and s == 0 and m % 10 != 0 and f < drop:
+        f = drop
+    return fields_to_frames(h, m, s, f, fps, drop_frame)
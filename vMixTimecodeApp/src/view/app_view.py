@@ -1,25 +1,20 @@
 import tkinter as tk
-from tkinter import filedialog, simpledialog, messagebox
-import requests
-import xml.etree.ElementTree as ET
-import json
-import threading
-import queue
-import os
-from datetime import datetime
-from PIL import Image, ImageTk
-import concurrent.futures
-import time
-import math
-import keyboard
-import pyperclip
+from tkinter import simpledialog
 
 from src.model.settings import load_settings
 from src.model.line_data import LineDataModel # LineDataModel 임포트
-from src.view.ui_utils import StatusCircleBar, bind_widget_full_navigation
+from src.model.rail_journal import RailJournal
+from src.view.ui_utils import StatusCircleBar
+from src.view.error_feed import ErrorFeed
+from src.view.diagnostics_window import DiagnosticsWindow
+from src.view.preview_cache import PreviewCache, PreviewPanel, is_image_source
+from src.view.rail_grid import VirtualRailGrid, BUTTON_COLUMN
+from src.view.render_batcher import RenderBatcher
 
 from src.controller.app_controller import AppController # AppController 임포트
-from src.utils.logger import app_logger # 로거 임포트
+from src.controller.gto_logic import GTO_MODE
+from src.utils.timecode import DEFAULT_FPS
+from src.utils.logger import app_logger, shutdown_logging # 로거 임포트
 
 class LineMonitor:
     def __init__(self):
@@ -33,12 +28,23 @@ class ActiveTimecodeApp:
         master.configure(bg="black")
         
         self.settings = load_settings()
-        self.line_data_model = LineDataModel() # LineDataModel 인스턴스 생성
+        self.line_data_model = LineDataModel( # LineDataModel 인스턴스 생성 (레일 시간은 프레임 단위)
+            fps=self.settings.get("timecode_fps", DEFAULT_FPS),
+            drop_frame=self.settings.get("drop_frame", False),
+        )
+        # 마지막 스냅샷 + 저널로 레일 데이터 복구 후, 이후 변경은 저널에 바로 기록
+        self.rail_journal = RailJournal(self.line_data_model, self.settings.get("journal_dir", "."))
+        self.rail_journal.recover()
+        self.rail_journal.attach()
+        self.line_monitors = [LineMonitor() for _ in range(self.line_data_model.rail_count)]
+        self.renderer = RenderBatcher(master) # 색상 변경을 프레임 단위로 모아 변경분만 적용
         self.controller = AppController(self) # AppController 인스턴스 생성
         
         # ... (이전과 동일한 설정 로드 부분) ...
         self.main_vmix_name = self.settings.get("main_vmix_name", "M")
         self.main_ip = self.settings.get("main_ip", "127.0.0.1")
+        self.sub_vmix_name = self.settings.get("sub_vmix_name", "S")
+        self.sub_ip = self.settings.get("sub_ip", "")
         # ...
 
         # --- GTO-W 기능 추가 1: 모드 설정 변수 ---
@@ -60,8 +66,16 @@ class ActiveTimecodeApp:
         mode_menu.add_radiobutton(label="방송 진행용", variable=self.app_mode, value="방송 진행용")
         mode_menu.add_radiobutton(label="GTO-W 감시용", variable=self.app_mode, value="GTO-W 감시용")
         
+        # 프로필 메뉴 (목록은 index.json 기준, 본문은 선택 시 불러옴)
+        self.active_profile = tk.StringVar(value=self.settings.get("active_profile", ""))
+        self.profile_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="프로필", menu=self.profile_menu)
+        self.rebuild_profile_menu()
+
         settings_menu.add_separator()
         settings_menu.add_command(label="단축키 다시 등록하기", command=self.controller.reload_all_hotkeys) # 컨트롤러의 메서드 호출
+        settings_menu.add_command(label="진단 정보", command=self.open_diagnostics) # 폴링/파싱/검사/명령/UI 지연 시간
+        self.diagnostics_window = None
 
         # ... (이하 UI 구성 코드는 대부분 동일) ...
         # PanedWindow, left_frame, timecode_label 등...
@@ -75,8 +89,22 @@ class ActiveTimecodeApp:
         self.paned_window.add(self.left_frame, width=485)
         self.right_frame = tk.Frame(self.paned_window, bg="black")
         self.paned_window.add(self.right_frame)
+        # 오류는 모달 창 대신 오른쪽 목록에 쌓아서 표시 (연속 오류에도 화면이 멈추지 않음)
+        self.error_feed = ErrorFeed(self.right_frame)
+        self.error_feed.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=5)
+        # 선택한 레일의 프리뷰 (디코딩은 작업 스레드, PhotoImage 생성만 Tk 스레드에서)
+        self.preview_panel = PreviewPanel(self.right_frame)
+        self.preview_panel.pack(side=tk.TOP, padx=5, pady=5)
+        self.preview_cache = PreviewCache(self.controller.ui.post, loader=self.controller.load_preview)
         self.timecode_label = tk.Label(self.left_frame, text="--:--:--", font=("Helvetica", 36, "bold"), fg="#39FF14", bg="black", anchor="center")
         self.timecode_label.pack(pady=(5,1), fill=tk.X, padx=5)
+        self.status_bar = StatusCircleBar(
+            self.left_frame,
+            lambda: self.controller.vmix_status,
+            [(name, f"{name} vMix ({ip})") for name, ip in self.get_vmix_servers()],
+            renderer=self.renderer,
+        )
+        self.status_bar.pack(pady=(0, 5))
         # ... (나머지 UI)
         self.previous_timecode_label_text = ""
         self.target_header_labels = []
@@ -84,38 +112,174 @@ class ActiveTimecodeApp:
         self.rebuild_ui() # 이 부분에서 UI가 실제로 생성됩니다.
         # ... (기타 초기화)
         self.master.protocol("WM_DELETE_WINDOW", self.on_close)
-        self.controller.start_async_tasks() # 비동기 작업 시작
+        # 비동기 작업(네트워크 모듈 로드 포함)은 창이 처음 화면에 나타난 뒤 시작
+        self._map_binding = self.master.bind("<Map>", self._on_first_map, add="+")
+        self.master.after(1000, self.controller.start_async_tasks) # <Map>이 오지 않는 환경 대비 (중복 시작 안 함)
+
+    def _on_first_map(self, event):
+        if event.widget is not self.master:
+            return
+        self.master.unbind("<Map>", self._map_binding)
+        self.master.after_idle(self.controller.start_async_tasks)
 
     def rebuild_ui(self):
         # ... (기존 rebuild_ui 코드 시작)
         for widget in self.left_frame.winfo_children():
-            if widget not in [self.timecode_label]: # 필요한 위젯 제외하고 삭제
+            if widget not in [self.timecode_label, self.status_bar]: # 필요한 위젯 제외하고 삭제
                 widget.destroy()
 
-        self.line_entries = []
-        # ... (중략)
-        for i in range(self.line_data_model.rail_count): # self.rail_count 대신 model 사용
-            # ... (e_time, e_preview 등 다른 위젯 생성)
-            e_btn = tk.Entry(self.line_frame, width=3, justify='center', bg="#333", fg="white")
-            e_btn.insert(0, self.line_data_model.lines[i]["button"]) # self.lines 대신 model 사용
-            e_btn.grid(row=i+1, column=3, padx=1)
-            self.widget_matrix[i][3] = e_btn
+        self.controller.gto_validator.clear_colors() # 새 그리드는 기본 배경색으로 만들어짐
+        if len(self.line_monitors) != self.line_data_model.rail_count:
+            self.line_monitors = [LineMonitor() for _ in range(self.line_data_model.rail_count)]
+
+        # 레일 수와 상관없이 화면에 보이는 행만큼의 Entry만 만들고 스크롤 시 다시 연결
+        # (B열 수정 시 해당 GTO 블록만 다시 검사 - on_rail_edited 참고)
+        self.rail_grid = VirtualRailGrid(
+            self.left_frame, self.line_data_model, self.on_rail_edited, self.renderer, on_focus_row=self.show_rail_preview
+        )
+        self.rail_grid.pack(fill=tk.BOTH, expand=True)
+        self.widget_matrix = self.rail_grid.widget_matrix
+        self.apply_mode_to_grid()
+
+    def apply_mode_to_grid(self):
+        # B열(GTO 코드)은 GTO-W 감시용에서만 쓰므로 다른 모드에서는 입력과 방향키/Tab 이동에서 제외
+        rail_grid = getattr(self, "rail_grid", None)
+        if rail_grid is not None:
+            rail_grid.set_column_enabled(BUTTON_COLUMN, self.app_mode.get() == GTO_MODE)
+
+    def rebuild_profile_menu(self):
+        self.profile_menu.delete(0, tk.END)
+        self.profile_menu.add_command(label="현재 설정을 프로필로 저장...", command=self.ask_save_profile)
+        names = self.controller.profile_store.names()
+        if names:
+            self.profile_menu.add_separator()
+        for name in names:
+            meta = self.controller.profile_store.metadata(name)
+            label = f"{name}  ({meta.get('main_ip', '')}, 레일 {meta.get('rail_count', 0)}개)"
+            self.profile_menu.add_radiobutton(
+                label=label, variable=self.active_profile, value=name,
+                command=lambda name=name: self.controller.activate_profile(name),
+            )
+
+    def ask_save_profile(self):
+        name = simpledialog.askstring("프로필 저장", "프로필 이름:", initialvalue=self.active_profile.get(), parent=self.master)
+        if not name or not name.strip():
+            return
+        name = name.strip()
+        if self.controller.save_profile(name):
+            self.active_profile.set(name)
+            self.rebuild_profile_menu()
+
+    def apply_profile(self, settings, lines):
+        # 프로필의 서버 설정과 레일 구성을 화면에 반영
+        self.main_vmix_name = settings.get("main_vmix_name", self.main_vmix_name)
+        self.main_ip = settings.get("main_ip", self.main_ip)
+        self.sub_vmix_name = settings.get("sub_vmix_name", self.sub_vmix_name)
+        self.sub_ip = settings.get("sub_ip", self.sub_ip)
+        self.status_bar.update_labels([(name, f"{name} vMix ({ip})") for name, ip in self.get_vmix_servers()])
+
+        self.line_data_model.load_lines(lines)
+        self.line_monitors = [LineMonitor() for _ in range(self.line_data_model.rail_count)]
+        self.rail_grid.refresh() # 색은 GTO 검사기가 이전 상태와 비교해 바뀐 행만 다시 칠함
+
+        mode = settings.get("app_mode", self.app_mode.get())
+        if mode != self.app_mode.get():
+            self.app_mode.set(mode) # trace에서 검사/색 초기화
+        else:
+            self.controller.on_app_mode_change()
+
+    def get_widget_by_rowcol(self, row, col):
+        return self.rail_grid.get_widget_by_rowcol(row, col)
 
-            # --- GTO-W 기능 추가 3: B열 수정 시 검사 함수 호출 ---
-            e_btn.bind("<FocusOut>", lambda event, app=self: self.controller.validate_gto_logic_from_view(app)) # 컨트롤러의 메서드 호출
-            e_btn.bind("<Return>", lambda event, app=self: self.controller.validate_gto_logic_from_view(app)) # 컨트롤러의 메서드 호출
+    def on_rail_edited(self, line_index, key, value):
+        if key == "button":
+            self.controller.on_button_edited(line_index, value) # 컨트롤러의 메서드 호출
+        else:
+            self.line_data_model.update_line_data(line_index, key, value)
 
-            # ... (이하 나머지 위젯 생성 및 바인딩)
+    def get_vmix_servers(self):
+        # 상태를 확인할 vMix 서버 목록 [(이름, IP)] - 메인, 보조 순서 (IP가 비어 있으면 제외)
+        servers = [(self.main_vmix_name, self.main_ip)]
+        if self.sub_ip:
+            servers.append((self.sub_vmix_name, self.sub_ip))
+        return servers
+
+    def update_timecode_label(self, text):
+        # 이전과 같은 값이면 Label을 다시 설정하지 않음
+        if text == self.previous_timecode_label_text:
+            return
+        self.previous_timecode_label_text = text
+        self.timecode_label.config(text=text)
+
+    def set_button_color(self, line_index, color):
+        self.rail_grid.set_cell_color(line_index, BUTTON_COLUMN, color)
+
+    def run_line(self, line_index):
+        monitor = self.line_monitors[line_index]
+        monitor.running = True
+        monitor.executed = self.controller.schedule_line(line_index)
+
+    def stop_line(self, line_index):
+        self.line_monitors[line_index].running = False
+        self.controller.unschedule_line(line_index)
 
     def push_error(self, message):
-        # 기존 messagebox.showerror 대신 로깅 사용
+        # 기존 messagebox.showerror 대신 로깅 + 비모달 오류 목록 사용
         app_logger.error(message)
-        messagebox.showerror("오류", message) # 사용자에게도 표시
+        self.error_feed.push(message)
+
+    def preview_request(self, index):
+        # 레일의 프리뷰 값이 이미지 경로/URL이면 그것을, 아니면 인풋 번호로 vMix 스냅샷을 사용
+        line = self.line_data_model.get_line_data(index)
+        preview = str(line.get("preview", "")).strip()
+        if is_image_source(preview):
+            return ("file", preview), preview
+        vmix_input = str(line.get("input", "")).strip()
+        if vmix_input.isdecimal() and self.controller.can_snapshot_inputs():
+            return ("input", int(vmix_input)), ("vmix", self.main_ip, int(vmix_input))
+        return None, None
+
+    def show_rail_preview(self, index):
+        key, source = self.preview_request(index)
+        if key is None:
+            self.preview_panel.clear(f"{index+1}번 레일: 프리뷰 없음")
+            return
+        token = (index, key)
+        self.preview_panel.expect(token, f"{index+1}번 레일 프리뷰")
+        self.preview_cache.request(key, source, lambda photo: self.preview_panel.show(token, photo))
+
+    def on_vmix_inputs_changed(self, numbers):
+        # 상태가 바뀐 인풋의 스냅샷은 다음 요청 때 다시 가져옴. 지금 보고 있는 인풋이면 바로 갱신
+        for number in numbers:
+            self.preview_cache.invalidate(("input", number))
+        token = self.preview_panel.token
+        if token is not None and token[1][0] == "input" and token[1][1] in numbers:
+            self.show_rail_preview(token[0])
+
+    def on_hotkey_done(self, binding, ok, elapsed):
+        # 단축키 명령 결과를 화면에 반영 (명령은 이미 전송된 뒤)
+        if binding.rail is not None and binding.rail < len(self.line_monitors):
+            self.line_monitors[binding.rail].executed = ok
+        if ok:
+            app_logger.info(f"단축키 {binding} 실행 ({elapsed * 1000:.1f}ms)")
+        else:
+            self.push_error(f"단축키 {binding} 실행 실패")
+
+    def open_diagnostics(self):
+        # 이미 열려 있으면 앞으로 가져오기만 함
+        if self.diagnostics_window is not None and self.diagnostics_window.winfo_exists():
+            self.diagnostics_window.lift()
+            return
+        self.diagnostics_window = DiagnosticsWindow(self.master)
 
     def on_close(self):
         self.controller.stop_async_tasks() # 비동기 작업 중지
+        self.controller.settings_persister.close() # 대기 중인 설정 저장을 마친 뒤 종료
+        self.rail_journal.close() # 레일 스냅샷을 남기고 저널 정리
+        self.preview_cache.close()
         app_logger.info("애플리케이션을 종료합니다.")
         self.master.destroy()
+        shutdown_logging() # 큐에 남은 로그를 파일에 모두 기록
 
     # status_check_worker, get_connection_status 등은 AppController로 이동
     # ...
@@ -0,0 +1,65 @@
+import tkinter as tk
+
+from src.utils.metrics import Histogram, registry
+
+def _fmt(value):
+    return "-" if value is None else f"{value:.2f}"
+
+def format_metrics(metrics_registry=registry):
+    """지표를 고정 폭 표 형태의 줄 목록으로 만듭니다."""
+    lines = [f"{'지표':<40}{'횟수':>9}{'p50':>10}{'p99':>10}{'최대':>10}{'최근':>10}"]
+    values = []
+    for metric in metrics_registry.metrics():
+        labels = ",".join(f"{k}={v}" for k, v in metric.labels)
+        name = f"{metric.name}{{{labels}}}" if labels else metric.name
+        if isinstance(metric, Histogram):
+            lines.append(
+                f"{name:<40}{metric.count:>9}{_fmt(metric.percentile(50)):>10}{_fmt(metric.percentile(99)):>10}"
+                f"{_fmt(metric.max if metric.count else None):>10}{_fmt(metric.last):>10}"
+            )
+        else:
+            values.append(f"{name:<40}{metric.value:>9}")
+    if values:
+        lines.append("")
+        lines.extend(values)
+    return lines
+
+class DiagnosticsWindow(tk.Toplevel):
+    """지연 시간 히스토그램과 카운터를 주기적으로 보여주는 진단 창입니다. (히스토그램 단위: ms)"""
+
+    def __init__(self, master, metrics_registry=registry, interval_ms=500):
+        super().__init__(master, bg="black")
+        self.title("진단 정보")
+        self.registry = metrics_registry
+        self.interval_ms = interval_ms
+        self._after_id = None
+
+        toolbar = tk.Frame(self, bg="black")
+        toolbar.pack(fill=tk.X)
+        tk.Button(toolbar, text="초기화", command=self.reset, bg="#333333", fg="white", relief=tk.FLAT).pack(side=tk.RIGHT, padx=2, pady=2)
+        self.text = tk.Text(self, width=90, height=30, bg="#1A1A1A", fg="white", font=("Consolas", 10), wrap=tk.NONE)
+        self.text.pack(fill=tk.BOTH, expand=True)
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        self.refresh()
+
+    def refresh(self):
+        # 창을 열어 둔 동안에만 갱신 (지표 기록 자체에는 영향 없음)
+        content = "\n".join(format_metrics(self.registry))
+        if self.text.get("1.0", tk.END).rstrip("\n") != content:
+            self.text.config(state=tk.NORMAL)
+            self.text.delete("1.0", tk.END)
+            self.text.insert(tk.END, content)
+            self.text.config(state=tk.DISABLED)
+        self._after_id = self.after(self.interval_ms, self.refresh)
+
+    def reset(self):
+        self.registry.reset()
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+        self.refresh()
+
+    def close(self):
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        self.destroy()
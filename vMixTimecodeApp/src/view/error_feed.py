@@ -0,0 +1,57 @@
+import time
+import tkinter as tk
+from collections import deque
+
+class ErrorFeed(tk.Frame):
+    """오류 메시지를 모달 창 대신 화면 한쪽 목록에 쌓아 보여줍니다.
+
+    - 직전과 같은 메시지는 새 줄을 만들지 않고 횟수만 늘립니다.
+    - 최근 max_items개만 보관하며, 목록 갱신은 프레임마다 한 번만 합니다.
+    """
+
+    def __init__(self, master, max_items=200, frame_ms=50, *args, **kwargs):
+        super().__init__(master, bg="black", *args, **kwargs)
+        self.max_items = max_items
+        self.frame_ms = frame_ms
+        self.items = deque(maxlen=max_items)   # [시각 문자열, 메시지, 반복 횟수]
+        self._dirty = False
+        self._after_id = None
+
+        header = tk.Frame(self, bg="black")
+        header.pack(fill=tk.X)
+        self.title_label = tk.Label(header, text="오류 0", fg="#D32F2F", bg="black", anchor="w")
+        self.title_label.pack(side=tk.LEFT, padx=2)
+        tk.Button(header, text="지우기", command=self.clear, bg="#333333", fg="white", relief=tk.FLAT).pack(side=tk.RIGHT)
+        self.listbox = tk.Listbox(self, height=6, bg="#1A1A1A", fg="#FF8A80", activestyle="none", highlightthickness=0)
+        self.listbox.pack(fill=tk.BOTH, expand=True)
+        self.total = 0
+
+    def push(self, message):
+        self.total += 1
+        if self.items and self.items[-1][1] == message:
+            self.items[-1][0] = time.strftime("%H:%M:%S")
+            self.items[-1][2] += 1
+        else:
+            self.items.append([time.strftime("%H:%M:%S"), message, 1])
+        self._schedule()
+
+    def clear(self):
+        self.items.clear()
+        self.total = 0
+        self._schedule()
+
+    def _schedule(self):
+        self._dirty = True
+        if self._after_id is None:
+            self._after_id = self.after(self.frame_ms, self._render)
+
+    def _render(self):
+        self._after_id = None
+        if not self._dirty:
+            return
+        self._dirty = False
+        self.listbox.delete(0, tk.END)
+        for stamp, message, count in reversed(self.items):   # 최신 항목이 위
+            suffix = f" (x{count})" if count > 1 else ""
+            self.listbox.insert(tk.END, f"{stamp}  {message}{suffix}")
+        self.title_label.config(text=f"오류 {self.total}")
@@ -0,0 +1,96 @@
+from array import array
+from bisect import bisect_left, bisect_right, insort
+
+class NavigationIndex:
+    """그리드 셀의 포커스 가능 여부를 미리 정리해 두고, 방향키 이동 대상을 위젯 조회 없이 계산합니다.
+
+    - 열마다 포커스 가능한 행 번호를 정렬된 배열로 보관 (위/아래 이동은 bisect 한 번)
+    - 행마다 포커스할 수 없는 열만 따로 보관 (좌/우 이동은 열 수만큼만 확인)
+    - 열 전체를 끈 경우(set_column_focusable) 나중에 추가된 행도 그 열은 포커스할 수 없음
+    이동은 기존과 같이 순환합니다 (위/아래는 같은 열, 좌/우는 같은 행 안에서).
+    """
+
+    def __init__(self, rows=0, cols=0):
+        self.reset(rows, cols)
+
+    def reset(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self._col_rows = [array("i", range(rows)) for _ in range(cols)]
+        self._disabled = {}    # 행 -> 포커스할 수 없는 열 집합
+        self._disabled_cols = set()   # 열 전체를 끈 열 (새 행에도 적용)
+
+    def resize(self, rows):
+        # 레일 수가 바뀌어도 기존 행의 포커스 가능 여부는 유지
+        if rows > self.rows:
+            for col, col_rows in enumerate(self._col_rows):
+                if col not in self._disabled_cols:
+                    col_rows.extend(range(self.rows, rows))
+            if self._disabled_cols:
+                for row in range(self.rows, rows):
+                    self._disabled[row] = set(self._disabled_cols)
+        elif rows < self.rows:
+            for col_rows in self._col_rows:
+                del col_rows[bisect_left(col_rows, rows):]
+            self._disabled = {row: cols for row, cols in self._disabled.items() if row < rows}
+        self.rows = rows
+
+    def is_focusable(self, row, col):
+        return 0 <= row < self.rows and 0 <= col < self.cols and col not in self._disabled.get(row, ())
+
+    def set_focusable(self, row, col, focusable):
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return
+        if focusable == self.is_focusable(row, col):
+            return
+        rows = self._col_rows[col]
+        if focusable:
+            insort(rows, row)
+            disabled = self._disabled[row]
+            disabled.discard(col)
+            if not disabled:
+                del self._disabled[row]
+        else:
+            del rows[bisect_left(rows, row)]
+            self._disabled.setdefault(row, set()).add(col)
+
+    def set_column_focusable(self, col, focusable):
+        """열 전체의 포커스 가능 여부를 한 번에 바꿉니다. (행마다 set_focusable을 부르면 행 수의 제곱에 비례)"""
+        if not 0 <= col < self.cols:
+            return
+        if focusable:
+            self._disabled_cols.discard(col)
+            self._col_rows[col] = array("i", range(self.rows))
+            for row in list(self._disabled):
+                disabled = self._disabled[row]
+                disabled.discard(col)
+                if not disabled:
+                    del self._disabled[row]
+        else:
+            self._disabled_cols.add(col)
+            self._col_rows[col] = array("i")
+            for row in range(self.rows):
+                self._disabled.setdefault(row, set()).add(col)
+
+    def next_cell(self, row, col, dr, dc):
+        """(row, col)에서 (dr, dc) 방향으로 다음 포커스 가능한 셀을 반환합니다. 없으면 None."""
+        if dr:
+            if not 0 <= col < self.cols:
+                return None
+            rows = self._col_rows[col]
+            if not rows:
+                return None
+            if dr > 0:
+                pos = bisect_right(rows, row)
+                return (rows[pos] if pos < len(rows) else rows[0]), col
+            pos = bisect_left(rows, row) - 1
+            return rows[pos], col    # pos == -1이면 마지막 행으로 순환
+        if dc:
+            if not 0 <= row < self.rows:
+                return None
+            disabled = self._disabled.get(row, ())
+            for step in range(1, self.cols + 1):
+                c = (col + dc * step) % self.cols
+                if c not in disabled:
+                    return row, c
+        return None
@@ -0,0 +1,157 @@
+import io
+import time
+import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils.logger import app_logger
+from src.utils.metrics import registry
+
+PREVIEW_SIZE = (192, 108)
+IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".bmp")
+
+# PIL은 프리뷰를 처음 불러올 때 작업 스레드에서 임포트 (시작 시간에 포함되지 않도록)
+
+def is_image_source(text):
+    """레일의 프리뷰 값이 이미지 경로나 URL인지 확인합니다."""
+    text = text.strip().lower()
+    return text.startswith(("http://", "https://")) or text.endswith(IMAGE_SUFFIXES)
+
+def load_preview_source(source, timeout=3):
+    """파일 경로는 그대로, URL은 내려받은 bytes를 반환합니다. (작업 스레드에서 호출)"""
+    if source.startswith(("http://", "https://")):
+        from urllib.request import urlopen
+        with urlopen(source, timeout=timeout) as response:
+            return response.read()
+    return source
+
+class PreviewCache:
+    """프리뷰 썸네일을 작업 스레드에서 읽고 줄인 뒤, (키, 리비전)별로 최근 max_items개를 보관합니다.
+
+    - 디코딩/크기 조정은 작업 스레드 풀에서, PhotoImage 생성은 post()로 넘겨 Tk 스레드에서만 합니다.
+    - 같은 키를 동시에 여러 번 요청하면 한 번만 읽고 기다리는 콜백에 모두 전달합니다.
+    - invalidate(key)로 리비전을 올리면 다음 요청부터 다시 읽습니다 (vMix 인풋 변경 등).
+    """
+
+    def __init__(self, post, loader=load_preview_source, size=PREVIEW_SIZE, max_items=64, workers=2):
+        self.post = post            # post(callback, *args): Tk 스레드에서 callback 실행 (TkBridge.post)
+        self.loader = loader        # loader(source) -> bytes 또는 파일 경로 (작업 스레드에서 호출)
+        self.size = size
+        self.max_items = max_items
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="preview")
+        self._photos = OrderedDict()   # (키, 리비전) -> PhotoImage
+        self._revisions = {}           # 키 -> 리비전
+        self._pending = {}             # (키, 리비전) -> 기다리는 콜백 목록
+        self._failed = set()           # 읽기에 실패한 (키, 리비전). 무효화 전까지 다시 시도하지 않음
+        self._closed = False
+        self._hits = registry.counter("preview.hits")
+        self._misses = registry.counter("preview.misses")
+        self._errors = registry.counter("preview.errors")
+        self._decode_ms = registry.histogram("preview.decode_ms")
+
+    def revision(self, key):
+        return self._revisions.get(key, 0)
+
+    def invalidate(self, key):
+        old = (key, self.revision(key))
+        self._revisions[key] = old[1] + 1
+        self._photos.pop(old, None)
+        self._failed.discard(old)
+
+    def get(self, key):
+        return self._photos.get((key, self.revision(key)))
+
+    def request(self, key, source, callback=None):
+        """캐시에 있으면 바로 callback(photo)을 호출하고, 없으면 백그라운드에서 읽은 뒤 호출합니다. (Tk 스레드에서 호출)"""
+        cache_key = (key, self.revision(key))
+        photo = self._photos.get(cache_key)
+        if photo is not None:
+            self._hits.inc()
+            self._photos.move_to_end(cache_key)
+            if callback is not None:
+                callback(photo)
+            return photo
+        if cache_key in self._failed or self._closed:
+            return None
+        waiters = self._pending.get(cache_key)
+        if waiters is not None:
+            if callback is not None:
+                waiters.append(callback)
+            return None
+        self._misses.inc()
+        self._pending[cache_key] = [callback] if callback is not None else []
+        future = self._executor.submit(self._decode, source)
+        future.add_done_callback(lambda f: self.post(self._on_decoded, cache_key, f))
+        return None
+
+    def _decode(self, source):
+        # 작업 스레드: 읽기 + 디코딩 + 축소까지 끝낸 PIL 이미지를 반환
+        from PIL import Image
+        started = time.perf_counter()
+        data = self.loader(source)
+        image = Image.open(io.BytesIO(data) if isinstance(data, bytes) else data)
+        image.draft("RGB", self.size)   # JPEG는 디코딩 단계에서 바로 축소
+        image = image.convert("RGB")
+        image.thumbnail(self.size)
+        self._decode_ms.observe((time.perf_counter() - started) * 1000)
+        return image
+
+    def _on_decoded(self, cache_key, future):
+        # Tk 스레드
+        callbacks = self._pending.pop(cache_key, [])
+        if self._closed:
+            return
+        try:
+            image = future.result()
+        except Exception as e:
+            self._errors.inc()
+            self._failed.add(cache_key)
+            app_logger.warning(f"프리뷰를 불러올 수 없습니다 ({cache_key[0]}): {e}")
+            return
+        from PIL import ImageTk
+        photo = ImageTk.PhotoImage(image)
+        key, revision = cache_key
+        if revision == self.revision(key):
+            # 읽는 동안 무효화된 결과는 요청자에게만 보여주고 보관하지 않음
+            self._photos[cache_key] = photo
+            while len(self._photos) > self.max_items:
+                self._photos.popitem(last=False)
+        for callback in callbacks:
+            try:
+                callback(photo)
+            except tk.TclError:
+                pass   # 그사이 닫힌 위젯
+
+    def close(self):
+        self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._photos.clear()
+        self._pending.clear()
+
+class PreviewPanel(tk.Frame):
+    """선택한 레일의 프리뷰 썸네일과 설명을 보여줍니다. 마지막으로 요청한 레일의 이미지만 표시합니다."""
+
+    def __init__(self, master, *args, **kwargs):
+        super().__init__(master, bg="black", *args, **kwargs)
+        self.image_label = tk.Label(self, bg="#1A1A1A")
+        self.image_label.pack(padx=2, pady=(2, 0))
+        self.caption = tk.Label(self, text="", fg="white", bg="black")
+        self.caption.pack(fill=tk.X)
+        self.photo = None     # Tk가 이미지를 해제하지 않도록 참조 유지
+        self.token = None     # 현재 표시 중인 요청 (늦게 도착한 이전 요청 결과는 무시)
+
+    def expect(self, token, caption):
+        self.token = token
+        self.caption.config(text=caption)
+
+    def show(self, token, photo):
+        if token != self.token:
+            return
+        self.photo = photo
+        self.image_label.config(image=photo)
+
+    def clear(self, caption=""):
+        self.token = None
+        self.photo = None
+        self.image_label.config(image="")
+        self.caption.config(text=caption)
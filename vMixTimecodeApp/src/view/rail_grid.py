@@ -0,0 +1,241 @@
+import tkinter as tk
+
+from src.view.navigation_index import NavigationIndex
+from src.view.render_batcher import RenderBatcher
+from src.view.ui_utils import bind_entry_extended_events, bind_widget_full_navigation
+
+DEFAULT_BG = "#333333"
+
+# (모델 키, 헤더, 폭, 입력 모드) - B열은 기존과 같이 3번 열
+RAIL_COLUMNS = [
+    ("time", "시간", 9, "timecode"),
+    ("preview", "프리뷰", 12, "text"),
+    ("input", "인풋", 6, "text"),
+    ("button", "B", 3, "button"),
+    ("comment", "메모", 16, "text"),
+]
+BUTTON_COLUMN = 3
+
+class _MatrixRows:
+    """widget_matrix 호환용 뷰. 전체 레일 수만큼의 행이 있는 것처럼 보이고, 셀은 get_widget_by_rowcol로 얻습니다."""
+
+    def __init__(self, grid):
+        self._grid = grid
+
+    def __len__(self):
+        return self._grid.row_count
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += self._grid.row_count
+        if not 0 <= row < self._grid.row_count:
+            raise IndexError(row)
+        return [self._grid.widget_at(row, col) for col in range(len(RAIL_COLUMNS))]
+
+class VirtualRailGrid(tk.Frame):
+    """화면에 보이는 만큼의 행 위젯만 만들어 두고, 스크롤할 때 LineDataModel의 행에 다시 연결합니다.
+
+    행 위젯 풀의 크기는 프레임 높이에 맞춰 조정되므로 레일 수와 상관없이 위젯 수가 일정합니다.
+    """
+
+    def __init__(self, master, line_data_model, on_edit, renderer=None, on_focus_row=None, *args, **kwargs):
+        super().__init__(master, bg="black", *args, **kwargs)
+        self.model = line_data_model
+        self.renderer = renderer or RenderBatcher(self)   # 배경색은 프레임 단위로 모아서 변경분만 적용
+        self.on_edit = on_edit       # on_edit(row, key, value): 모델과 다른 값이 입력되었을 때
+        self.on_focus_row = on_focus_row   # on_focus_row(row): 행의 칸이 포커스를 받았을 때 (프리뷰 표시 등)
+        self.top = 0                 # 첫 번째 풀 행에 연결된 모델 행
+        self.pool = []               # 풀 행마다 [Entry, ...] (RAIL_COLUMNS 순서)
+        self.colors = {}             # (모델 행, 열) -> 배경색 (기본색이 아닌 셀만)
+        self.widget_matrix = _MatrixRows(self)
+        self.nav_index = NavigationIndex(self.row_count, len(RAIL_COLUMNS))   # 방향키 이동 대상 조회용
+
+        self.body = tk.Frame(self, bg="black")
+        self.body.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar = tk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        for col, (_, title, width, _) in enumerate(RAIL_COLUMNS):
+            tk.Label(self.body, text=title, width=width, fg="white", bg="black").grid(row=0, column=col, padx=1)
+        self._add_pool_row()
+        self._row_height = max(self.pool[0][0].winfo_reqheight(), 1)
+        self.body.bind("<Configure>", self._on_resize)
+        for widget in (self.body, self.scrollbar):
+            widget.bind("<MouseWheel>", self._on_mousewheel)
+            widget.bind("<Button-4>", lambda e: self.scroll_by(-3))
+            widget.bind("<Button-5>", lambda e: self.scroll_by(3))
+        self.refresh()
+
+    @property
+    def row_count(self):
+        return self.model.rail_count
+
+    # ----- 풀 관리 -----
+
+    def _add_pool_row(self):
+        slot = len(self.pool)
+        entries = []
+        for col, (key, _, width, mode) in enumerate(RAIL_COLUMNS):
+            entry = tk.Entry(self.body, width=width, justify="center", bg=DEFAULT_BG, fg="white", insertbackground="white")
+            entry.grid(row=slot + 1, column=col, padx=1)
+            entry._rail_row = self.top + slot
+            entry._rail_key = key
+            entry._rail_enabled = True
+            self.renderer.known(entry, bg=DEFAULT_BG)
+            if mode in ("timecode", "button"):
+                bind_entry_extended_events(entry, mode, self.model.fps, self.model.drop_frame, on_commit=self._commit)
+            bind_widget_full_navigation(entry, lambda e=entry: e._rail_row, col, self)
+            # 포커스를 잃거나 Enter를 누르면 모델에 반영 (같은 값이면 무시)
+            entry.bind("<FocusOut>", lambda event: self._commit(event.widget), add="+")
+            entry.bind("<Return>", lambda event: self._commit(event.widget), add="+")
+            entry.bind("<FocusIn>", self._on_focus_in, add="+")
+            entry.bind("<MouseWheel>", self._on_mousewheel, add="+")
+            entry.bind("<Button-4>", lambda e: self.scroll_by(-3), add="+")
+            entry.bind("<Button-5>", lambda e: self.scroll_by(3), add="+")
+            entries.append(entry)
+        self.pool.append(entries)
+
+    def _set_pool_size(self, size):
+        size = max(1, size)
+        if size == len(self.pool):
+            return
+        self._commit_visible()
+        while len(self.pool) < size:
+            self._add_pool_row()
+        while len(self.pool) > size:
+            for entry in self.pool.pop():
+                self.renderer.forget(entry)
+                entry.destroy()
+        self.refresh()
+
+    def _on_resize(self, event):
+        # 헤더 한 줄을 뺀 높이에 들어가는 만큼만 행 위젯을 유지
+        self._set_pool_size(event.height // self._row_height - 1)
+
+    # ----- 모델 연결 -----
+
+    def _commit(self, entry):
+        row = entry._rail_row
+        if row >= self.row_count:
+            return
+        value = entry.get().strip()
+        if value != self.model.get_value(row, entry._rail_key):
+            self.on_edit(row, entry._rail_key, value)
+
+    def _on_focus_in(self, event):
+        if self.on_focus_row is not None and event.widget._rail_enabled:
+            self.on_focus_row(event.widget._rail_row)
+
+    def _commit_visible(self):
+        # 다른 행으로 다시 연결하기 전에 입력 중인 값을 모델에 반영
+        for entries in self.pool:
+            for entry in entries:
+                self._commit(entry)
+
+    def _bind_row(self, slot):
+        row = self.top + slot
+        visible = row < self.row_count
+        for col, entry in enumerate(self.pool[slot]):
+            entry._rail_row = row
+            if not entry._rail_enabled:
+                entry.config(state=tk.NORMAL)
+            entry.delete(0, tk.END)
+            if visible:
+                entry.insert(0, self.model.get_value(row, entry._rail_key))
+            enabled = visible and self.nav_index.is_focusable(row, col)
+            if not enabled:
+                entry.config(state=tk.DISABLED)
+            entry._rail_enabled = enabled
+            self.renderer.set(entry, bg=self.colors.get((row, col), DEFAULT_BG) if visible else DEFAULT_BG)
+
+    def refresh(self):
+        if self.nav_index.rows != self.row_count:
+            self.nav_index.resize(self.row_count)
+        self.top = max(0, min(self.top, self.row_count - len(self.pool)))
+        for slot in range(len(self.pool)):
+            self._bind_row(slot)
+        self._update_scrollbar()
+
+    def refresh_row(self, row):
+        slot = row - self.top
+        if 0 <= slot < len(self.pool):
+            self._bind_row(slot)
+
+    def _update_scrollbar(self):
+        total = max(self.row_count, 1)
+        self.scrollbar.set(self.top / total, min(self.top + len(self.pool), total) / total)
+
+    # ----- 스크롤 -----
+
+    def scroll_to(self, top):
+        top = max(0, min(top, self.row_count - len(self.pool)))
+        if top == self.top:
+            return
+        self._commit_visible()
+        self.top = top
+        for slot in range(len(self.pool)):
+            self._bind_row(slot)
+        self._update_scrollbar()
+
+    def scroll_by(self, rows):
+        self.scroll_to(self.top + rows)
+        return "break"
+
+    def ensure_visible(self, row):
+        if row < self.top:
+            self.scroll_to(row)
+        elif row >= self.top + len(self.pool):
+            self.scroll_to(row - len(self.pool) + 1)
+
+    def yview(self, *args):
+        if args[0] == tk.MOVETO:
+            self.scroll_to(int(float(args[1]) * self.row_count))
+        elif args[0] == tk.SCROLL:
+            step = len(self.pool) if args[2] == tk.PAGES else 1
+            self.scroll_by(int(args[1]) * step)
+
+    def _on_mousewheel(self, event):
+        return self.scroll_by(-1 if event.delta > 0 else 1)
+
+    # ----- 셀 접근 -----
+
+    def widget_at(self, row, col):
+        """모델 행이 화면에 보일 때만 해당 셀 위젯을 반환합니다."""
+        slot = row - self.top
+        if 0 <= slot < len(self.pool) and 0 <= col < len(RAIL_COLUMNS):
+            return self.pool[slot][col]
+        return None
+
+    def get_widget_by_rowcol(self, row, col):
+        # 키보드 이동은 전체 레일 범위에서 동작하므로, 보이지 않는 행이면 먼저 스크롤한다
+        if not 0 <= row < self.row_count:
+            return None
+        self.ensure_visible(row)
+        return self.widget_at(row, col)
+
+    def set_cell_color(self, row, col, color):
+        if color == DEFAULT_BG:
+            self.colors.pop((row, col), None)
+        else:
+            self.colors[(row, col)] = color
+        entry = self.widget_at(row, col)
+        if entry is not None:
+            self.renderer.set(entry, bg=color)
+
+    def set_cell_enabled(self, row, col, enabled):
+        # 입력 가능 여부를 바꾸면 이동 인덱스도 함께 갱신되어 방향키 이동에서 건너뛴다
+        self.nav_index.set_focusable(row, col, enabled)
+        self.refresh_row(row)
+
+    def set_column_enabled(self, col, enabled):
+        # 열 전체 (동작 모드에 따라 쓰지 않는 열). 이후 추가되는 행에도 적용된다
+        self._commit_visible()
+        self.nav_index.set_column_focusable(col, enabled)
+        for slot in range(len(self.pool)):
+            self._bind_row(slot)
+
+    def destroy(self):
+        for entries in self.pool:
+            for entry in entries:
+                self.renderer.forget(entry)
+        super().destroy()
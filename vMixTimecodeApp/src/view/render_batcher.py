@@ -0,0 +1,73 @@
+import time
+import tkinter as tk
+
+from src.utils.metrics import registry
+
+_UNSET = object()
+
+class RenderBatcher:
+    """위젯에 적용할 화면 상태(bg, fill 등)를 한 프레임 동안 모았다가, 마지막으로 적용한 값과 다른 옵션만 설정합니다.
+
+    같은 프레임 안에서 같은 위젯을 여러 번 바꿔도 Tk 호출은 최대 한 번이며,
+    이미 같은 값이 적용되어 있으면 호출하지 않습니다.
+    """
+
+    def __init__(self, master, frame_ms=16):
+        self.master = master
+        self.frame_ms = frame_ms
+        self._pending = {}    # (위젯, 캔버스 아이템 또는 None) -> {옵션: 값}
+        self._applied = {}    # (위젯, 캔버스 아이템 또는 None) -> 마지막으로 적용한 {옵션: 값}
+        self._after_id = None
+        self.tk_calls = 0     # 실제로 실행한 config/itemconfig 횟수
+        self.skipped = 0      # 변경이 없어 생략한 횟수
+        self._flush_ms = registry.histogram("ui.render_flush_ms")
+
+    def set(self, widget, **options):
+        self._stage((widget, None), options)
+
+    def set_item(self, canvas, item, **options):
+        self._stage((canvas, item), options)
+
+    def known(self, widget, item=None, **options):
+        # 위젯을 만들 때 지정한 옵션처럼 이미 화면에 반영된 값을 알려 준다
+        self._applied.setdefault((widget, item), {}).update(options)
+
+    def forget(self, widget):
+        for store in (self._pending, self._applied):
+            for key in [key for key in store if key[0] is widget]:
+                del store[key]
+
+    def _stage(self, key, options):
+        self._pending.setdefault(key, {}).update(options)
+        if self._after_id is None:
+            self._after_id = self.master.after(self.frame_ms, self.flush)
+
+    def flush(self):
+        self._after_id = None
+        started = time.perf_counter()
+        pending, self._pending = self._pending, {}
+        for key, options in pending.items():
+            applied = self._applied.setdefault(key, {})
+            changed = {k: v for k, v in options.items() if applied.get(k, _UNSET) != v}
+            if not changed:
+                self.skipped += 1
+                continue
+            widget, item = key
+            try:
+                if item is None:
+                    widget.config(**changed)
+                else:
+                    widget.itemconfig(item, **changed)
+            except tk.TclError:
+                # 이미 삭제된 위젯
+                del self._applied[key]
+                continue
+            self.tk_calls += 1
+            applied.update(changed)
+        self._flush_ms.observe((time.perf_counter() - started) * 1000)
+
+    def cancel(self):
+        if self._after_id is not None:
+            self.master.after_cancel(self._after_id)
+            self._after_id = None
+        self._pending.clear()
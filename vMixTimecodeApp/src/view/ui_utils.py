@@ -1,14 +1,20 @@
 import tkinter as tk
 
+from src.utils.timecode import DEFAULT_FPS, fields_to_frames, format_timecode, parse_timecode, shift_field
+from src.view.render_batcher import RenderBatcher
+
 def is_focusable_widget(w):
     return isinstance(w, (tk.Entry, tk.Button, tk.Checkbutton))
 
-def bind_entry_extended_events(entry, mode="timecode"):
+def bind_entry_extended_events(entry, mode="timecode", fps=DEFAULT_FPS, drop_frame=False, on_commit=None):
+    # on_commit(entry): Enter로 값을 확정할 때 호출 (자동 채우기가 "break"로 이후 바인딩을 막으므로 여기서 호출)
     entry._drag_y = None
     entry._drag_in_progress = False
     entry._tc_idx = 2
     entry._tc_positions = [2, 5, 8]
     entry._tc_mode = (mode in ["timecode", "set_time"])
+    entry._tc_fps = fps
+    entry._tc_drop_frame = drop_frame
 
     def select_all(event):
         entry.after(1, lambda: entry.select_range(0, tk.END))
@@ -21,24 +27,31 @@ def bind_entry_extended_events(entry, mode="timecode"):
         entry.bind("<Shift-Right>", lambda e: tc_shift_move(entry, 1))
         entry.bind("<Shift-Up>", lambda e: tc_shift_incdec(entry, 1))
         entry.bind("<Shift-Down>", lambda e: tc_shift_incdec(entry, -1))
-        entry.bind("<Return>", lambda e, en=entry: timecode_zero_autofill(en, app_instance=en.winfo_toplevel().nametowidget(".")))
+        def on_return(event):
+            result = timecode_zero_autofill(entry, app_instance=entry.winfo_toplevel().nametowidget("."))
+            if on_commit is not None:
+                on_commit(entry)
+            return result
+        entry.bind("<Return>", on_return)
     elif mode == "button":
         entry.bind("<Shift-Up>", lambda e: button_incdec(entry, 1))
         entry.bind("<Shift-Down>", lambda e: button_incdec(entry, -1))
 
 def set_tc_cursor(entry):
     val = entry.get()
-    if not val or len(val) != 8:
+    if not val or len(val) not in (8, 11):
         return
-    idx = getattr(entry, "_tc_idx", 2)
-    pos = [2, 5, 8][idx]
+    idx = min(getattr(entry, "_tc_idx", 2), len(val) // 3 - 1)
+    pos = [2, 5, 8, 11][idx]
     entry.icursor(pos)
 
 def tc_shift_move(entry, delta):
     if entry.cget("state") in ("readonly", "disabled"):
         return "break"
+    # HH:MM:SS는 3개, HH:MM:SS:FF는 4개 필드 사이를 순환
+    field_count = 4 if len(entry.get()) == 11 else 3
     idx = getattr(entry, "_tc_idx", 2)
-    idx = (idx + delta) % 3
+    idx = (idx + delta) % field_count
     entry._tc_idx = idx
     set_tc_cursor(entry)
     return "break"
@@ -47,23 +60,16 @@ def tc_shift_incdec(entry, delta):
     if entry.cget("state") in ("readonly", "disabled"):
         return "break"
     val = entry.get()
-    if not val or len(val) != 8 or val[2] != ":" or val[5] != ":":
-        return "break"
-    
-    idx = getattr(entry, "_tc_idx", 2)
-    try:
-        h, m, s = map(int, val.split(":"))
-    except ValueError:
+    fps = getattr(entry, "_tc_fps", DEFAULT_FPS)
+    drop_frame = getattr(entry, "_tc_drop_frame", False)
+    frames = parse_timecode(val, fps, drop_frame)
+    if frames is None:
         return "break"
 
-    if idx == 0:
-        h = (h + delta) % 24
-    elif idx == 1:
-        m = (m + delta) % 60
-    else:
-        s = (s + delta) % 60
-    
-    new_tc = f"{h:02d}:{m:02d}:{s:02d}"
+    with_frames = len(val) == 11
+    idx = min(getattr(entry, "_tc_idx", 2), 3 if with_frames else 2)
+    frames = shift_field(frames, idx, delta, fps, drop_frame)
+    new_tc = format_timecode(frames, fps, drop_frame, with_frames)
     entry.delete(0, tk.END)
     entry.insert(0, new_tc)
     set_tc_cursor(entry)
@@ -86,25 +92,24 @@ def timecode_zero_autofill(entry, app_instance=None):
     if entry.cget("state") in ("readonly", "disabled"):
         return "break"
     val = entry.get().strip()
-
-    if len(val) == 6 and val.isdigit():
-        try:
-            h = int(val[0:2])
-            m = int(val[2:4])
-            s = int(val[4:6])
-            if not (0 <= h <= 23 and 0 <= m <= 59 and 0 <= s <= 59):
-                if app_instance and hasattr(app_instance, 'push_error'):
-                    app_instance.push_error(f"시간 값 오류: {h:02d}:{m:02d}:{s:02d}")
-                return None
-            
-            formatted_val = f"{val[0:2]}:{val[2:4]}:{val[4:6]}"
-            entry.delete(0, tk.END)
-            entry.insert(0, formatted_val)
-            entry.icursor(tk.END)
-            return "break"
-        except ValueError:
+    fps = getattr(entry, "_tc_fps", DEFAULT_FPS)
+    drop_frame = getattr(entry, "_tc_drop_frame", False)
+
+    # HHMMSS 또는 HHMMSSFF 숫자만 입력한 경우 콜론을 채워 넣음
+    if len(val) in (6, 8) and val.isdigit():
+        fields = [int(val[i:i + 2]) for i in range(0, len(val), 2)]
+        text = ":".join(val[i:i + 2] for i in range(0, len(val), 2))
+        if parse_timecode(text, fps, drop_frame) is None:
+            if app_instance and hasattr(app_instance, 'push_error'):
+                app_instance.push_error(f"시간 값 오류: {':'.join(f'{v:02d}' for v in fields)}")
             return None
 
+        formatted_val = format_timecode(fields_to_frames(*fields, fps=fps, drop_frame=drop_frame), fps, drop_frame, len(fields) == 4)
+        entry.delete(0, tk.END)
+        entry.insert(0, formatted_val)
+        entry.icursor(tk.END)
+        return "break"
+
     if val == "0":
         entry.delete(0, tk.END)
         entry.insert(0, "00:00:00")
@@ -113,7 +118,15 @@ def timecode_zero_autofill(entry, app_instance=None):
 
     return None
 
+def focus_entry_widget(target):
+    target.focus_set()
+    if isinstance(target, tk.Entry):
+        target.select_range(0, tk.END)
+        target.icursor(tk.END)
+
 def bind_widget_full_navigation(widget, row_idx, col_idx, app):
+    # row_idx는 정수 또는 현재 행을 돌려주는 함수 (가상 그리드처럼 위젯이 다른 행에 다시 연결되는 경우)
+    # app에 nav_index(NavigationIndex)가 있으면 위젯을 하나씩 확인하지 않고 바로 이동 대상을 찾는다
     def on_key(event):
         dir_map = {
             "Up":    (-1, 0), "Down":  (1, 0),
@@ -122,7 +135,14 @@ def bind_widget_full_navigation(widget, row_idx, col_idx, app):
         if event.state & 0x1: return None
         if event.keysym in dir_map:
             dr, dc = dir_map[event.keysym]
-            r, c = row_idx, col_idx
+            r, c = (row_idx() if callable(row_idx) else row_idx), col_idx
+            nav_index = getattr(app, "nav_index", None)
+            if nav_index is not None:
+                cell = nav_index.next_cell(r, c, dr, dc)
+                target = app.get_widget_by_rowcol(*cell) if cell is not None else None
+                if target is not None:
+                    focus_entry_widget(target)
+                return "break"
             max_rows = len(app.widget_matrix)
             max_cols = len(app.widget_matrix[0]) if max_rows > 0 else 0
             for _ in range(max_rows * max_cols):
@@ -131,10 +151,7 @@ def bind_widget_full_navigation(widget, row_idx, col_idx, app):
                 if dc != 0: c_new %= max_cols
                 target = app.get_widget_by_rowcol(r_new, c_new)
                 if target and target.winfo_ismapped() and target.cget('state') != 'disabled' and is_focusable_widget(target):
-                    target.focus_set()
-                    if isinstance(target, tk.Entry):
-                        target.select_range(0, tk.END)
-                        target.icursor(tk.END)
+                    focus_entry_widget(target)
                     return "break"
                 r, c = r_new, c_new
             return "break"
@@ -142,16 +159,20 @@ def bind_widget_full_navigation(widget, row_idx, col_idx, app):
         widget.bind(k, on_key)
 
 class StatusCircleBar(tk.Frame):
-    def __init__(self, master, get_status_callback, status_items, *args, **kwargs):
+    COLORS = {0: "yellow", 1: "red", 2: "lime"}
+
+    def __init__(self, master, get_status_callback, status_items, *args, renderer=None, **kwargs):
         super().__init__(master, bg="black", *args, **kwargs)
         self.get_status = get_status_callback
         self.status_items = status_items
+        self.renderer = renderer or RenderBatcher(self)
         self.labels = []
         self._create_widgets()
         self.update_status()
 
     def _create_widgets(self):
-        for lbl, canvas in self.labels:
+        for lbl, canvas, _ in self.labels:
+            self.renderer.forget(canvas)
             lbl.destroy()
             canvas.destroy()
         self.labels.clear()
@@ -161,17 +182,22 @@ class StatusCircleBar(tk.Frame):
             canvas = tk.Canvas(self, width=16, height=16, bg="black", highlightthickness=0)
             lbl.pack(side=tk.LEFT, padx=(2,0))
             canvas.pack(side=tk.LEFT, padx=(0,10))
-            self.labels.append((lbl, canvas))
+            # 원은 한 번만 만들고 이후에는 색만 바꾼다
+            oval = canvas.create_oval(2, 2, 14, 14, fill="yellow", outline="gray")
+            self.renderer.known(canvas, oval, fill="yellow")
+            self.labels.append((lbl, canvas, oval))
 
     def update_labels(self, new_status_items):
         self.status_items = new_status_items
         self._create_widgets()
 
     def update_status(self):
-        status = self.get_status()
-        colors = {0: "yellow", 1: "red", 2: "lime"}
-        for idx, (_, canvas) in enumerate(self.labels):
-            color = colors.get(status[idx] if idx < len(status) else 0, "yellow")
-            canvas.delete("all")
-            canvas.create_oval(2, 2, 14, 14, fill=color, outline="gray")
+        self.refresh()
         self.after(1000, self.update_status)
+
+    def refresh(self):
+        # 주기 갱신과 별개로 상태가 바뀌었을 때 즉시 한 번 다시 그림 (색이 같으면 Tk 호출 없음)
+        status = self.get_status()
+        for idx, (_, canvas, oval) in enumerate(self.labels):
+            color = self.COLORS.get(status[idx] if idx < len(status) else 0, "yellow")
+            self.renderer.set_item(canvas, oval, fill=color)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# vMixTimecodeApp 폴더에서 python -m pytest tests 로 실행해도 src 패키지를 찾을 수 있도록 함
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,44 @@
+# 컨트롤러 테스트용 View 대역 (AppController가 사용하는 속성만)
+from src.controller.gto_logic import GTO_MODE
+from src.model.line_data import LineDataModel
+
+class FakeVar:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+class FakeMaster:
+    def after(self, ms, callback=None, *args):
+        return None
+
+    def after_cancel(self, after_id):
+        pass
+
+class FakeView:
+    main_vmix_name = "Main"
+    main_ip = "127.0.0.1"
+
+    def __init__(self, profiles_dir):
+        self.master = FakeMaster()
+        self.settings = {"profiles_dir": profiles_dir}
+        self.line_data_model = LineDataModel(3)
+        self.errors = []
+        self.app_mode = FakeVar(GTO_MODE)
+        self.colors = {}
+
+    def push_error(self, message):
+        self.errors.append(message)
+
+    def set_button_color(self, line_index, color):
+        self.colors[line_index] = color
+
+    def apply_mode_to_grid(self):
+        self.mode_applied = self.app_mode.get()
+
+    def run_line(self, line_index):
+        pass
+
+    def stop_line(self, line_index):
+        pass
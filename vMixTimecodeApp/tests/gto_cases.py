@@ -0,0 +1,25 @@
+# GTO 검사 테스트에서 함께 쓰는 무작위 계획 생성기
+
+import os
+
+# 무작위 검사 횟수 (GTO_FUZZ_COUNT 환경 변수로 늘릴 수 있음. 예: 200000)
+FUZZ_COUNT = int(os.environ.get("GTO_FUZZ_COUNT", "20000"))
+CODES = (1, 2, 4, 5, 6, 7, 8, 17, 0, 3)
+
+def random_plan(rng):
+    # 완전 무작위만으로는 앞의 시작/끝 규칙에서 대부분 걸러지므로, 올바른 계획을 조금씩 바꾼 것을 섞는다
+    if rng.random() < 0.3:
+        return [rng.choice(CODES) for _ in range(rng.randint(1, 12))]
+    middle = []
+    for _ in range(rng.randint(0, 4)):
+        middle += rng.choice(([6, 5], [7, 6, 5], [6, 5, 7, 6, 5]))
+    plan = [2, 4, 5] + middle + rng.choice(([8, 1], [6, 17, 1]))
+    for _ in range(rng.randint(0, 2)):
+        action = rng.randrange(3)
+        if action == 0:
+            plan[rng.randrange(len(plan))] = rng.choice(CODES)
+        elif action == 1 and len(plan) > 1:
+            del plan[rng.randrange(len(plan))]
+        else:
+            plan.insert(rng.randrange(len(plan) + 1), rng.choice(CODES))
+    return plan
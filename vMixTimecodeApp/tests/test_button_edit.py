@@ -0,0 +1,20 @@
+from fake_view import FakeView
+from src.controller.app_controller import AppController
+
+def test_validator_uses_value_stored_by_model(tmp_path):
+    controller = AppController(FakeView(str(tmp_path)))
+    model = controller.app_view.line_data_model
+    controller.validate_gto_logic_from_view(controller.app_view)
+    # 숫자이지만 10진수가 아닌 문자, 저장 범위를 넘는 값, 일반 값
+    for index, text in ((0, "²"), (1, "70000"), (2, "17")):
+        controller.on_button_edited(index, text)
+        assert controller.gto_validator.b_values[index] == model.buttons[index]
+    assert list(model.buttons) == [0, 0, 17]
+    controller.settings_persister.close()
+
+def test_mode_change_updates_grid_columns(tmp_path):
+    controller = AppController(FakeView(str(tmp_path)))
+    controller.app_view.app_mode.value = "방송 진행용"
+    controller.on_app_mode_change()
+    assert controller.app_view.mode_applied == "방송 진행용"
+    controller.settings_persister.close()
@@ -0,0 +1,64 @@
+import random
+
+from gto_cases import FUZZ_COUNT, random_plan
+from src.controller.gto_logic import check_gto_plans, check_single_gto_plan, compile_gto_rules, find_gto_blocks
+
+def reference_check(plan):
+    """표 기반 검사기로 바꾸기 전의 규칙별 구현입니다. (GTO_RULES에 규칙을 추가하면 여기에도 같은 규칙을 추가)"""
+    # 규칙 4 (예외 케이스) 먼저 확인
+    if plan == [2, 4, 17, 1]:
+        return True, "성공", []
+
+    # 규칙 2, 3 (시작과 끝)
+    if plan[:3] != [2, 4, 5]:
+        return False, "시작은 반드시 '2-4-5'여야 합니다.", [0, 1, 2]
+    if plan[-3:] not in ([5, 8, 1], [6, 17, 1]):
+        return False, "마지막은 '5-8-1' 또는 '6-17-1'이어야 합니다.", [len(plan)-3, len(plan)-2, len(plan)-1]
+
+    for i, val in enumerate(plan):
+        # 규칙 1 (연속 숫자)
+        if i > 0 and val == plan[i-1]:
+            return False, f"숫자 '{val}'가 연속으로 나올 수 없습니다.", [i-1, i]
+        # 규칙 5 (2의 위치)
+        if val == 2 and i != 0:
+            return False, "'2'는 계획의 시작에만 올 수 있습니다.", [i]
+        # 규칙 6 (4의 위치)
+        if val == 4 and i != 1:
+            return False, "'4'는 계획의 두 번째에만 올 수 있습니다.", [i]
+        # 규칙 10 (8, 17의 위치)
+        if val in (8, 17) and i != len(plan) - 2:
+            return False, f"'{val}'는 계획의 끝에서 두 번째에만 올 수 있습니다.", [i]
+        # 규칙 7 (5의 선행)
+        if val == 5 and i > 0 and plan[i-1] not in (4, 6):
+            return False, "'5'는 '4' 또는 '6' 다음에만 올 수 있습니다.", [i-1, i]
+        # 규칙 8 (6의 선행)
+        if val == 6 and i > 0 and plan[i-1] not in (5, 7):
+            return False, "'6'는 '5' 또는 '7' 다음에만 올 수 있습니다.", [i-1, i]
+        # 규칙 9 (7의 규칙)
+        if val == 7:
+            if i == 0 or plan[i-1] != 5:
+                return False, "'7'은 반드시 '5' 다음에 와야 합니다.", [i-1, i]
+            if i == len(plan) - 1 or plan[i+1] != 6:
+                return False, "'7' 다음에는 반드시 '6'이 와야 합니다.", [i, i+1]
+
+    return True, "성공", []
+
+def test_compiled_rules_match_reference():
+    rng = random.Random(10)
+    plans = [random_plan(rng) for _ in range(FUZZ_COUNT)]
+    plans += [[2, 4, 17, 1], [2, 4, 5, 8, 1], [2, 4, 5, 6, 17, 1], [2, 4, 5, 7, 6, 5, 8, 1], [2], [1]]
+    expected = [reference_check(plan) for plan in plans]
+    assert sum(ok for ok, _, _ in expected) > len(plans) // 20   # 성공 케이스도 충분히 포함되는지
+    for plan, want in zip(plans, expected):
+        assert check_single_gto_plan(plan) == want, plan
+    assert check_gto_plans(plans) == expected
+
+def test_in_place_check_matches_slices():
+    rng = random.Random(11)
+    rules = compile_gto_rules()
+    for _ in range(FUZZ_COUNT // 10):
+        b_values = sum((random_plan(rng) for _ in range(rng.randint(1, 5))), [])
+        blocks = find_gto_blocks(b_values)
+        expected = [reference_check(b_values[b["start"]:b["end"] + 1]) for b in blocks]
+        assert rules.check_blocks(b_values, blocks) == expected
+        assert rules.check_blocks(b_values, [(b["start"], b["end"]) for b in blocks]) == expected
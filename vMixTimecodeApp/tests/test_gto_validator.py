@@ -0,0 +1,26 @@
+import random
+
+from gto_cases import CODES, FUZZ_COUNT, random_plan
+from src.controller.gto_logic import COLOR_DEFAULT, GtoValidator
+
+def test_incremental_update_matches_rebuild():
+    rng = random.Random(9)
+    for _ in range(max(1, FUZZ_COUNT // 500)):
+        values = sum((random_plan(rng) for _ in range(rng.randint(1, 8))), [])
+        values += [rng.choice(CODES) for _ in range(rng.randint(0, 5))]
+        validator = GtoValidator()
+        shown = [COLOR_DEFAULT] * len(values)
+        for i, color in validator.rebuild(values)[1]:
+            shown[i] = color
+        for _ in range(50):
+            index = rng.randrange(len(values))
+            values[index] = rng.choice(CODES)
+            for i, color in validator.update(index, values[index])[1]:
+                shown[i] = color
+            full = GtoValidator()
+            full.rebuild(values)
+            assert validator.blocks == full.blocks, (values, index)
+            assert validator.results == full.results, (values, index)
+            assert validator.colors == full.colors, (values, index)
+            # update()가 돌려준 색 변경만 적용한 화면도 전체 재검사 결과와 같아야 함
+            assert shown == full.colors, (values, index)
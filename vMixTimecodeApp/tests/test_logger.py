@@ -0,0 +1,37 @@
+import logging
+import queue
+from logging.handlers import QueueListener
+
+from src.utils import logger
+
+class CountingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+def test_shutdown_flushes_once_and_is_idempotent(monkeypatch):
+    # 앱 전역 리스너 대신 테스트용 리스너를 끼워 넣음 (다른 테스트의 로그 출력은 그대로 유지)
+    log_queue = queue.SimpleQueue()
+    handler = CountingHandler()
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    monkeypatch.setattr(logger, "log_listener", listener)
+    monkeypatch.setattr(logger, "_listener_started", True)
+
+    log_queue.put(logging.makeLogRecord({"msg": "종료 직전 로그"}))
+    logger.shutdown_logging()
+    assert [r.getMessage() for r in handler.records] == ["종료 직전 로그"]
+    assert logger._listener_started is False
+
+    # 창 닫기 후 atexit에서 다시 불려도 오류 없이 넘어가야 함
+    logger.shutdown_logging()
+    assert len(handler.records) == 1
+
+def test_shutdown_before_start_does_nothing(monkeypatch):
+    listener = QueueListener(queue.SimpleQueue())
+    monkeypatch.setattr(logger, "log_listener", listener)
+    monkeypatch.setattr(logger, "_listener_started", False)
+    logger.shutdown_logging()   # 시작하지 않은 리스너의 stop()을 부르면 예외가 남
@@ -0,0 +1,32 @@
+from src.view.navigation_index import NavigationIndex
+
+def test_disabled_column_is_skipped_in_all_directions():
+    index = NavigationIndex(4, 5)
+    index.set_column_focusable(3, False)
+    assert index.next_cell(0, 2, 0, 1) == (0, 4)     # 오른쪽: B열을 건너뜀
+    assert index.next_cell(0, 4, 0, -1) == (0, 2)    # 왼쪽
+    assert index.next_cell(1, 3, 1, 0) is None       # 꺼진 열 안에서는 위/아래 이동 대상 없음
+    assert not index.is_focusable(2, 3)
+    index.set_column_focusable(3, True)
+    assert index.next_cell(0, 2, 0, 1) == (0, 3)
+    assert index.next_cell(3, 3, 1, 0) == (0, 3)     # 순환
+
+def test_added_rows_inherit_disabled_column():
+    index = NavigationIndex(2, 5)
+    index.set_column_focusable(3, False)
+    index.resize(6)
+    assert not index.is_focusable(5, 3)
+    assert index.next_cell(5, 2, 0, 1) == (5, 4)
+    index.resize(3)
+    index.set_column_focusable(3, True)
+    assert index.next_cell(2, 3, 1, 0) == (0, 3)
+    assert index.is_focusable(2, 3)
+
+def test_single_cell_and_column_changes_combine():
+    index = NavigationIndex(3, 5)
+    index.set_focusable(1, 0, False)
+    index.set_column_focusable(3, False)
+    assert index.next_cell(1, 4, 0, 1) == (1, 1)     # 0열(개별)과 3열(열 전체)을 건너뜀
+    index.set_column_focusable(3, True)
+    assert not index.is_focusable(1, 0)              # 열을 다시 켜도 다른 열의 개별 설정은 유지
+    assert index.next_cell(0, 0, 1, 0) == (2, 0)
@@ -0,0 +1,45 @@
+from src.model.line_data import LineDataModel
+from src.model.rail_journal import JOURNAL_FILE, RailJournal
+
+def _crash(journal, torn):
+    # 비정상 종료 재현: 스냅샷 없이 파일만 닫고, 쓰다 만 레코드를 남긴다
+    journal.model.unsubscribe(journal.on_model_changed)
+    journal._file.write(torn)
+    journal._file.close()
+
+def _session(directory):
+    model = LineDataModel(3)
+    journal = RailJournal(model, str(directory))
+    journal.recover()
+    journal.attach()
+    return model, journal
+
+def test_recover_across_two_crashed_sessions(tmp_path):
+    model, journal = _session(tmp_path)
+    model.update_line_data(0, "comment", "session1")
+    _crash(journal, '[2,1,"comm')
+
+    model, journal = _session(tmp_path)
+    assert model.get_line_data(0)["comment"] == "session1"
+    model.update_line_data(1, "comment", "session2")
+    model.update_line_data(2, "comment", "session2")
+    _crash(journal, '[9,0,"comment","los')
+
+    model, journal = _session(tmp_path)
+    assert [model.get_line_data(i)["comment"] for i in range(3)] == ["session1", "session2", "session2"]
+    journal.close()
+
+def test_record_without_newline_is_kept(tmp_path):
+    model, journal = _session(tmp_path)
+    model.update_line_data(0, "comment", "a")
+    _crash(journal, "")
+    path = tmp_path / JOURNAL_FILE
+    path.write_bytes(path.read_bytes().rstrip(b"\n"))
+
+    model, journal = _session(tmp_path)
+    model.update_line_data(1, "comment", "b")
+    _crash(journal, "")
+
+    model, journal = _session(tmp_path)
+    assert [model.get_line_data(i)["comment"] for i in range(2)] == ["a", "b"]
+    journal.close()
@@ -0,0 +1,32 @@
+from fake_view import FakeView
+from src.controller.app_controller import AppController
+
+def _controller(tmp_path):
+    controller = AppController(FakeView(str(tmp_path)))
+    fired, armed = [], []
+    controller.fire_line = fired.append
+    controller.loop_thread.call = lambda callback, *args: armed.append(args)
+    return controller, fired, armed
+
+def test_invalid_time_is_not_fired(tmp_path):
+    controller, fired, armed = _controller(tmp_path)
+    model = controller.app_view.line_data_model
+    model.update_line_data(0, "time", "12:3x")
+    model.update_line_data(1, "time", "")
+    assert controller.schedule_line(0) is False
+    assert controller.schedule_line(1) is False
+    assert fired == [] and armed == []
+    assert len(controller.app_view.errors) == 2 and "1번 레일" in controller.app_view.errors[0]
+    controller.settings_persister.close()
+
+def test_zero_time_fires_and_later_time_is_armed(tmp_path):
+    controller, fired, armed = _controller(tmp_path)
+    model = controller.app_view.line_data_model
+    model.update_line_data(0, "time", "00:00:00")
+    model.update_line_data(1, "time", "00:00:10")
+    controller.schedule_line(0)
+    controller.schedule_line(1)
+    assert fired == [0]
+    assert armed == [(1, 10.0)]
+    assert controller.app_view.errors == []
+    controller.settings_persister.close()
@@ -0,0 +1,37 @@
+import os
+
+import pytest
+
+from src.model import settings
+from src.model.settings import BACKUP_SUFFIX, load_settings, save_settings, write_atomic
+
+def test_target_exists_if_final_replace_fails(tmp_path, monkeypatch):
+    path = str(tmp_path / "settings.json")
+    save_settings({"a": 1}, path)
+    save_settings({"a": 2}, path)
+
+    real_replace = os.replace
+
+    def crash_on_swap(src, dst):
+        # 임시 파일을 다 쓴 뒤 마지막 교체 직전에 종료된 상황 재현
+        if src.endswith(".tmp"):
+            raise OSError("교체 직전 종료")
+        real_replace(src, dst)
+    monkeypatch.setattr(settings.os, "replace", crash_on_swap)
+    with pytest.raises(OSError):
+        write_atomic(path, b'{"a":3}')
+    monkeypatch.undo()
+    # 기존 파일은 그대로 남아 있어야 함 (백업이 없어도 읽을 수 있도록)
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == '{"a":2}'
+    assert load_settings(path) == {"a": 2}
+
+def test_backup_keeps_previous_version(tmp_path):
+    path = str(tmp_path / "settings.json")
+    save_settings({"a": 1}, path)
+    save_settings({"a": 2}, path)
+    assert load_settings(path) == {"a": 2}
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{broken")
+    assert load_settings(path) == {"a": 1}
+    assert os.path.exists(path + ".corrupt")
@@ -0,0 +1,33 @@
+from src.utils.timecode import (
+    NO_FRAMES, compare_timecodes, format_column, format_timecode, frames_per_day, milliseconds_to_frames,
+    parse_column, parse_timecode, timecode_diff,
+)
+
+def test_milliseconds_to_frames_returns_int():
+    assert milliseconds_to_frames(1000) == 30
+    assert type(milliseconds_to_frames(1000)) is int
+    # 29.97fps: 1초 = 29.97프레임 -> 29
+    assert milliseconds_to_frames(1000, 30, True) == 29
+    assert type(milliseconds_to_frames(1000, 30, True)) is int
+    assert milliseconds_to_frames("2500", 60, True) == 149
+
+def test_drop_frame_round_trip():
+    for text in ("00:00:59;29", "00:01:00;02", "00:09:59;29", "00:10:00;00", "23:59:59;29"):
+        frames = parse_timecode(text, 30, True)
+        assert format_timecode(frames, 30, True, True) == text
+    # 10분 단위가 아닌 매 분의 ;00, ;01은 존재하지 않는 번호
+    assert parse_timecode("00:01:00;00", 30, True) is None
+    assert parse_timecode("00:01:00;02", 30, True) == parse_timecode("00:00:59;29", 30, True) + 1
+
+def test_column_helpers():
+    column = parse_column(["00:00:01", "bad", "00:00:02:15"])
+    assert list(column) == [30, NO_FRAMES, 75]
+    assert format_column(column) == ["00:00:01", "", "00:00:02:15"]
+
+def test_compare_and_diff():
+    assert [compare_timecodes(1, 2), compare_timecodes(2, 2), compare_timecodes(3, 2)] == [-1, 0, 1]
+    assert timecode_diff(100, 40) == -60
+    day = frames_per_day()
+    assert timecode_diff(day - 30, 30, wrap=True) == 60
+    drop_day = frames_per_day(30, True)
+    assert timecode_diff(drop_day - 30, 30, 30, True, wrap=True) == 60
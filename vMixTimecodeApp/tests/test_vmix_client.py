@@ -0,0 +1,35 @@
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from src.controller.vmix_client import VmixClient
+
+def test_requests_without_timeout_use_session_default():
+    async def main():
+        accepted = []
+
+        async def handle(reader, writer):
+            # 연결은 받지만 응답하지 않는 vMix
+            accepted.append(writer)
+            await asyncio.sleep(3600)
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        client = VmixClient(timeout=0.3, port=server.sockets[0].getsockname()[1])
+        try:
+            for call in (lambda: client.send_function("127.0.0.1", "Cut"),
+                         lambda: client.fetch_snapshot("127.0.0.1")):
+                started = time.monotonic()
+                # 바깥 2초 제한은 테스트가 멈추지 않게 하는 안전장치. 세션 기본값(0.3초)에서 먼저 끝나야 함
+                with pytest.raises(asyncio.TimeoutError):
+                    await asyncio.wait_for(call(), 2)
+                assert time.monotonic() - started < 1.5
+        finally:
+            await client.close()
+            for writer in accepted:
+                writer.close()
+            server.close()
+
+    asyncio.run(main())